@@ -0,0 +1,95 @@
+"""Hash-partition the artifacts table by inventory_id
+
+Revision ID: 4f9a7c2e8b15
+Revises: 8d3f2c6b1a07
+Create Date: 2026-10-19 14:05:12.218640
+
+Rebuilds ``artifacts`` as a table partitioned by ``HASH (inventory_id)``.
+The primary key, the ``ON CONFLICT (inventory_id)`` upserts and every query
+in the repository keep working unchanged: a point lookup is pruned to one
+partition and vacuum/autovacuum run per partition.
+
+The rows are copied in a single transaction that holds an exclusive lock on
+the table, so run this in a maintenance window on large collections.
+The primary key and the indexes are built after the copy, so the rows are
+not indexed one by one (non-concurrently, which is the only option on a
+partitioned table).
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f9a7c2e8b15"
+down_revision: str | None = "8d3f2c6b1a07"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+PARTITIONS = 16
+
+
+def _create_indexes() -> None:
+    op.create_index("ix_artifacts_name", "artifacts", ["name"])
+    op.create_index("ix_artifacts_department", "artifacts", ["department"])
+    op.create_index(
+        "ix_artifacts_created_at_inventory_id",
+        "artifacts",
+        ["created_at", "inventory_id"],
+    )
+    for column in ("department", "era", "material"):
+        op.create_index(
+            f"ix_artifacts_{column}_created_at",
+            "artifacts",
+            [column, "created_at", "inventory_id"],
+        )
+    op.create_index(
+        "ix_artifacts_name_trgm",
+        "artifacts",
+        ["name"],
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    # Must match description_tsvector() in the model module exactly
+    op.create_index(
+        "ix_artifacts_description_fts",
+        "artifacts",
+        [sa.text("to_tsvector('simple'::regconfig, coalesce(description, ''))")],
+        postgresql_using="gin",
+    )
+
+
+def _swap_table(old: str, partition_by: str | None) -> None:
+    # Index names are schema-wide, so the old pkey has to move out of the way
+    # before the new table can claim artifacts_pkey.
+    op.rename_table("artifacts", old)
+    op.execute(f"ALTER INDEX artifacts_pkey RENAME TO {old}_pkey")
+
+    suffix = f" PARTITION BY {partition_by}" if partition_by else ""
+    op.execute(f"CREATE TABLE artifacts (LIKE {old} INCLUDING DEFAULTS){suffix}")
+    if partition_by:
+        for remainder in range(PARTITIONS):
+            op.execute(
+                f"CREATE TABLE artifacts_p{remainder:02d} PARTITION OF artifacts "
+                f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+            )
+
+    op.execute(f"INSERT INTO artifacts SELECT * FROM {old}")  # noqa: S608
+    # No CASCADE: anything still depending on the old table should stop the
+    # migration rather than be dropped with it
+    op.execute(f"DROP TABLE {old}")
+    op.create_primary_key("artifacts_pkey", "artifacts", ["inventory_id"])
+    _create_indexes()
+    op.execute("ANALYZE artifacts")
+
+
+def upgrade() -> None:
+    _swap_table("artifacts_unpartitioned", "HASH (inventory_id)")
+
+
+def downgrade() -> None:
+    # Dropping the partitioned parent drops its partitions as well
+    _swap_table("artifacts_partitioned", None)
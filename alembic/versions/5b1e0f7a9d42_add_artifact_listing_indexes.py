@@ -0,0 +1,49 @@
+"""Add composite indexes for keyset-paginated artifact listing
+
+Revision ID: 5b1e0f7a9d42
+Revises: c3cca8a62218
+Create Date: 2026-10-19 09:12:04.118530
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b1e0f7a9d42"
+down_revision: str | None = "c3cca8a62218"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Unfiltered listing walks (created_at, inventory_id) directly
+    op.create_index(
+        "ix_artifacts_created_at_inventory_id",
+        "artifacts",
+        ["created_at", "inventory_id"],
+    )
+    # Equality filter + keyset order for each filterable column
+    op.create_index(
+        "ix_artifacts_department_created_at",
+        "artifacts",
+        ["department", "created_at", "inventory_id"],
+    )
+    op.create_index(
+        "ix_artifacts_era_created_at",
+        "artifacts",
+        ["era", "created_at", "inventory_id"],
+    )
+    op.create_index(
+        "ix_artifacts_material_created_at",
+        "artifacts",
+        ["material", "created_at", "inventory_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifacts_material_created_at", table_name="artifacts")
+    op.drop_index("ix_artifacts_era_created_at", table_name="artifacts")
+    op.drop_index("ix_artifacts_department_created_at", table_name="artifacts")
+    op.drop_index("ix_artifacts_created_at_inventory_id", table_name="artifacts")
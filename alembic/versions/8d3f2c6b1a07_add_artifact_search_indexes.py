@@ -0,0 +1,57 @@
+"""Add trigram and full-text search indexes on artifacts
+
+Revision ID: 8d3f2c6b1a07
+Revises: 5b1e0f7a9d42
+Create Date: 2026-10-19 11:40:27.503112
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d3f2c6b1a07"
+down_revision: str | None = "5b1e0f7a9d42"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Normally created by scripts/init-db.sql, but not on managed databases
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # GIN builds are slow on large tables; build without blocking writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_artifacts_name_trgm",
+            "artifacts",
+            ["name"],
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        # Must match description_tsvector() in the model module exactly
+        op.create_index(
+            "ix_artifacts_description_fts",
+            "artifacts",
+            [sa.text("to_tsvector('simple'::regconfig, coalesce(description, ''))")],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_artifacts_description_fts",
+            table_name="artifacts",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_artifacts_name_trgm",
+            table_name="artifacts",
+            postgresql_concurrently=True,
+        )
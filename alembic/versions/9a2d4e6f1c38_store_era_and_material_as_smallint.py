@@ -0,0 +1,83 @@
+"""Store era and material as smallint codes
+
+Revision ID: 9a2d4e6f1c38
+Revises: 4f9a7c2e8b15
+Create Date: 2026-10-19 15:22:48.904117
+
+Both columns are rewritten in a single ALTER TABLE, which rewrites the table
+and rebuilds its indexes once under an exclusive lock.
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a2d4e6f1c38"
+down_revision: str | None = "4f9a7c2e8b15"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match ERA_CODES / MATERIAL_CODES in the model module
+ERA_CODES = {
+    "paleolithic": 1,
+    "neolithic": 2,
+    "bronze_age": 3,
+    "iron_age": 4,
+    "antiquity": 5,
+    "middle_ages": 6,
+    "modern": 7,
+}
+MATERIAL_CODES = {
+    "ceramic": 1,
+    "metal": 2,
+    "stone": 3,
+    "glass": 4,
+    "bone": 5,
+    "wood": 6,
+    "textile": 7,
+    "other": 8,
+}
+
+
+def _case(column: str, mapping: dict[str, int], *, to_code: bool) -> str:
+    # Unknown values fall through to NULL and fail the NOT NULL constraint
+    # instead of being silently mapped.
+    if to_code:
+        whens = (f"WHEN '{value}' THEN {code}" for value, code in mapping.items())
+    else:
+        whens = (f"WHEN {code} THEN '{value}'" for value, code in mapping.items())
+    return f"CASE {column} {' '.join(whens)} END"
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE artifacts "
+        "ALTER COLUMN era TYPE smallint "
+        f"USING {_case('era', ERA_CODES, to_code=True)}, "
+        "ALTER COLUMN material TYPE smallint "
+        f"USING {_case('material', MATERIAL_CODES, to_code=True)}"
+    )
+    op.create_check_constraint(
+        "ck_artifacts_era_code", "artifacts", f"era BETWEEN 1 AND {len(ERA_CODES)}"
+    )
+    op.create_check_constraint(
+        "ck_artifacts_material_code",
+        "artifacts",
+        f"material BETWEEN 1 AND {len(MATERIAL_CODES)}",
+    )
+    op.execute("ANALYZE artifacts")
+
+
+def downgrade() -> None:
+    op.drop_constraint("ck_artifacts_material_code", "artifacts", type_="check")
+    op.drop_constraint("ck_artifacts_era_code", "artifacts", type_="check")
+    op.execute(
+        "ALTER TABLE artifacts "
+        "ALTER COLUMN era TYPE varchar(50) "
+        f"USING {_case('era', ERA_CODES, to_code=False)}, "
+        "ALTER COLUMN material TYPE varchar(50) "
+        f"USING {_case('material', MATERIAL_CODES, to_code=False)}"
+    )
+    op.execute("ANALYZE artifacts")
@@ -0,0 +1,72 @@
+"""Add artifact_stats summary table
+
+Revision ID: b7e1c5d3a920
+Revises: 9a2d4e6f1c38
+Create Date: 2026-10-19 16:48:03.611254
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e1c5d3a920"
+down_revision: str | None = "9a2d4e6f1c38"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match ERA_CODES / MATERIAL_CODES in the model module
+ERA_CODES = {
+    "paleolithic": 1,
+    "neolithic": 2,
+    "bronze_age": 3,
+    "iron_age": 4,
+    "antiquity": 5,
+    "middle_ages": 6,
+    "modern": 7,
+}
+MATERIAL_CODES = {
+    "ceramic": 1,
+    "metal": 2,
+    "stone": 3,
+    "glass": 4,
+    "bone": 5,
+    "wood": 6,
+    "textile": 7,
+    "other": 8,
+}
+
+
+def _decode(column: str, mapping: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{value}'" for value, code in mapping.items())
+    return f"CASE {column} {whens} END"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "artifact_stats",
+        sa.Column("dimension", sa.String(length=32), nullable=False),
+        sa.Column("bucket", sa.String(length=255), nullable=False),
+        sa.Column("artifact_count", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("dimension", "bucket"),
+    )
+    # Backfill once; from here on every write path keeps the counts current.
+    # Years are taken in UTC, like the application does.
+    op.execute(
+        "INSERT INTO artifact_stats (dimension, bucket, artifact_count) "  # noqa: S608
+        "SELECT dimension, bucket, count(*) FROM artifacts, LATERAL (VALUES "
+        "('department', department), "
+        f"('era', {_decode('era', ERA_CODES)}), "
+        f"('material', {_decode('material', MATERIAL_CODES)}), "
+        "('acquisition_year', "
+        "extract(year FROM acquisition_date AT TIME ZONE 'UTC')::int::text)"
+        ") AS buckets (dimension, bucket) "
+        "GROUP BY dimension, bucket"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("artifact_stats")
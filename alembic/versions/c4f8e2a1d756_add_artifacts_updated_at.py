@@ -0,0 +1,47 @@
+"""Add artifacts.updated_at for the change feed
+
+Revision ID: c4f8e2a1d756
+Revises: b7e1c5d3a920
+Create Date: 2026-10-19 18:12:37.045981
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4f8e2a1d756"
+down_revision: str | None = "b7e1c5d3a920"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # A constant default is stored in the catalog, so this does not rewrite
+    # the table. Existing rows all get the migration time, which makes them
+    # part of every consumer's first sync.
+    op.add_column(
+        "artifacts",
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.text("now()"),
+        ),
+    )
+    # btree rather than BRIN: updates move rows out of physical order, and
+    # the feed needs ordered (updated_at, inventory_id) keyset scans.
+    # Not CONCURRENTLY: unsupported on the partitioned artifacts table.
+    op.create_index(
+        "ix_artifacts_updated_at_inventory_id",
+        "artifacts",
+        ["updated_at", "inventory_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_artifacts_updated_at_inventory_id", table_name="artifacts")
+    op.drop_column("artifacts", "updated_at")
@@ -0,0 +1,36 @@
+"""Add artifact_museum_validators for conditional refreshes
+
+Revision ID: d2a6f9c4e813
+Revises: c4f8e2a1d756
+Create Date: 2026-10-19 21:04:52.318604
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a6f9c4e813"
+down_revision: str | None = "c4f8e2a1d756"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # No backfill: an artifact without validators is fetched in full on its
+    # first refresh, which stores them.
+    op.create_table(
+        "artifact_museum_validators",
+        sa.Column("inventory_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("etag", sa.Text(), nullable=True),
+        sa.Column("last_modified", sa.String(length=64), nullable=True),
+        sa.PrimaryKeyConstraint("inventory_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("artifact_museum_validators")
@@ -0,0 +1,35 @@
+"""Add artifact_catalog_publications to skip unchanged republishing
+
+Revision ID: e8b3c7d1f925
+Revises: d2a6f9c4e813
+Create Date: 2026-10-19 23:37:15.902147
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8b3c7d1f925"
+down_revision: str | None = "d2a6f9c4e813"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # No backfill: each artifact is published once more, which records it.
+    op.create_table(
+        "artifact_catalog_publications",
+        sa.Column("inventory_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("public_id", sa.String(length=255), nullable=False),
+        sa.PrimaryKeyConstraint("inventory_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("artifact_catalog_publications")
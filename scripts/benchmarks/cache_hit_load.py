@@ -0,0 +1,64 @@
+r"""Load-test cache-hit traffic and report database pool checkouts per request.
+
+Warms the cache with one request for INVENTORY_ID, then fires --requests
+concurrent GETs at a running service and reads the pool checkout metrics
+before and after. Cache hits should add zero checkouts.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/benchmarks/cache_hit_load.py \\
+        --base-url http://localhost:8001 <inventory_id>
+"""
+
+import argparse
+import asyncio
+import re
+import time
+
+import httpx
+
+CHECKOUTS_TOTAL = re.compile(r'^db_pool_checkouts_total\{role="(\w+)"\} (\S+)$', re.M)
+
+
+async def checkouts(client: httpx.AsyncClient) -> float:
+    response = await client.get("/api/v1/metrics")
+    response.raise_for_status()
+    return sum(float(v) for _, v in CHECKOUTS_TOTAL.findall(response.text))
+
+
+async def main(
+    base_url: str, inventory_id: str, requests: int, concurrency: int
+) -> None:
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits) as client:
+        (await client.get(f"/api/v1/artifacts/{inventory_id}")).raise_for_status()
+        before = await checkouts(client)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def hit() -> None:
+            async with semaphore:
+                response = await client.get(f"/api/v1/artifacts/{inventory_id}")
+                response.raise_for_status()
+
+        started = time.perf_counter()
+        await asyncio.gather(*(hit() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+        added = await checkouts(client) - before
+
+    print(
+        f"{requests} cache-hit requests in {elapsed:.2f}s ({requests / elapsed:.0f} rps)"
+    )
+    print(
+        f"pool checkouts during run: {added:.0f} ({added / requests:.3f} per request)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inventory_id")
+    parser.add_argument("--base-url", default="http://localhost:8001")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.base_url, args.inventory_id, args.requests, args.concurrency))
@@ -0,0 +1,114 @@
+"""Compare read latency with pool_pre_ping and with background idle checks.
+
+Each lookup uses a fresh session, as a request would, so every read pays
+one pool checkout. With ``pre_ping`` that checkout costs an extra round
+trip; with ``background`` the pool is validated by IdleConnectionChecker
+and the repository retries once on disconnect instead.
+
+Defaults to a temporary SQLite file, where a ping is nearly free; pass
+--url for a real Postgres, where the difference is one network round trip.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/benchmarks/liveness_bench.py --url <dsn>
+"""
+
+import argparse
+import asyncio
+from datetime import UTC, datetime
+import statistics
+import tempfile
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.schema import CreateTable
+
+from src.infrastructures.db.liveness import IdleConnectionChecker
+from src.infrastructures.db.models.artifact import artifact_table
+from src.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+from src.infrastructures.db.session import create_engine
+from src.infrastructures.metrics import MetricsRegistry
+
+
+async def time_reads(
+    engine: AsyncEngine, ids: list[UUID], *, retry: bool
+) -> list[float]:
+    latencies = []
+    for inventory_id in ids:
+        started = time.perf_counter()
+        async with AsyncSession(engine) as session:
+            repository = ArtifactRepositorySQLAlchemy(
+                session=session, retry_reads_on_disconnect=retry
+            )
+            await repository.get_by_inventory_id(inventory_id)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def report(label: str, latencies: list[float]) -> None:
+    quantiles = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<14}p50 {quantiles[49] * 1e6:>8.1f} us"
+        f"   p99 {quantiles[98] * 1e6:>8.1f} us"
+        f"   mean {statistics.fmean(latencies) * 1e6:>8.1f} us"
+    )
+
+
+async def main(url: str, reads: int) -> None:
+    ids = [uuid4() for _ in range(reads)]
+    setup = create_engine(url, is_echo=False)
+    async with setup.begin() as conn:
+        if url.startswith("sqlite"):
+            await conn.execute(CreateTable(artifact_table))
+        await conn.execute(
+            insert(artifact_table),
+            [
+                {
+                    "inventory_id": inventory_id,
+                    "created_at": datetime.now(UTC),
+                    "acquisition_date": datetime(2020, 1, 1, tzinfo=UTC),
+                    "name": f"Artifact {i}",
+                    "department": "Archaeology",
+                    "era": "antiquity",
+                    "material": "ceramic",
+                    "description": "Synthetic row for liveness benchmark",
+                }
+                for i, inventory_id in enumerate(ids)
+            ],
+        )
+
+    try:
+        pre_ping = create_engine(url, is_echo=False, pool_pre_ping=True)
+        await time_reads(pre_ping, ids[:100], retry=False)  # warm up
+        report("pre_ping", await time_reads(pre_ping, ids, retry=False))
+        await pre_ping.dispose()
+
+        background = create_engine(url, is_echo=False, pool_pre_ping=False)
+        checker = IdleConnectionChecker(
+            engines={"primary": background}, metrics=MetricsRegistry(), interval=1.0
+        )
+        checker.start()
+        await time_reads(background, ids[:100], retry=True)
+        report("background", await time_reads(background, ids, retry=True))
+        await checker.close()
+        await background.dispose()
+    finally:
+        if not url.startswith("sqlite"):
+            async with setup.begin() as conn:
+                await conn.execute(
+                    artifact_table.delete().where(
+                        artifact_table.c.inventory_id.in_(ids)
+                    )
+                )
+        await setup.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url")
+    parser.add_argument("--reads", type=int, default=5000)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite+aiosqlite:///{tmp}/liveness_bench.db"
+        asyncio.run(main(url, args.reads))
@@ -0,0 +1,78 @@
+"""Compare per-response cost of parsing museum API payloads into ArtifactDTO.
+
+The dict path is the original ``response.json()`` -> field-by-field
+``ArtifactDTO(...)`` -> ``json.dumps(model_dump(mode="json"))`` for the cache
+write; the bytes path is ``ArtifactDTO.model_validate_json(raw)`` ->
+``model_dump_json()``. Payloads carry extra upstream fields, as the real API
+does, so the bytes path also pays for skipping them.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/benchmarks/museum_parse_bench.py
+"""
+
+import argparse
+import json
+import time
+from typing import Any
+from uuid import uuid4
+
+from src.application.dtos.artifact import ArtifactDTO
+
+
+def payload(extra_fields: int) -> bytes:
+    body: dict[str, Any] = {
+        "inventory_id": str(uuid4()),
+        "name": "Ancient Vase",
+        "era": {"value": "antiquity"},
+        "material": {"value": "ceramic"},
+        "description": "Synthetic payload for the museum parse benchmark " * 4,
+        "acquisition_date": "2020-01-01T00:00:00Z",
+        "department": "Archaeology",
+    }
+    for i in range(extra_fields):
+        body[f"upstream_field_{i}"] = {"note": f"value {i}", "tags": ["a", "b"]}
+    return json.dumps(body).encode()
+
+
+def via_dict(raw: bytes) -> str:
+    data = json.loads(raw)
+    artifact = ArtifactDTO(
+        inventory_id=data["inventory_id"],
+        name=data["name"],
+        era=data["era"],
+        material=data["material"],
+        description=data["description"],
+        acquisition_date=data["acquisition_date"],
+        department=data["department"],
+    )
+    return json.dumps(artifact.model_dump(mode="json"), default=str)
+
+
+def via_bytes(raw: bytes) -> str:
+    artifact = ArtifactDTO.model_validate_json(raw, extra="ignore")
+    return artifact.model_dump_json()
+
+
+def report(label: str, seconds: float, responses: int) -> None:
+    print(f"{label:<28}{seconds * 1e6 / responses:>10.1f} us/response")
+
+
+def main(responses: int, extra_fields: int) -> None:
+    bodies = [payload(extra_fields) for _ in range(responses)]
+    for label, parse in (
+        ("dict, json.loads", via_dict),
+        ("bytes, pydantic", via_bytes),
+    ):
+        parse(bodies[0])
+        started = time.perf_counter()
+        for raw in bodies:
+            parse(raw)
+        report(label, time.perf_counter() - started, responses)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--responses", type=int, default=20000)
+    parser.add_argument("--extra-fields", type=int, default=10)
+    args = parser.parse_args()
+    main(args.responses, args.extra_fields)
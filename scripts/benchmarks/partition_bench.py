@@ -0,0 +1,190 @@
+"""Compare a plain and a hash-partitioned artifacts table.
+
+Builds both layouts side by side in a throwaway ``bench`` schema with the same
+synthetic rows, then times primary-key lookups, single-row inserts and a
+VACUUM after a fraction of the rows has been updated. For the partitioned
+table the slowest single partition is reported next to the total, since that
+is what one autovacuum run has to get through.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/benchmarks/partition_bench.py --rows 5000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+
+from src.config.base import Settings
+
+PARTITIONS = 16
+
+COLUMNS = """
+    inventory_id uuid PRIMARY KEY,
+    created_at timestamptz NOT NULL DEFAULT now(),
+    acquisition_date timestamptz NOT NULL,
+    name varchar(255) NOT NULL,
+    department varchar(255) NOT NULL,
+    era smallint NOT NULL,
+    material smallint NOT NULL,
+    description text
+"""
+
+FILL_SQL = """
+INSERT INTO bench.plain
+SELECT
+    gen_random_uuid(),
+    now() - (g || ' seconds')::interval,
+    now() - ((g % 20000) || ' days')::interval,
+    'Artifact #' || g,
+    (ARRAY['Archaeology','Numismatics','Arms','Icons'])[1 + g % 4],
+    1 + g % 7,  -- era code
+    1 + g % 8,  -- material code
+    'Synthetic artifact ' || g
+FROM generate_series(1, :rows) AS g
+"""
+
+TABLES = ("plain", "partitioned")
+
+
+async def prepare(conn: AsyncConnection, rows: int) -> None:
+    await conn.execute(text("DROP SCHEMA IF EXISTS bench CASCADE"))
+    await conn.execute(text("CREATE SCHEMA bench"))
+    await conn.execute(text(f"CREATE TABLE bench.plain ({COLUMNS})"))
+    await conn.execute(
+        text(
+            f"CREATE TABLE bench.partitioned ({COLUMNS}) "
+            "PARTITION BY HASH (inventory_id)"
+        )
+    )
+    for remainder in range(PARTITIONS):
+        await conn.execute(
+            text(
+                f"CREATE TABLE bench.partitioned_p{remainder:02d} "
+                "PARTITION OF bench.partitioned "
+                f"FOR VALUES WITH (MODULUS {PARTITIONS}, REMAINDER {remainder})"
+            )
+        )
+    started = time.perf_counter()
+    await conn.execute(text(FILL_SQL), {"rows": rows})
+    # Same keys in both tables so the lookups hit the same rows
+    await conn.execute(text("INSERT INTO bench.partitioned SELECT * FROM bench.plain"))
+    for table in TABLES:
+        await conn.execute(
+            text(f"CREATE INDEX ON bench.{table} (created_at, inventory_id)")
+        )
+        await conn.execute(text(f"VACUUM ANALYZE bench.{table}"))
+    print(f"loaded {rows} rows in {time.perf_counter() - started:.1f}s")
+
+
+async def time_lookups(
+    conn: AsyncConnection, table: str, ids: list[UUID]
+) -> list[float]:
+    stmt = text(f"SELECT * FROM bench.{table} WHERE inventory_id = :id")  # noqa: S608
+    samples = []
+    for inventory_id in ids:
+        started = time.perf_counter()
+        (await conn.execute(stmt, {"id": inventory_id})).one()
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+async def time_inserts(conn: AsyncConnection, table: str, count: int) -> list[float]:
+    stmt = text(
+        f"INSERT INTO bench.{table} "  # noqa: S608
+        "(inventory_id, acquisition_date, name, department, era, material) "
+        "VALUES (:id, now(), 'Bench insert', 'Archaeology', 7, 2)"
+    )
+    samples = []
+    for _ in range(count):
+        started = time.perf_counter()
+        await conn.execute(stmt, {"id": uuid4()})
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    return samples
+
+
+async def time_vacuum(
+    conn: AsyncConnection, table: str, update_fraction: float
+) -> tuple[float, float]:
+    """Dirty a fraction of the rows, then return (total, slowest unit) seconds."""
+    await conn.execute(
+        text(
+            f"UPDATE bench.{table} SET description = description || '.' "  # noqa: S608
+            "WHERE random() < :fraction"
+        ),
+        {"fraction": update_fraction},
+    )
+    if table == "plain":
+        units = ["bench.plain"]
+    else:
+        units = [f"bench.partitioned_p{i:02d}" for i in range(PARTITIONS)]
+    durations = []
+    for unit in units:
+        started = time.perf_counter()
+        await conn.execute(text(f"VACUUM {unit}"))
+        durations.append(time.perf_counter() - started)
+    return sum(durations), max(durations)
+
+
+def percentile(samples: list[float], q: int) -> float:
+    return statistics.quantiles(samples, n=100)[q - 1]
+
+
+async def main(rows: int, samples: int, update_fraction: float, keep: bool) -> None:
+    settings = Settings()  # type: ignore[call-arg]
+    engine = create_async_engine(
+        str(settings.database_url), isolation_level="AUTOCOMMIT"
+    )
+    try:
+        async with engine.connect() as conn:
+            await prepare(conn, rows)
+            ids = list(
+                (
+                    await conn.execute(
+                        text(
+                            "SELECT inventory_id FROM bench.plain "
+                            "ORDER BY random() LIMIT :n"
+                        ),
+                        {"n": samples},
+                    )
+                ).scalars()
+            )
+
+            print(
+                f"{'table':<13}{'lookup p50 us':>15}{'lookup p99 us':>15}"
+                f"{'insert p50 us':>15}{'vacuum s':>10}{'max part s':>12}"
+            )
+            for table in TABLES:
+                lookups = await time_lookups(conn, table, ids)
+                inserts = await time_inserts(conn, table, samples)
+                total, slowest = await time_vacuum(conn, table, update_fraction)
+                print(
+                    f"{table:<13}{percentile(lookups, 50):>15.0f}"
+                    f"{percentile(lookups, 99):>15.0f}"
+                    f"{percentile(inserts, 50):>15.0f}"
+                    f"{total:>10.2f}{slowest:>12.2f}"
+                )
+    finally:
+        if not keep:
+            async with engine.connect() as conn:
+                await conn.execute(text("DROP SCHEMA IF EXISTS bench CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--samples", type=int, default=2000)
+    parser.add_argument(
+        "--update-fraction",
+        type=float,
+        default=0.1,
+        help="share of rows updated before timing VACUUM",
+    )
+    parser.add_argument("--keep", action="store_true", help="keep the bench schema")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.samples, args.update_fraction, args.keep))
@@ -0,0 +1,108 @@
+"""Compare ORM and Core per-row cost of artifact reads.
+
+The ORM path is the original ``select(ArtifactModel) -> to_dataclass()``;
+the Core path is ``ArtifactRepositorySQLAlchemy.get_by_inventory_id(s)``.
+Defaults to in-memory SQLite, which isolates the Python-side cost that
+differs between the two; pass --url to include a real Postgres round trip.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/benchmarks/read_path_bench.py
+"""
+
+import argparse
+import asyncio
+from datetime import UTC, datetime
+import time
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.schema import CreateTable
+
+from src.domain.entities.artifact import ArtifactEntity
+from src.infrastructures.db.models.artifact import ArtifactModel, artifact_table
+from src.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+
+
+async def orm_single(session: AsyncSession, inventory_id: UUID) -> ArtifactEntity:
+    stmt = select(ArtifactModel).where(ArtifactModel.inventory_id == inventory_id)
+    model = (await session.execute(stmt)).scalar_one()
+    return model.to_dataclass()
+
+
+async def orm_batch(session: AsyncSession, ids: list[UUID]) -> list[ArtifactEntity]:
+    stmt = select(ArtifactModel).where(ArtifactModel.inventory_id.in_(ids))
+    return [model.to_dataclass() for model in (await session.execute(stmt)).scalars()]
+
+
+def report(label: str, seconds: float, rows: int) -> None:
+    print(f"{label:<28}{seconds * 1e6 / rows:>10.1f} us/row")
+
+
+async def main(url: str, rows: int, single_reads: int) -> None:
+    engine = create_async_engine(url)
+    ids = [uuid4() for _ in range(rows)]
+    async with engine.begin() as conn:
+        if url.startswith("sqlite"):
+            await conn.execute(CreateTable(artifact_table))
+        await conn.execute(
+            insert(artifact_table),
+            [
+                {
+                    "inventory_id": inventory_id,
+                    "created_at": datetime.now(UTC),
+                    "acquisition_date": datetime(2020, 1, 1, tzinfo=UTC),
+                    "name": f"Artifact {i}",
+                    "department": "Archaeology",
+                    "era": "antiquity",
+                    "material": "ceramic",
+                    "description": "Synthetic row for read path benchmark",
+                }
+                for i, inventory_id in enumerate(ids)
+            ],
+        )
+
+    sample = ids[:single_reads]
+    try:
+        # Fresh session per read mirrors one request-scoped session per lookup
+        started = time.perf_counter()
+        for inventory_id in sample:
+            async with AsyncSession(engine) as session:
+                await orm_single(session, inventory_id)
+        report("single, ORM", time.perf_counter() - started, len(sample))
+
+        started = time.perf_counter()
+        for inventory_id in sample:
+            async with AsyncSession(engine) as session:
+                repository = ArtifactRepositorySQLAlchemy(session=session)
+                await repository.get_by_inventory_id(inventory_id)
+        report("single, Core", time.perf_counter() - started, len(sample))
+
+        async with AsyncSession(engine) as session:
+            started = time.perf_counter()
+            await orm_batch(session, ids)
+            report("batch, ORM", time.perf_counter() - started, rows)
+
+        async with AsyncSession(engine) as session:
+            repository = ArtifactRepositorySQLAlchemy(session=session)
+            started = time.perf_counter()
+            await repository.get_by_inventory_ids(ids)
+            report("batch, Core", time.perf_counter() - started, rows)
+    finally:
+        if not url.startswith("sqlite"):
+            async with engine.begin() as conn:
+                await conn.execute(
+                    artifact_table.delete().where(
+                        artifact_table.c.inventory_id.in_(ids)
+                    )
+                )
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--single-reads", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows, args.single_reads))
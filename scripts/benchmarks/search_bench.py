@@ -0,0 +1,117 @@
+"""Benchmark artifact search on a synthetic collection.
+
+Clones ``public.artifacts`` (including its indexes, so run migrations first)
+into a throwaway ``bench`` schema, fills it with synthetic rows and times
+``ArtifactRepositorySQLAlchemy.search`` with and without index scans.
+
+Usage:
+    PYTHONPATH=. uv run python scripts/benchmarks/search_bench.py --rows 1000000
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.config.base import Settings
+from src.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+
+WORDS = [
+    "amphora",
+    "krater",
+    "fibula",
+    "icon",
+    "sword",
+    "helmet",
+    "coin",
+    "mosaic",
+    "figurine",
+    "lamp",
+    "chalice",
+    "brooch",
+]
+
+FILL_SQL = """
+INSERT INTO bench.artifacts (
+    inventory_id, created_at, acquisition_date, name, department,
+    era, material, description
+)
+SELECT
+    gen_random_uuid(),
+    now() - (g || ' seconds')::interval,
+    now() - ((g % 20000) || ' days')::interval,
+    initcap((ARRAY[{words}])[1 + g % {n}]) || ' #' || g,
+    (ARRAY['Archaeology','Numismatics','Arms','Icons'])[1 + g % 4],
+    1 + g % 7,  -- era code
+    1 + g % 8,  -- material code
+    'Found near ' || (ARRAY[{words}])[1 + (g * 7) % {n}]
+        || ' site together with a ' || (ARRAY[{words}])[1 + (g * 13) % {n}]
+FROM generate_series(1, :rows) AS g
+"""
+
+QUERIES = ["amphora", "amphra", "helmet 4242", "coin site", "chalice #99"]
+
+
+async def prepare(session: AsyncSession, rows: int) -> None:
+    words = ",".join(f"'{w}'" for w in WORDS)
+    await session.execute(text("DROP SCHEMA IF EXISTS bench CASCADE"))
+    await session.execute(text("CREATE SCHEMA bench"))
+    await session.execute(
+        text("CREATE TABLE bench.artifacts (LIKE public.artifacts INCLUDING ALL)")
+    )
+    started = time.perf_counter()
+    await session.execute(
+        text(FILL_SQL.format(words=words, n=len(WORDS))), {"rows": rows}
+    )
+    await session.execute(text("ANALYZE bench.artifacts"))
+    await session.commit()
+    print(f"loaded {rows} rows in {time.perf_counter() - started:.1f}s")
+
+
+async def time_queries(session: AsyncSession, repeats: int) -> dict[str, float]:
+    repository = ArtifactRepositorySQLAlchemy(session=session)
+    medians: dict[str, float] = {}
+    for query in QUERIES:
+        samples = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            await repository.search(query, limit=20)
+            samples.append((time.perf_counter() - started) * 1000)
+        medians[query] = statistics.median(samples)
+    return medians
+
+
+async def main(rows: int, repeats: int, keep: bool) -> None:
+    settings = Settings()  # type: ignore[call-arg]
+    engine = create_async_engine(str(settings.database_url))
+    try:
+        async with AsyncSession(engine) as session:
+            await prepare(session, rows)
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text("SET search_path TO bench, public"))
+            indexed = await time_queries(session, repeats)
+            await session.execute(text("SET enable_bitmapscan TO off"))
+            await session.execute(text("SET enable_indexscan TO off"))
+            seq_scan = await time_queries(session, max(1, repeats // 5))
+
+        print(f"{'query':<16}{'indexed ms':>14}{'seq scan ms':>14}")
+        for query in QUERIES:
+            print(f"{query:<16}{indexed[query]:>14.2f}{seq_scan[query]:>14.2f}")
+    finally:
+        if not keep:
+            async with engine.begin() as conn:
+                await conn.execute(text("DROP SCHEMA IF EXISTS bench CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--keep", action="store_true", help="keep the bench schema")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeats, args.keep))
@@ -4,6 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from src.domain.value_objects.era import Era
+
 
 @final
 class MaterialDTO(BaseModel):
@@ -11,6 +13,7 @@ class MaterialDTO(BaseModel):
         frozen=True,
         extra="forbid",
         str_strip_whitespace=True,
+        from_attributes=True,
     )
     value: Literal[
         "ceramic",
@@ -30,6 +33,7 @@ class EraDTO(BaseModel):
         frozen=True,
         extra="forbid",
         str_strip_whitespace=True,
+        from_attributes=True,
     )
     value: Literal[
         "paleolithic",
@@ -114,3 +118,148 @@ class ArtifactCatalogPublicationDTO(BaseModel):
     era: EraDTO
     material: MaterialDTO
     description: str | None = None
+
+
+@final
+class MuseumValidatorsDTO(BaseModel):
+    """HTTP validators the museum API sent with an artifact's payload."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@final
+class CatalogPublicationRecordDTO(BaseModel):
+    """Last publication of an artifact to the public catalog."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    inventory_id: UUID
+    content_hash: str
+    public_id: str
+
+
+@final
+class ArtifactRefreshPageDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    checked: int
+    updated: int = Field(..., description="Changed upstream, saved and republished")
+    failed: int
+    next_cursor: str | None = Field(
+        None, description="Pass back to resume after the last checked artifact"
+    )
+    has_more: bool
+
+
+@final
+class ArtifactListFilterDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+        str_strip_whitespace=True,
+    )
+    department: str | None = None
+    era: EraDTO | None = None
+    era_from: EraDTO | None = None
+    era_to: EraDTO | None = None
+    material: MaterialDTO | None = None
+    acquired_from: datetime | None = None
+    acquired_to: datetime | None = None
+
+    @model_validator(mode="after")
+    def validate_acquisition_range(self) -> "ArtifactListFilterDTO":
+        if (
+            self.acquired_from is not None
+            and self.acquired_to is not None
+            and self.acquired_from > self.acquired_to
+        ):
+            raise ValueError("acquired_from cannot be later than acquired_to")
+        return self
+
+    @model_validator(mode="after")
+    def validate_era_range(self) -> "ArtifactListFilterDTO":
+        if (
+            self.era_from is not None
+            and self.era_to is not None
+            and Era.chronology.index(self.era_from.value)
+            > Era.chronology.index(self.era_to.value)
+        ):
+            raise ValueError("era_from cannot be later than era_to")
+        return self
+
+
+@final
+class ArtifactPageDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    items: list[ArtifactDTO]
+    next_cursor: str | None = None
+
+
+@final
+class ArtifactChangeDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    artifact: ArtifactDTO
+    updated_at: datetime
+
+
+@final
+class ArtifactChangesPageDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    items: list[ArtifactChangeDTO]
+    next_cursor: str | None = Field(
+        None, description="Pass back to resume after the last returned change"
+    )
+    has_more: bool = Field(
+        ..., description="More changes are ready; request the next page now"
+    )
+
+
+@final
+class ArtifactSearchHitDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    artifact: ArtifactDTO
+    score: float = Field(..., description="Relevance of the hit, higher is better")
+
+
+@final
+class ArtifactSearchPageDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    items: list[ArtifactSearchHitDTO]
+    next_cursor: str | None = None
+
+
+@final
+class ArtifactStatsDTO(BaseModel):
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+    total: int
+    by_department: dict[str, int]
+    by_era: dict[str, int] = Field(..., description="Chronological order")
+    by_material: dict[str, int]
+    by_acquisition_year: dict[int, int]
@@ -0,0 +1,54 @@
+import base64
+from datetime import datetime
+from typing import Self, final
+from uuid import UUID
+
+from pydantic import AwareDatetime, BaseModel, ConfigDict
+
+from src.application.exceptions import InvalidCursorError
+
+
+class OpaqueCursorDTO(BaseModel):
+    """Base for cursors handed to clients as URL-safe base64 JSON tokens."""
+
+    model_config = ConfigDict(
+        frozen=True,
+        extra="forbid",
+    )
+
+    def encode(self) -> str:
+        raw = self.model_dump_json().encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> Self:
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            raw = base64.urlsafe_b64decode(padded.encode("ascii"))
+            return cls.model_validate_json(raw)
+        except ValueError as e:
+            raise InvalidCursorError(f"Malformed pagination cursor: {token!r}") from e
+
+
+@final
+class KeysetCursorDTO(OpaqueCursorDTO):
+    """Position of the last row of a page in (created_at, inventory_id) order."""
+
+    created_at: datetime
+    inventory_id: UUID
+
+
+@final
+class ChangesCursorDTO(OpaqueCursorDTO):
+    """Position in the change feed, in (updated_at, inventory_id) order."""
+
+    updated_at: AwareDatetime
+    inventory_id: UUID
+
+
+@final
+class SearchCursorDTO(OpaqueCursorDTO):
+    """Position of the last hit of a page in (score DESC, inventory_id) order."""
+
+    score: float
+    inventory_id: UUID
@@ -15,3 +15,23 @@ class FailedPublishArtifactMessageBrokerException(Exception): ...
 
 @final
 class FailedPublishArtifactInCatalogException(Exception): ...
+
+
+@final
+class InvalidCursorError(Exception): ...
+
+
+@final
+class InvalidSearchQueryError(Exception): ...
+
+
+@final
+class UpstreamBusyError(Exception): ...
+
+
+@final
+class UpstreamUnavailableError(Exception): ...
+
+
+@final
+class DeadlineExceededError(Exception): ...
@@ -4,8 +4,14 @@ from typing import Any, Protocol
 class CacheProtocol(Protocol):
     async def get(self, key: str) -> Any | None: ...
 
+    async def get_raw(self, key: str) -> bytes | str | None: ...
+
     async def set(self, key: str, value: Any, ttl: int | None = None) -> bool: ...
 
+    async def set_raw(
+        self, key: str, value: bytes | str, ttl: int | None = None
+    ) -> bool: ...
+
     async def delete(self, key: str) -> bool: ...
 
     async def exists(self, key: str) -> bool: ...
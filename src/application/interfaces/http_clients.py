@@ -1,12 +1,20 @@
 from typing import Protocol
 from uuid import UUID
 
-from src.application.dtos.artifact import ArtifactCatalogPublicationDTO, ArtifactDTO
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    ArtifactDTO,
+    MuseumValidatorsDTO,
+)
 
 
 class ExternalMuseumAPIProtocol(Protocol):
     async def fetch_artifact(self, inventory_id: str | UUID) -> ArtifactDTO: ...
 
+    async def fetch_artifact_if_changed(
+        self, inventory_id: str | UUID, validators: MuseumValidatorsDTO | None
+    ) -> tuple[ArtifactDTO, MuseumValidatorsDTO] | None: ...
+
 
 class PublicCatalogAPIProtocol(Protocol):
     async def publish_artifact(
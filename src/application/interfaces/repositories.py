@@ -1,6 +1,18 @@
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime, timedelta
 from typing import Protocol
 from uuid import UUID
 
+from src.application.dtos.artifact import (
+    ArtifactListFilterDTO,
+    CatalogPublicationRecordDTO,
+    MuseumValidatorsDTO,
+)
+from src.application.dtos.pagination import (
+    ChangesCursorDTO,
+    KeysetCursorDTO,
+    SearchCursorDTO,
+)
 from src.domain.entities.artifact import ArtifactEntity
 
 
@@ -9,4 +21,60 @@ class ArtifactRepositoryProtocol(Protocol):
         self, inventory_id: str | UUID
     ) -> ArtifactEntity | None: ...
 
+    async def get_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> list[ArtifactEntity]: ...
+
+    async def list_artifacts(
+        self,
+        filters: ArtifactListFilterDTO,
+        *,
+        after: KeysetCursorDTO | None = None,
+        limit: int,
+    ) -> list[ArtifactEntity]: ...
+
+    def stream_artifacts(
+        self, filters: ArtifactListFilterDTO, *, batch_size: int = 1000
+    ) -> AsyncIterator[ArtifactEntity]: ...
+
+    async def change_feed_horizon(self, settle_window: timedelta) -> datetime: ...
+
+    async def list_changes(
+        self,
+        *,
+        after: ChangesCursorDTO | None = None,
+        until: datetime,
+        limit: int,
+    ) -> list[tuple[ArtifactEntity, datetime]]: ...
+
+    async def search(
+        self,
+        query: str,
+        *,
+        after: SearchCursorDTO | None = None,
+        limit: int,
+    ) -> list[tuple[ArtifactEntity, float]]: ...
+
+    async def get_collection_stats(self) -> dict[str, dict[str, int]]: ...
+
     async def save(self, artifact: ArtifactEntity) -> None: ...
+
+    async def get_museum_validators(
+        self, inventory_ids: Sequence[UUID]
+    ) -> dict[UUID, MuseumValidatorsDTO]: ...
+
+    async def save_museum_validators(
+        self, inventory_id: UUID, validators: MuseumValidatorsDTO
+    ) -> None: ...
+
+    async def get_catalog_publication(
+        self, inventory_id: UUID
+    ) -> CatalogPublicationRecordDTO | None: ...
+
+    async def save_catalog_publication(
+        self, publication: CatalogPublicationRecordDTO
+    ) -> None: ...
+
+
+class ArtifactBulkLoaderProtocol(Protocol):
+    async def load(self, artifacts: Sequence[ArtifactEntity]) -> int: ...
@@ -0,0 +1,91 @@
+from collections.abc import AsyncIterator
+import csv
+from dataclasses import dataclass
+import io
+from typing import Any, ClassVar, Literal
+import zlib
+
+from src.application.dtos.artifact import ArtifactDTO, ArtifactListFilterDTO
+from src.application.interfaces.mappers import DtoEntityMapperProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+
+ExportFormat = Literal["ndjson", "csv"]
+
+CSV_COLUMNS = (
+    "inventory_id",
+    "created_at",
+    "acquisition_date",
+    "name",
+    "department",
+    "era",
+    "material",
+    "description",
+)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExportArtifactsUseCase:
+    repository: ArtifactRepositoryProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+
+    batch_size: ClassVar[int] = 1000
+    # Encoded rows are buffered up to this size before being emitted, so
+    # writers see a few large chunks instead of one tiny write per row.
+    chunk_size: ClassVar[int] = 64 * 1024
+
+    async def execute(
+        self,
+        filters: ArtifactListFilterDTO,
+        *,
+        export_format: ExportFormat = "ndjson",
+        compress: bool = False,
+    ) -> AsyncIterator[bytes]:
+        chunks = self._encode(filters, export_format)
+        if not compress:
+            async for chunk in chunks:
+                yield chunk
+            return
+
+        compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+        async for chunk in chunks:
+            if compressed := compressor.compress(chunk):
+                yield compressed
+        yield compressor.flush()
+
+    async def _encode(
+        self, filters: ArtifactListFilterDTO, export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        csv_writer = csv.writer(buffer) if export_format == "csv" else None
+        if csv_writer is not None:
+            csv_writer.writerow(CSV_COLUMNS)
+
+        async for entity in self.repository.stream_artifacts(
+            filters, batch_size=self.batch_size
+        ):
+            dto = self.artifact_mapper.to_dto(entity)
+            if csv_writer is not None:
+                csv_writer.writerow(_csv_row(dto))
+            else:
+                buffer.write(dto.model_dump_json())
+                buffer.write("\n")
+            if buffer.tell() >= self.chunk_size:
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+
+def _csv_row(dto: ArtifactDTO) -> list[Any]:
+    return [
+        dto.inventory_id,
+        dto.created_at.isoformat(),
+        dto.acquisition_date.isoformat(),
+        dto.name,
+        dto.department,
+        dto.era.value,
+        dto.material.value,
+        dto.description or "",
+    ]
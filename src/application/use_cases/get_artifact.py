@@ -3,6 +3,8 @@ import logging
 from typing import TYPE_CHECKING, Literal
 from uuid import UUID
 
+from pydantic import ValidationError
+
 from src.application.dtos.artifact import (
     ArtifactAdmissionNotificationDTO,
     ArtifactCatalogPublicationDTO,
@@ -12,9 +14,12 @@ from src.application.dtos.artifact import (
 )
 from src.application.exceptions import (
     ArtifactNotFoundError,
+    DeadlineExceededError,
     FailedFetchArtifactMuseumAPIException,
     FailedPublishArtifactInCatalogException,
     FailedPublishArtifactMessageBrokerException,
+    UpstreamBusyError,
+    UpstreamUnavailableError,
 )
 from src.application.interfaces.cache import CacheProtocol
 from src.application.interfaces.http_clients import (
@@ -45,18 +50,24 @@ class GetArtifactUseCase:
             str(inventory_id) if isinstance(inventory_id, UUID) else inventory_id
         )
 
-        cached_artifact: ArtifactDTO | None = await self.cache_client.get(
-            inventory_id_str
-        )
+        # Artifacts are cached as the DTO's own JSON, so both directions go
+        # through pydantic-core without building a dict in between.
+        cached_artifact = await self.cache_client.get_raw(inventory_id_str)
         if cached_artifact:
-            return ArtifactDTO.model_validate(cached_artifact)
+            try:
+                return ArtifactDTO.model_validate_json(cached_artifact)
+            except ValidationError:
+                logger.warning(
+                    "Discarding malformed cached artifact",
+                    extra={"inventory_id": inventory_id_str},
+                )
 
         artifact_entity: (
             ArtifactEntity | None
         ) = await self.repository.get_by_inventory_id(inventory_id_str)
         if artifact_entity:
             artifact_dto = self.artifact_mapper.to_dto(artifact_entity)
-            await self.cache_client.set(
+            await self.cache_client.set_raw(
                 inventory_id_str, artifact_dto.model_dump_json()
             )
             return artifact_dto
@@ -73,6 +84,9 @@ class GetArtifactUseCase:
                 extra={"inventory_id": inventory_id_str, "error": str(e)},
             )
             raise
+        except (UpstreamBusyError, UpstreamUnavailableError, DeadlineExceededError):
+            # Not a museum API failure: shed, or out of time for this request
+            raise
         except Exception as e:
             logger.exception(
                 "Failed to fetch artifact from external museum API",
@@ -84,7 +98,9 @@ class GetArtifactUseCase:
 
         artifact_entity = self.artifact_mapper.to_entity(artifact_dto)
         await self.repository.save(artifact_entity)
-        await self.cache_client.set(inventory_id_str, artifact_dto.model_dump_json())
+        await self.cache_client.set_raw(
+            inventory_id_str, artifact_dto.model_dump_json()
+        )
 
         try:
             notification_dto = ArtifactAdmissionNotificationDTO(
@@ -124,6 +140,8 @@ class GetArtifactUseCase:
                 "Artifact published to public catalog",
                 extra={"inventory_id": inventory_id_str, "public_id": public_id},
             )
+        except DeadlineExceededError:
+            raise
         except Exception as e:
             logger.exception(
                 "Failed to publish artifact to catalog",
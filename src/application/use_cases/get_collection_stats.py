@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+import logging
+from typing import ClassVar
+
+from pydantic import ValidationError
+
+from src.application.dtos.artifact import ArtifactStatsDTO
+from src.application.interfaces.cache import CacheProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+from src.domain.value_objects.era import Era
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetCollectionStatsUseCase:
+    repository: ArtifactRepositoryProtocol
+    cache_client: CacheProtocol
+    cache_ttl: int | None = None
+
+    cache_key: ClassVar[str] = "stats:collection"
+
+    async def execute(self) -> ArtifactStatsDTO:
+        cached_stats = await self.cache_client.get(self.cache_key)
+        if cached_stats:
+            try:
+                return ArtifactStatsDTO.model_validate(cached_stats)
+            except ValidationError:
+                logger.warning(
+                    "Discarding malformed cached stats",
+                    extra={"cache_key": self.cache_key},
+                )
+
+        # Reads the summary table: a few dozen rows whatever the collection size
+        counts = await self.repository.get_collection_stats()
+        by_era = counts.get("era", {})
+        years = counts.get("acquisition_year", {})
+        stats = ArtifactStatsDTO(
+            total=sum(by_era.values()),
+            by_department=dict(sorted(counts.get("department", {}).items())),
+            by_era={era: by_era[era] for era in Era.chronology if era in by_era},
+            by_material=dict(sorted(counts.get("material", {}).items())),
+            by_acquisition_year={
+                int(year): years[year] for year in sorted(years, key=int)
+            },
+        )
+        await self.cache_client.set(
+            self.cache_key, stats.model_dump(mode="json"), ttl=self.cache_ttl
+        )
+        return stats
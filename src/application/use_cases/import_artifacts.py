@@ -0,0 +1,125 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator
+from concurrent.futures import Executor
+from dataclasses import dataclass, field, replace
+from typing import ClassVar, Literal
+
+from src.application.dtos.artifact import ArtifactDTO
+from src.application.interfaces.repositories import ArtifactBulkLoaderProtocol
+from src.application.mappers import ArtifactMapper
+from src.domain.entities.artifact import ArtifactEntity
+
+ImportFormat = Literal["ndjson", "csv"]
+
+# An NDJSON line, or a CSV row keyed by the export's column names
+RawRecord = str | dict[str, str]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RecordBatch:
+    first_record: int
+    records: list[RawRecord]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RejectedRecord:
+    record: int
+    raw: RawRecord
+    error: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidatedBatch:
+    first_record: int
+    size: int
+    artifacts: list[ArtifactEntity] = field(default_factory=list)
+    rejected: list[RejectedRecord] = field(default_factory=list)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportBatchResult:
+    first_record: int
+    size: int
+    loaded: int
+    rejected: list[RejectedRecord]
+
+    @property
+    def next_record(self) -> int:
+        return self.first_record + self.size
+
+
+def validate_batch(batch: RecordBatch) -> ValidatedBatch:
+    """Apply ArtifactDTO rules to a batch; runs in a worker process."""
+    mapper = ArtifactMapper()
+    result = ValidatedBatch(first_record=batch.first_record, size=len(batch.records))
+    for offset, raw in enumerate(batch.records):
+        try:
+            if isinstance(raw, str):
+                dto = ArtifactDTO.model_validate_json(raw)
+            else:
+                dto = ArtifactDTO.model_validate(_csv_payload(raw))
+            # The mapper stamps a fresh created_at; imports keep the source's
+            artifact = replace(mapper.to_entity(dto), created_at=dto.created_at)
+        except Exception as e:  # noqa: BLE001 - any bad record is a reject
+            result.rejected.append(
+                RejectedRecord(
+                    record=batch.first_record + offset, raw=raw, error=str(e)
+                )
+            )
+        else:
+            result.artifacts.append(artifact)
+    return result
+
+
+def _csv_payload(row: dict[str, str]) -> dict[str, object]:
+    payload: dict[str, object] = {
+        key: value for key, value in row.items() if value != ""
+    }
+    for nested in ("era", "material"):
+        if nested in payload:
+            payload[nested] = {"value": payload[nested]}
+    return payload
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ImportArtifactsUseCase:
+    loader: ArtifactBulkLoaderProtocol
+
+    # Batches validated ahead of the one being loaded; bounds memory while
+    # keeping workers busy during COPY.
+    max_pending_batches: ClassVar[int] = 8
+
+    async def execute(
+        self,
+        batches: AsyncIterable[RecordBatch],
+        *,
+        executor: Executor | None = None,
+    ) -> AsyncIterator[ImportBatchResult]:
+        """Validate batches (in ``executor`` if given) and load them in order.
+
+        Results are yielded in input order once the batch is committed, so
+        ``next_record`` of the last result is a safe resume point.
+        """
+        loop = asyncio.get_running_loop()
+        pending: deque[asyncio.Future[ValidatedBatch]] = deque()
+        async for batch in batches:
+            if executor is None:
+                future = loop.create_future()
+                future.set_result(validate_batch(batch))
+            else:
+                future = loop.run_in_executor(executor, validate_batch, batch)
+            pending.append(future)
+            if len(pending) >= self.max_pending_batches:
+                yield await self._load(await pending.popleft())
+        while pending:
+            yield await self._load(await pending.popleft())
+
+    async def _load(self, batch: ValidatedBatch) -> ImportBatchResult:
+        loaded = await self.loader.load(batch.artifacts) if batch.artifacts else 0
+        return ImportBatchResult(
+            first_record=batch.first_record,
+            size=batch.size,
+            loaded=loaded,
+            rejected=batch.rejected,
+        )
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import ClassVar
+from uuid import UUID
+
+from src.application.dtos.artifact import ArtifactChangeDTO, ArtifactChangesPageDTO
+from src.application.dtos.pagination import ChangesCursorDTO
+from src.application.interfaces.mappers import DtoEntityMapperProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListArtifactChangesUseCase:
+    repository: ArtifactRepositoryProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+
+    max_page_size: ClassVar[int] = 1000
+    # updated_at is stamped when a transaction starts, not when it commits,
+    # so a slow writer can commit a row older than ones already returned.
+    # Pages stop before the oldest transaction still open in the database,
+    # however long it runs, and at least settle_window before the database's
+    # now(); those rows stay ahead of the cursor instead of behind it.
+    settle_window: ClassVar[timedelta] = timedelta(seconds=5)
+
+    async def execute(
+        self,
+        *,
+        since: datetime | None = None,
+        cursor: str | None = None,
+        limit: int = 500,
+    ) -> ArtifactChangesPageDTO:
+        page_size = max(1, min(limit, self.max_page_size))
+        after: ChangesCursorDTO | None = None
+        if cursor:
+            after = ChangesCursorDTO.decode(cursor)
+        elif since is not None:
+            after = ChangesCursorDTO(updated_at=since, inventory_id=UUID(int=0))
+
+        until = await self.repository.change_feed_horizon(self.settle_window)
+        changes = await self.repository.list_changes(
+            after=after, until=until, limit=page_size + 1
+        )
+        has_more = len(changes) > page_size
+        changes = changes[:page_size]
+
+        # An empty page keeps the caller's position, so the token can always
+        # be stored and replayed on the next sync.
+        if changes:
+            last_entity, last_updated_at = changes[-1]
+            after = ChangesCursorDTO(
+                updated_at=last_updated_at, inventory_id=last_entity.inventory_id
+            )
+
+        return ArtifactChangesPageDTO(
+            items=[
+                ArtifactChangeDTO(
+                    artifact=self.artifact_mapper.to_dto(entity), updated_at=updated_at
+                )
+                for entity, updated_at in changes
+            ],
+            next_cursor=after.encode() if after is not None else None,
+            has_more=has_more,
+        )
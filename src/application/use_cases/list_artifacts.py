@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from typing import ClassVar
+
+from src.application.dtos.artifact import ArtifactListFilterDTO, ArtifactPageDTO
+from src.application.dtos.pagination import KeysetCursorDTO
+from src.application.interfaces.mappers import DtoEntityMapperProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ListArtifactsUseCase:
+    repository: ArtifactRepositoryProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+
+    max_page_size: ClassVar[int] = 100
+
+    async def execute(
+        self,
+        filters: ArtifactListFilterDTO,
+        *,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> ArtifactPageDTO:
+        page_size = max(1, min(limit, self.max_page_size))
+        after = KeysetCursorDTO.decode(cursor) if cursor else None
+
+        # One extra row tells us whether another page exists without a COUNT.
+        entities = await self.repository.list_artifacts(
+            filters, after=after, limit=page_size + 1
+        )
+        has_more = len(entities) > page_size
+        entities = entities[:page_size]
+
+        next_cursor: str | None = None
+        if has_more:
+            last = entities[-1]
+            next_cursor = KeysetCursorDTO(
+                created_at=last.created_at, inventory_id=last.inventory_id
+            ).encode()
+
+        return ArtifactPageDTO(
+            items=[self.artifact_mapper.to_dto(entity) for entity in entities],
+            next_cursor=next_cursor,
+        )
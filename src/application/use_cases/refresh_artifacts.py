@@ -0,0 +1,120 @@
+from dataclasses import dataclass, replace
+import logging
+from typing import ClassVar
+
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    ArtifactListFilterDTO,
+    ArtifactRefreshPageDTO,
+    MuseumValidatorsDTO,
+)
+from src.application.dtos.pagination import KeysetCursorDTO
+from src.application.exceptions import (
+    DeadlineExceededError,
+    UpstreamBusyError,
+    UpstreamUnavailableError,
+)
+from src.application.interfaces.cache import CacheProtocol
+from src.application.interfaces.http_clients import (
+    ExternalMuseumAPIProtocol,
+    PublicCatalogAPIProtocol,
+)
+from src.application.interfaces.mappers import DtoEntityMapperProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+from src.domain.entities.artifact import ArtifactEntity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RefreshArtifactsUseCase:
+    repository: ArtifactRepositoryProtocol
+    museum_api_client: ExternalMuseumAPIProtocol
+    catalog_api_client: PublicCatalogAPIProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+    cache_client: CacheProtocol
+
+    max_page_size: ClassVar[int] = 500
+
+    async def execute(
+        self, *, cursor: str | None = None, limit: int = 100
+    ) -> ArtifactRefreshPageDTO:
+        page_size = max(1, min(limit, self.max_page_size))
+        after = KeysetCursorDTO.decode(cursor) if cursor else None
+
+        artifacts = await self.repository.list_artifacts(
+            ArtifactListFilterDTO(), after=after, limit=page_size + 1
+        )
+        has_more = len(artifacts) > page_size
+        artifacts = artifacts[:page_size]
+        stored_validators = await self.repository.get_museum_validators(
+            [artifact.inventory_id for artifact in artifacts]
+        )
+
+        updated = failed = 0
+        for artifact in artifacts:
+            try:
+                if await self._refresh(
+                    artifact, stored_validators.get(artifact.inventory_id)
+                ):
+                    updated += 1
+            except (UpstreamBusyError, UpstreamUnavailableError, DeadlineExceededError):
+                # The museum API is shedding load: stop rather than fail every
+                # remaining artifact of the page.
+                raise
+            except Exception as e:
+                failed += 1
+                logger.warning(
+                    "Failed to refresh artifact",
+                    extra={"inventory_id": str(artifact.inventory_id), "error": str(e)},
+                )
+
+        if artifacts:
+            last = artifacts[-1]
+            after = KeysetCursorDTO(
+                created_at=last.created_at, inventory_id=last.inventory_id
+            )
+        return ArtifactRefreshPageDTO(
+            checked=len(artifacts),
+            updated=updated,
+            failed=failed,
+            next_cursor=after.encode() if after is not None else None,
+            has_more=has_more,
+        )
+
+    async def _refresh(
+        self, stored: ArtifactEntity, validators: MuseumValidatorsDTO | None
+    ) -> bool:
+        fetched = await self.museum_api_client.fetch_artifact_if_changed(
+            stored.inventory_id, validators
+        )
+        if fetched is None:
+            return False
+
+        artifact_dto, validators = fetched
+        # The mapper stamps a fresh created_at; the stored artifact keeps its own
+        artifact_entity = replace(
+            self.artifact_mapper.to_entity(artifact_dto), created_at=stored.created_at
+        )
+        await self.repository.save(artifact_entity)
+        await self.cache_client.set_raw(
+            str(stored.inventory_id),
+            self.artifact_mapper.to_dto(artifact_entity).model_dump_json(),
+        )
+        await self.catalog_api_client.publish_artifact(
+            ArtifactCatalogPublicationDTO(
+                inventory_id=artifact_dto.inventory_id,
+                name=artifact_dto.name,
+                era=artifact_dto.era,
+                material=artifact_dto.material,
+                description=artifact_dto.description,
+            )
+        )
+        # Stored last: if anything above fails, the next refresh still sees
+        # the old validators, fetches in full and finishes the job.
+        await self.repository.save_museum_validators(stored.inventory_id, validators)
+        logger.info(
+            "Artifact refreshed from the museum API",
+            extra={"inventory_id": str(stored.inventory_id)},
+        )
+        return True
@@ -0,0 +1,86 @@
+from dataclasses import dataclass
+import hashlib
+import logging
+from typing import ClassVar
+
+from pydantic import ValidationError
+
+from src.application.dtos.artifact import ArtifactSearchHitDTO, ArtifactSearchPageDTO
+from src.application.dtos.pagination import SearchCursorDTO
+from src.application.exceptions import InvalidSearchQueryError
+from src.application.interfaces.cache import CacheProtocol
+from src.application.interfaces.mappers import DtoEntityMapperProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SearchArtifactsUseCase:
+    repository: ArtifactRepositoryProtocol
+    artifact_mapper: DtoEntityMapperProtocol
+    cache_client: CacheProtocol
+    cache_ttl: int | None = None
+
+    max_page_size: ClassVar[int] = 100
+    min_query_length: ClassVar[int] = 2
+    cache_key_prefix: ClassVar[str] = "search:"
+
+    async def execute(
+        self, query: str, *, cursor: str | None = None, limit: int = 20
+    ) -> ArtifactSearchPageDTO:
+        normalized = " ".join(query.lower().split())
+        # Checked after normalizing: a blank query would match every row
+        if len(normalized) < self.min_query_length:
+            raise InvalidSearchQueryError(
+                f"Search query must have at least {self.min_query_length} "
+                "non-blank characters"
+            )
+        page_size = max(1, min(limit, self.max_page_size))
+        after = SearchCursorDTO.decode(cursor) if cursor else None
+
+        # Only first pages are cached: that is where popular queries
+        # concentrate, and deeper pages would just churn the cache.
+        cache_key = self._cache_key(normalized, page_size) if after is None else None
+        if cache_key is not None:
+            cached_page = await self.cache_client.get(cache_key)
+            if cached_page:
+                try:
+                    return ArtifactSearchPageDTO.model_validate(cached_page)
+                except ValidationError:
+                    logger.warning(
+                        "Discarding malformed cached search page",
+                        extra={"cache_key": cache_key},
+                    )
+
+        hits = await self.repository.search(
+            normalized, after=after, limit=page_size + 1
+        )
+        has_more = len(hits) > page_size
+        hits = hits[:page_size]
+
+        next_cursor: str | None = None
+        if has_more:
+            last_entity, last_score = hits[-1]
+            next_cursor = SearchCursorDTO(
+                score=last_score, inventory_id=last_entity.inventory_id
+            ).encode()
+
+        page = ArtifactSearchPageDTO(
+            items=[
+                ArtifactSearchHitDTO(
+                    artifact=self.artifact_mapper.to_dto(entity), score=score
+                )
+                for entity, score in hits
+            ],
+            next_cursor=next_cursor,
+        )
+        if cache_key is not None:
+            await self.cache_client.set(
+                cache_key, page.model_dump(mode="json"), ttl=self.cache_ttl
+            )
+        return page
+
+    def _cache_key(self, normalized_query: str, page_size: int) -> str:
+        digest = hashlib.sha256(normalized_query.encode("utf-8")).hexdigest()
+        return f"{self.cache_key_prefix}{page_size}:{digest}"
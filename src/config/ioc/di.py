@@ -6,6 +6,7 @@ from src.config.ioc.providers import (
     DatabaseProvider,
     HTTPClientProvider,
     MapperProvider,
+    MetricsProvider,
     RepositoryProvider,
     ServiceProvider,
     SettingsProvider,
@@ -16,6 +17,7 @@ from src.config.ioc.providers import (
 def get_providers() -> list[Provider]:
     return [
         SettingsProvider(),
+        MetricsProvider(),
         DatabaseProvider(),
         HTTPClientProvider(),
         BrokerProvider(),
@@ -2,21 +2,62 @@ from collections.abc import AsyncIterator
 
 from dishka import Provider, Scope, provide
 from faststream.kafka import KafkaBroker
-from httpx import AsyncClient
 import redis.asyncio as redis
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.application.interfaces.http_clients import PublicCatalogAPIProtocol
 from src.application.mappers import ArtifactMapper
+from src.application.use_cases.export_artifacts import ExportArtifactsUseCase
 from src.application.use_cases.get_artifact import GetArtifactUseCase
+from src.application.use_cases.get_collection_stats import (
+    GetCollectionStatsUseCase,
+)
+from src.application.use_cases.import_artifacts import ImportArtifactsUseCase
+from src.application.use_cases.list_artifact_changes import (
+    ListArtifactChangesUseCase,
+)
+from src.application.use_cases.list_artifacts import ListArtifactsUseCase
+from src.application.use_cases.refresh_artifacts import RefreshArtifactsUseCase
+from src.application.use_cases.search_artifacts import SearchArtifactsUseCase
 from src.config.base import Settings
 from src.infrastructures.broker.publisher import KafkaPublisher
 from src.infrastructures.cache.redis_client import RedisCacheClient
+from src.infrastructures.db.instrumentation import (
+    instrument_pool_checkouts,
+    instrument_pool_usage,
+    instrument_statements,
+)
+from src.infrastructures.db.liveness import IdleConnectionChecker
 from src.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+from src.infrastructures.db.repositories.artifact_bulk_loader import (
+    ArtifactBulkLoaderPostgres,
+)
+from src.infrastructures.db.routing import ReplicaRouter
 from src.infrastructures.db.session import create_engine, get_session_factory
+from src.infrastructures.http.batching import BatchingCatalogPublisher
+from src.infrastructures.http.circuit_breaker import (
+    CircuitBreaker,
+    UpstreamCircuitBreakers,
+    instrument_circuit_breakers,
+)
 from src.infrastructures.http.clients import (
     ExternalMuseumAPIClient,
     PublicCatalogAPIClient,
 )
+from src.infrastructures.http.deduplication import DeduplicatingCatalogPublisher
+from src.infrastructures.http.hedging import HedgePolicy
+from src.infrastructures.http.retry import RetryPolicy, UpstreamRetryPolicies
+from src.infrastructures.http.throttling import (
+    LocalTokenBucket,
+    OutboundLimiter,
+    RedisTokenBucket,
+)
+from src.infrastructures.http.transport import (
+    CatalogHTTPClient,
+    MuseumHTTPClient,
+    create_http_client,
+)
+from src.infrastructures.metrics import MetricsRegistry
 
 
 class SettingsProvider(Provider):
@@ -25,24 +66,188 @@ class SettingsProvider(Provider):
         return Settings()
 
 
+class MetricsProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_metrics_registry(self) -> MetricsRegistry:
+        return MetricsRegistry()
+
+
 class DatabaseProvider(Provider):
     @provide(scope=Scope.APP)
-    def get_engine(self, settings: Settings) -> async_sessionmaker[AsyncSession]:
-        engine = create_engine(str(settings.database_url), is_echo=settings.debug)
-        return get_session_factory(engine)
+    async def get_replica_router(
+        self, settings: Settings, metrics: MetricsRegistry
+    ) -> AsyncIterator[ReplicaRouter]:
+        router = ReplicaRouter(
+            primary=create_engine(
+                str(settings.database_url), **settings.engine_options
+            ),
+            replicas=[
+                create_engine(url, **settings.engine_options)
+                for url in settings.replica_urls
+            ],
+            max_lag_seconds=settings.replica_max_lag_seconds,
+            check_interval=settings.replica_health_check_interval,
+        )
+        instrument_pool_checkouts(router.primary, metrics, role="primary")
+        for replica in router.replicas:
+            instrument_pool_checkouts(replica, metrics, role="replica")
+        engines = {
+            "primary": router.primary,
+            **{
+                f"replica-{index}": replica
+                for index, replica in enumerate(router.replicas)
+            },
+        }
+        instrument_pool_usage(engines, metrics)
+        if settings.db_statement_timing:
+            for engine in engines.values():
+                instrument_statements(
+                    engine,
+                    metrics,
+                    slow_query_threshold=settings.db_slow_query_threshold,
+                )
+        idle_checker = IdleConnectionChecker(
+            engines=engines,
+            metrics=metrics,
+            interval=settings.db_idle_check_interval,
+        )
+        if settings.db_liveness_check == "background":
+            idle_checker.start()
+        router.start()
+        yield router
+        await idle_checker.close()
+        await router.close()
+
+    @provide(scope=Scope.APP)
+    def get_engine(self, router: ReplicaRouter) -> async_sessionmaker[AsyncSession]:
+        return get_session_factory(router.primary, router)
 
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self, factory: async_sessionmaker[AsyncSession]
     ) -> AsyncIterator[AsyncSession]:
+        # AsyncSession checks a connection out of the pool only when the first
+        # statement runs, so requests answered from cache never touch the pool
+        # (asserted in tests/test_infrastructure/test_db/test_instrumentation.py).
         async with factory() as session:
             yield session
 
 
 class HTTPClientProvider(Provider):
     @provide(scope=Scope.APP)
-    def get_http_client(self, settings: Settings) -> AsyncClient:
-        return AsyncClient(timeout=settings.http_timeout)
+    async def get_museum_http_client(
+        self, settings: Settings, metrics: MetricsRegistry
+    ) -> AsyncIterator[MuseumHTTPClient]:
+        client = create_http_client(
+            upstream="museum", metrics=metrics, **settings.museum_http_options
+        )
+        yield MuseumHTTPClient(client)
+        await client.aclose()
+
+    @provide(scope=Scope.APP)
+    async def get_catalog_http_client(
+        self, settings: Settings, metrics: MetricsRegistry
+    ) -> AsyncIterator[CatalogHTTPClient]:
+        client = create_http_client(
+            upstream="catalog", metrics=metrics, **settings.catalog_http_options
+        )
+        yield CatalogHTTPClient(client)
+        await client.aclose()
+
+    @provide(scope=Scope.APP)
+    async def get_batching_catalog_publisher(
+        self,
+        client: CatalogHTTPClient,
+        breakers: UpstreamCircuitBreakers,
+        retries: UpstreamRetryPolicies,
+        settings: Settings,
+        metrics: MetricsRegistry,
+    ) -> AsyncIterator[BatchingCatalogPublisher]:
+        # App-wide, so artifacts from concurrent requests share batches
+        publisher = BatchingCatalogPublisher(
+            client=PublicCatalogAPIClient(
+                base_url=settings.catalog_api_base_url,
+                client=client,
+                breaker=breakers.catalog,
+                retry=retries.catalog,
+            ),
+            metrics=metrics,
+            max_batch_size=settings.catalog_batch_size,
+            linger=settings.catalog_batch_linger,
+        )
+        yield publisher
+        await publisher.aclose()
+
+    @provide(scope=Scope.APP)
+    def get_circuit_breakers(
+        self, settings: Settings, metrics: MetricsRegistry
+    ) -> UpstreamCircuitBreakers:
+        breakers = UpstreamCircuitBreakers(
+            museum=CircuitBreaker(
+                upstream="museum", metrics=metrics, **settings.circuit_breaker_options
+            ),
+            catalog=CircuitBreaker(
+                upstream="catalog", metrics=metrics, **settings.circuit_breaker_options
+            ),
+        )
+        instrument_circuit_breakers([breakers.museum, breakers.catalog], metrics)
+        return breakers
+
+    @provide(scope=Scope.APP)
+    def get_retry_policies(
+        self, settings: Settings, metrics: MetricsRegistry
+    ) -> UpstreamRetryPolicies:
+        return UpstreamRetryPolicies(
+            museum=RetryPolicy(
+                upstream="museum",
+                metrics=metrics,
+                wait_initial=0.5,
+                **settings.retry_options,
+            ),
+            catalog=RetryPolicy(
+                upstream="catalog",
+                metrics=metrics,
+                wait_initial=1.0,
+                **settings.retry_options,
+            ),
+        )
+
+    @provide(scope=Scope.APP)
+    def get_museum_hedge_policy(
+        self, settings: Settings, metrics: MetricsRegistry
+    ) -> HedgePolicy:
+        return HedgePolicy(
+            upstream="museum",
+            metrics=metrics,
+            percentile=settings.museum_hedge_percentile,
+            min_delay=settings.museum_hedge_min_delay,
+            initial_delay=settings.museum_hedge_initial_delay,
+            budget_ratio=settings.museum_hedge_budget,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_museum_limiter(
+        self, settings: Settings, cache: RedisCacheClient, metrics: MetricsRegistry
+    ) -> OutboundLimiter:
+        bucket = None
+        if settings.museum_rate_limit > 0:
+            bucket = RedisTokenBucket(
+                client=cache.client,
+                key=f"{settings.redis_cache_prefix}ratelimit:museum",
+                rate=settings.museum_rate_limit,
+                burst=settings.museum_rate_burst,
+                fallback=LocalTokenBucket(
+                    rate=settings.museum_rate_limit,
+                    burst=settings.museum_rate_burst,
+                ),
+            )
+        return OutboundLimiter(
+            upstream="museum",
+            bucket=bucket,
+            max_in_flight=settings.museum_max_in_flight,
+            max_queue_wait=settings.museum_queue_timeout,
+            metrics=metrics,
+        )
 
 
 class BrokerProvider(Provider):
@@ -54,28 +259,71 @@ class BrokerProvider(Provider):
 class RepositoryProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_artifact_repository(
-        self, session: AsyncSession
+        self, session: AsyncSession, settings: Settings
     ) -> ArtifactRepositorySQLAlchemy:
-        return ArtifactRepositorySQLAlchemy(session=session)
+        return ArtifactRepositorySQLAlchemy(
+            session=session,
+            retry_reads_on_disconnect=settings.db_liveness_check == "background",
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_artifact_bulk_loader(
+        self, session: AsyncSession
+    ) -> ArtifactBulkLoaderPostgres:
+        return ArtifactBulkLoaderPostgres(session=session)
 
 
 class ServiceProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_external_museum_api_client(
         self,
-        client: AsyncClient,
+        client: MuseumHTTPClient,
+        limiter: OutboundLimiter,
+        breakers: UpstreamCircuitBreakers,
+        hedging: HedgePolicy,
+        retries: UpstreamRetryPolicies,
         settings: Settings,
     ) -> ExternalMuseumAPIClient:
         return ExternalMuseumAPIClient(
-            base_url=settings.external_api_base_url, client=client
+            base_url=settings.external_api_base_url,
+            client=client,
+            limiter=limiter,
+            breaker=breakers.museum,
+            hedging=hedging if settings.museum_hedge_enabled else None,
+            retry=retries.museum,
         )
 
     @provide(scope=Scope.REQUEST)
     def get_public_catalog_api_client(
-        self, client: AsyncClient, settings: Settings
+        self,
+        client: CatalogHTTPClient,
+        breakers: UpstreamCircuitBreakers,
+        retries: UpstreamRetryPolicies,
+        settings: Settings,
     ) -> PublicCatalogAPIClient:
         return PublicCatalogAPIClient(
-            base_url=settings.catalog_api_base_url, client=client
+            base_url=settings.catalog_api_base_url,
+            client=client,
+            breaker=breakers.catalog,
+            retry=retries.catalog,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_catalog_publisher(
+        self,
+        client: PublicCatalogAPIClient,
+        batching: BatchingCatalogPublisher,
+        repository: ArtifactRepositorySQLAlchemy,
+        metrics: MetricsRegistry,
+        settings: Settings,
+    ) -> PublicCatalogAPIProtocol:
+        publisher: PublicCatalogAPIProtocol = (
+            batching if settings.catalog_batch_enabled else client
+        )
+        if not settings.catalog_skip_unchanged:
+            return publisher
+        return DeduplicatingCatalogPublisher(
+            publisher=publisher, repository=repository, metrics=metrics
         )
 
     @provide(scope=Scope.REQUEST)
@@ -111,7 +359,7 @@ class UseCaseProvider(Provider):
         self,
         repository: ArtifactRepositorySQLAlchemy,
         museum_api_client: ExternalMuseumAPIClient,
-        catalog_api_client: PublicCatalogAPIClient,
+        catalog_api_client: PublicCatalogAPIProtocol,
         message_broker: KafkaPublisher,
         artifact_mapper: ArtifactMapper,
         cache_client: RedisCacheClient,
@@ -124,3 +372,87 @@ class UseCaseProvider(Provider):
             artifact_mapper=artifact_mapper,
             cache_client=cache_client,
         )
+
+    @provide(scope=Scope.REQUEST)
+    def get_list_artifacts_use_case(
+        self,
+        repository: ArtifactRepositorySQLAlchemy,
+        artifact_mapper: ArtifactMapper,
+    ) -> ListArtifactsUseCase:
+        return ListArtifactsUseCase(
+            repository=repository,
+            artifact_mapper=artifact_mapper,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_list_artifact_changes_use_case(
+        self,
+        repository: ArtifactRepositorySQLAlchemy,
+        artifact_mapper: ArtifactMapper,
+    ) -> ListArtifactChangesUseCase:
+        return ListArtifactChangesUseCase(
+            repository=repository,
+            artifact_mapper=artifact_mapper,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_search_artifacts_use_case(
+        self,
+        repository: ArtifactRepositorySQLAlchemy,
+        artifact_mapper: ArtifactMapper,
+        cache_client: RedisCacheClient,
+        settings: Settings,
+    ) -> SearchArtifactsUseCase:
+        return SearchArtifactsUseCase(
+            repository=repository,
+            artifact_mapper=artifact_mapper,
+            cache_client=cache_client,
+            cache_ttl=settings.search_cache_ttl,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_collection_stats_use_case(
+        self,
+        repository: ArtifactRepositorySQLAlchemy,
+        cache_client: RedisCacheClient,
+        settings: Settings,
+    ) -> GetCollectionStatsUseCase:
+        return GetCollectionStatsUseCase(
+            repository=repository,
+            cache_client=cache_client,
+            cache_ttl=settings.stats_cache_ttl,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_export_artifacts_use_case(
+        self,
+        repository: ArtifactRepositorySQLAlchemy,
+        artifact_mapper: ArtifactMapper,
+    ) -> ExportArtifactsUseCase:
+        return ExportArtifactsUseCase(
+            repository=repository,
+            artifact_mapper=artifact_mapper,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_refresh_artifacts_use_case(
+        self,
+        repository: ArtifactRepositorySQLAlchemy,
+        museum_api_client: ExternalMuseumAPIClient,
+        catalog_api_client: PublicCatalogAPIProtocol,
+        artifact_mapper: ArtifactMapper,
+        cache_client: RedisCacheClient,
+    ) -> RefreshArtifactsUseCase:
+        return RefreshArtifactsUseCase(
+            repository=repository,
+            museum_api_client=museum_api_client,
+            catalog_api_client=catalog_api_client,
+            artifact_mapper=artifact_mapper,
+            cache_client=cache_client,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_import_artifacts_use_case(
+        self, loader: ArtifactBulkLoaderPostgres
+    ) -> ImportArtifactsUseCase:
+        return ImportArtifactsUseCase(loader=loader)
@@ -1,13 +1,14 @@
 import logging
 import sys
+from typing import TextIO
 
 
-def setup_logging(level: str = "INFO") -> None:
+def setup_logging(level: str = "INFO", stream: TextIO = sys.stdout) -> None:
     root = logging.getLogger()
     if root.handlers:
         for h in list(root.handlers):
             root.removeHandler(h)
-    handler = logging.StreamHandler(sys.stdout)
+    handler = logging.StreamHandler(stream)
     fmt = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
     handler.setFormatter(logging.Formatter(fmt))
     root.addHandler(handler)
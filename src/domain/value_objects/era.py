@@ -1,13 +1,16 @@
 from dataclasses import dataclass
+from functools import total_ordering
 from typing import ClassVar, final
 
 from src.domain.exceptions import InvalidEraException
 
 
 @final
-@dataclass(frozen=True, slots=True, kw_only=True, order=True)
+@total_ordering
+@dataclass(frozen=True, slots=True, kw_only=True)
 class Era:
-    _allowed_values: ClassVar[set[str]] = {
+    # Oldest first; eras compare in this order, as their stored codes do
+    chronology: ClassVar[tuple[str, ...]] = (
         "paleolithic",
         "neolithic",
         "bronze_age",
@@ -15,12 +18,18 @@ class Era:
         "antiquity",
         "middle_ages",
         "modern",
-    }
+    )
+    _allowed_values: ClassVar[set[str]] = set(chronology)
     value: str
 
     def __post_init__(self) -> None:
         if self.value not in self._allowed_values:
             raise InvalidEraException("Invalid era: %s", self.value)
 
+    def __lt__(self, other: object) -> bool:
+        if not isinstance(other, Era):
+            return NotImplemented
+        return self.chronology.index(self.value) < self.chronology.index(other.value)
+
     def __str__(self) -> str:
         return self.value
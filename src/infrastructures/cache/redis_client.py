@@ -7,6 +7,7 @@ from redis.asyncio import Redis
 import redis.exceptions
 
 from src.application.interfaces.cache import CacheProtocol
+from src.infrastructures.deadline import within_deadline
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +20,8 @@ class RedisCacheClient(CacheProtocol):
 
     async def get(self, key: str) -> Any | None:
         try:
-            value = await self.client.get(key)
+            async with within_deadline():
+                value = await self.client.get(key)
             if value is None:
                 return None
             return json.loads(value)
@@ -34,31 +36,50 @@ class RedisCacheClient(CacheProtocol):
             )
             return None
 
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+    async def get_raw(self, key: str) -> bytes | str | None:
         try:
-            serialized_value = json.dumps(value, default=str)
-            if ttl is not None:
-                await self.client.setex(key, ttl, serialized_value)
-            elif self.ttl is not None:
-                await self.client.setex(key, self.ttl, serialized_value)
-            else:
-                await self.client.set(key, serialized_value)
-            return True
+            async with within_deadline():
+                value: bytes | str | None = await self.client.get(key)
+            return value
         except (ConnectionError, redis.exceptions.RedisError) as e:
             logger.error(
-                "Redis set operation failed", extra={"key": key, "error": str(e)}
+                "Redis get operation failed", extra={"key": key, "error": str(e)}
             )
-            return False
+            return None
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> bool:
+        try:
+            serialized_value = json.dumps(value, default=str)
         except (TypeError, ValueError) as e:
             logger.error(
                 "Failed to serialize value for cache",
                 extra={"key": key, "error": str(e)},
             )
             return False
+        return await self.set_raw(key, serialized_value, ttl)
+
+    async def set_raw(
+        self, key: str, value: bytes | str, ttl: int | None = None
+    ) -> bool:
+        try:
+            async with within_deadline():
+                if ttl is not None:
+                    await self.client.setex(key, ttl, value)
+                elif self.ttl is not None:
+                    await self.client.setex(key, self.ttl, value)
+                else:
+                    await self.client.set(key, value)
+            return True
+        except (ConnectionError, redis.exceptions.RedisError) as e:
+            logger.error(
+                "Redis set operation failed", extra={"key": key, "error": str(e)}
+            )
+            return False
 
     async def delete(self, key: str) -> bool:
         try:
-            result = await self.client.delete(key)
+            async with within_deadline():
+                result = await self.client.delete(key)
             return result > 0
         except (ConnectionError, redis.exceptions.RedisError) as e:
             logger.error(
@@ -68,7 +89,8 @@ class RedisCacheClient(CacheProtocol):
 
     async def exists(self, key: str) -> bool:
         try:
-            return bool(await self.client.exists(key))
+            async with within_deadline():
+                return bool(await self.client.exists(key))
         except (ConnectionError, redis.exceptions.RedisError) as e:
             logger.error(
                 "Redis exists operation failed", extra={"key": key, "error": str(e)}
@@ -4,5 +4,9 @@ from typing import final
 class RepositorySaveError(Exception): ...
 
 
+@final
+class RepositoryReadError(Exception): ...
+
+
 @final
 class RepositoryConflictError(Exception): ...
@@ -0,0 +1,304 @@
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+import logging
+import re
+import time
+from typing import Any, cast
+
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+from sqlalchemy.util import queue as sqla_queue
+
+from src.infrastructures.metrics import LabelValues, MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+CHECKOUTS_PER_REQUEST_BUCKETS = (0, 1, 2, 3, 5, 10)
+POOL_ACQUIRE_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+STATEMENT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0)
+
+# Statements past this many distinct shapes share one label, so a query
+# built with unbounded variety cannot blow up the metric's cardinality.
+MAX_STATEMENT_LABELS = 200
+OTHER_STATEMENT_LABEL = "other"
+
+_STATEMENT_STARTED_KEY = "statement_started"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$])\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<!:):\w+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_request_checkouts: ContextVar[list[int] | None] = ContextVar(
+    "request_checkouts", default=None
+)
+
+AcquireObserver = Callable[[float, bool], None]
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that reports how long each checkout took to acquire."""
+
+    acquire_observer: AcquireObserver | None = None
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._observe(time.perf_counter() - started, timed_out=True)
+            raise
+        self._observe(time.perf_counter() - started, timed_out=False)
+        return connection
+
+    def ping_idle(self) -> int:
+        """Ping each idle connection once and invalidate the dead ones.
+
+        Must run under ``greenlet_spawn``. Returns the number of connections
+        invalidated; they reconnect on their next checkout.
+        """
+        invalidated = 0
+        for _ in range(self._pool.qsize()):
+            try:
+                record = self._pool.get(block=False)
+            except sqla_queue.Empty:
+                break
+            try:
+                dbapi_connection = record.dbapi_connection
+                if dbapi_connection is None:
+                    continue
+                try:
+                    alive = self._dialect._do_ping_w_event(dbapi_connection)  # noqa: SLF001
+                except Exception:  # noqa: BLE001
+                    alive = False
+                if not alive:
+                    record.invalidate()
+                    invalidated += 1
+            finally:
+                # Same path as a normal checkin: if the queue filled up while
+                # we held the record, it is closed and overflow released.
+                self._do_return_conn(record)
+        return invalidated
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        # engine.dispose() swaps in a fresh pool; keep reporting from it
+        pool = cast("InstrumentedQueuePool", super().recreate())
+        pool.acquire_observer = self.acquire_observer
+        return pool
+
+    def _observe(self, seconds: float, *, timed_out: bool) -> None:
+        if self.acquire_observer is not None:
+            self.acquire_observer(seconds, timed_out)
+
+
+def instrument_pool_checkouts(
+    engine: AsyncEngine, metrics: MetricsRegistry, role: str
+) -> None:
+    checkouts = metrics.counter(
+        "db_pool_checkouts_total",
+        "Connections checked out of the SQLAlchemy pool",
+        ["role"],
+    )
+
+    def on_checkout(*_: Any) -> None:
+        checkouts.inc(role=role)
+        request_counter = _request_checkouts.get()
+        if request_counter is not None:
+            request_counter[0] += 1
+
+    event.listen(engine.sync_engine.pool, "checkout", on_checkout)
+
+
+def instrument_pool_usage(
+    engines: dict[str, AsyncEngine], metrics: MetricsRegistry
+) -> None:
+    """Export occupancy gauges, acquire latency and timeouts per named pool."""
+    acquire_seconds = metrics.histogram(
+        "db_pool_acquire_seconds",
+        "Time to acquire a pooled connection, including waiting for a free slot",
+        ["pool"],
+        buckets=POOL_ACQUIRE_BUCKETS,
+    )
+    timeouts = metrics.counter(
+        "db_pool_timeouts_total",
+        "Checkouts that gave up after pool_timeout seconds",
+        ["pool"],
+    )
+
+    for name, engine in engines.items():
+        pool = engine.sync_engine.pool
+        if not isinstance(pool, InstrumentedQueuePool):
+            continue
+
+        def observe(seconds: float, timed_out: bool, name: str = name) -> None:
+            acquire_seconds.observe(seconds, pool=name)
+            if timed_out:
+                timeouts.inc(pool=name)
+
+        pool.acquire_observer = observe
+
+    def collect(
+        read: Callable[[AsyncAdaptedQueuePool], int],
+    ) -> dict[LabelValues, float]:
+        samples: dict[LabelValues, float] = {}
+        for name, engine in engines.items():
+            pool = engine.sync_engine.pool
+            if isinstance(pool, AsyncAdaptedQueuePool):
+                samples[(name,)] = float(read(pool))
+        return samples
+
+    metrics.gauge(
+        "db_pool_size",
+        "Configured number of persistent connections",
+        lambda: collect(lambda pool: pool.size()),
+        ["pool"],
+    )
+    metrics.gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out",
+        lambda: collect(lambda pool: pool.checkedout()),
+        ["pool"],
+    )
+    metrics.gauge(
+        "db_pool_checked_in",
+        "Idle connections currently held by the pool",
+        lambda: collect(lambda pool: pool.checkedin()),
+        ["pool"],
+    )
+    # QueuePool.overflow() starts at -pool_size; clamp to the number of
+    # connections opened beyond pool_size.
+    metrics.gauge(
+        "db_pool_overflow",
+        "Connections open beyond pool_size",
+        lambda: collect(lambda pool: max(pool.overflow(), 0)),
+        ["pool"],
+    )
+
+
+@lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """Reduce SQL to its shape: literals and placeholders become ``?``.
+
+    Placeholder-only parenthesised lists (expanded ``IN`` lists, ``VALUES``
+    rows) collapse to ``(...)`` so their length does not create new shapes.
+    """
+    normalized = _WHITESPACE.sub(" ", statement).strip()
+    normalized = _STRING_LITERAL.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    return _PLACEHOLDER_LIST.sub("(...)", normalized)
+
+
+def redact_parameters(parameters: Any, *, executemany: bool = False) -> Any:
+    """Replace bound values with their type names for logging."""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return {key: _redact_value(value) for key, value in parameters.items()}
+    if isinstance(parameters, list | tuple):
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+def _redact_value(value: Any) -> str | None:
+    return None if value is None else f"<{type(value).__name__}>"
+
+
+def instrument_statements(
+    engine: AsyncEngine,
+    metrics: MetricsRegistry,
+    *,
+    slow_query_threshold: float,
+) -> None:
+    """Time every statement, keep a histogram per shape, log slow ones."""
+    durations = metrics.histogram(
+        "db_statement_seconds",
+        "Statement execution time by normalized statement",
+        ["statement"],
+        buckets=STATEMENT_BUCKETS,
+    )
+    labels: set[str] = set()
+
+    def label_for(normalized: str) -> str:
+        if normalized in labels:
+            return normalized
+        if len(labels) >= MAX_STATEMENT_LABELS:
+            return OTHER_STATEMENT_LABEL
+        labels.add(normalized)
+        return normalized
+
+    def finish(
+        conn: Any,
+        statement: str | None,
+        parameters: Any,
+        *,
+        executemany: bool,
+        error: BaseException | None = None,
+    ) -> None:
+        started = conn.info.get(_STATEMENT_STARTED_KEY)
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        normalized = normalize_statement(statement or "")
+        durations.observe(elapsed, statement=label_for(normalized))
+        if elapsed >= slow_query_threshold:
+            logger.warning(
+                "Slow query",
+                extra={
+                    "statement": normalized,
+                    "duration_ms": round(elapsed * 1000, 1),
+                    "parameters": redact_parameters(
+                        parameters, executemany=executemany
+                    ),
+                    "error": None if error is None else type(error).__name__,
+                },
+            )
+
+    def before_cursor_execute(conn: Any, *_: Any) -> None:
+        conn.info.setdefault(_STATEMENT_STARTED_KEY, []).append(time.perf_counter())
+
+    def after_cursor_execute(
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        _context: Any,
+        executemany: bool,
+    ) -> None:
+        finish(conn, statement, parameters, executemany=executemany)
+
+    def handle_error(exception_context: Any) -> None:
+        # Failed statements (e.g. cancelled by statement_timeout) never reach
+        # after_cursor_execute; time them here so the stack stays balanced.
+        if exception_context.connection is None:
+            return
+        finish(
+            exception_context.connection,
+            exception_context.statement,
+            exception_context.parameters,
+            executemany=bool(
+                exception_context.execution_context is not None
+                and exception_context.execution_context.executemany
+            ),
+            error=exception_context.original_exception,
+        )
+
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", after_cursor_execute)
+    event.listen(sync_engine, "handle_error", handle_error)
+
+
+@contextmanager
+def track_request_checkouts() -> Iterator[list[int]]:
+    """Count pool checkouts made by the current task and its children."""
+    counter = [0]
+    token = _request_checkouts.set(counter)
+    try:
+        yield counter
+    finally:
+        _request_checkouts.reset(token)
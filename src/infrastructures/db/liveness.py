@@ -0,0 +1,70 @@
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+import logging
+from typing import final
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.util import greenlet_spawn
+
+from src.infrastructures.db.instrumentation import InstrumentedQueuePool
+from src.infrastructures.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class IdleConnectionChecker:
+    """Pings idle pooled connections in the background.
+
+    Replaces ``pool_pre_ping``: checkouts no longer pay a round trip, and a
+    connection that dies between two sweeps is handled by the repository's
+    retry-once on disconnect.
+    """
+
+    engines: dict[str, AsyncEngine]
+    metrics: MetricsRegistry
+    interval: float = 30.0
+
+    _task: "asyncio.Task[None] | None" = field(default=None, init=False)
+
+    async def check_once(self) -> int:
+        invalidated_total = self.metrics.counter(
+            "db_idle_connections_invalidated_total",
+            "Idle pooled connections found dead by the background check",
+            ["pool"],
+        )
+        invalidated = 0
+        for name, engine in self.engines.items():
+            pool = engine.sync_engine.pool
+            if not isinstance(pool, InstrumentedQueuePool):
+                continue
+            count = await greenlet_spawn(pool.ping_idle)
+            if count:
+                invalidated_total.inc(count, pool=name)
+                logger.warning(
+                    "Invalidated dead idle connections",
+                    extra={"pool": name, "count": count},
+                )
+            invalidated += count
+        return invalidated
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.check_once()
+            except Exception:
+                logger.exception("Idle connection check failed")
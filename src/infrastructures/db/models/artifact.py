@@ -1,7 +1,27 @@
+from collections.abc import Mapping
 from datetime import UTC, datetime
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import DateTime, Index, String, Text, func
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    Column,
+    ColumnElement,
+    DateTime,
+    Dialect,
+    Index,
+    Row,
+    SmallInteger,
+    String,
+    Table,
+    Text,
+    TypeDecorator,
+    func,
+    literal_column,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, registry
 
@@ -11,13 +31,112 @@ from src.domain.value_objects.material import Material
 
 mapper_registry = registry()
 
+# "simple" avoids language-specific stemming: names and descriptions mix
+# Russian, English and transliterated terms.
+SEARCH_TS_CONFIG = "simple"
+
+# Stored smallint codes. Never renumber: existing rows keep their codes.
+# Era codes follow Era.chronology, so an era range is a contiguous code range
+# and uses ix_artifacts_era_created_at as an index range scan.
+ERA_CODES: dict[str, int] = {
+    "paleolithic": 1,
+    "neolithic": 2,
+    "bronze_age": 3,
+    "iron_age": 4,
+    "antiquity": 5,
+    "middle_ages": 6,
+    "modern": 7,
+}
+MATERIAL_CODES: dict[str, int] = {
+    "ceramic": 1,
+    "metal": 2,
+    "stone": 3,
+    "glass": 4,
+    "bone": 5,
+    "wood": 6,
+    "textile": 7,
+    "other": 8,
+}
+
+
+class SmallIntCode(TypeDecorator[str]):
+    """Stores one of a closed set of strings as its smallint code.
+
+    Bound parameters are translated too, so comparisons against plain strings
+    (``artifact_table.c.era >= "bronze_age"``) compare codes in SQL.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, codes: Mapping[str, int]) -> None:
+        super().__init__()
+        # Hashable, as cache_ok requires of constructor arguments
+        self.codes = tuple(codes.items())
+        self._by_value = dict(codes)
+        self._by_code = {code: value for value, code in codes.items()}
+
+    def process_bind_param(self, value: str | None, _dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        try:
+            return self._by_value[value]
+        except KeyError:
+            raise ValueError(f"No stored code for {value!r}") from None
+
+    def process_result_value(self, value: int | None, _dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return self._by_code[value]
+
 
 @mapper_registry.mapped
 class ArtifactModel:
+    # In Postgres the table is hash-partitioned by inventory_id (see migration
+    # 4f9a7c2e8b15). The partitioning is left out of the metadata on purpose:
+    # create_all() would emit a partitioned parent with no partitions to insert
+    # into, and queries are identical either way.
     __tablename__ = "artifacts"
     __table_args__ = (
         Index("ix_artifacts_name", "name"),
         Index("ix_artifacts_department", "department"),
+        Index("ix_artifacts_created_at_inventory_id", "created_at", "inventory_id"),
+        # Change feed order; see list_changes in the repository
+        Index("ix_artifacts_updated_at_inventory_id", "updated_at", "inventory_id"),
+        Index(
+            "ix_artifacts_department_created_at",
+            "department",
+            "created_at",
+            "inventory_id",
+        ),
+        Index("ix_artifacts_era_created_at", "era", "created_at", "inventory_id"),
+        Index(
+            "ix_artifacts_material_created_at",
+            "material",
+            "created_at",
+            "inventory_id",
+        ),
+        Index(
+            "ix_artifacts_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_artifacts_description_fts",
+            text(
+                f"to_tsvector('{SEARCH_TS_CONFIG}'::regconfig, "
+                "coalesce(description, ''))"
+            ),
+            postgresql_using="gin",
+        ),
+        CheckConstraint(
+            f"era BETWEEN 1 AND {len(ERA_CODES)}", name="ck_artifacts_era_code"
+        ),
+        CheckConstraint(
+            f"material BETWEEN 1 AND {len(MATERIAL_CODES)}",
+            name="ck_artifacts_material_code",
+        ),
     )
 
     def __init__(
@@ -57,9 +176,17 @@ class ArtifactModel:
     )
     name: Mapped[str] = mapped_column(String(length=255), nullable=False)
     department: Mapped[str] = mapped_column(String(length=255), nullable=False)
-    era: Mapped[str] = mapped_column(String(length=50), nullable=False)
-    material: Mapped[str] = mapped_column(String(length=50), nullable=False)
+    era: Mapped[str] = mapped_column(SmallIntCode(ERA_CODES), nullable=False)
+    material: Mapped[str] = mapped_column(SmallIntCode(MATERIAL_CODES), nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Database clock on purpose: the bulk loader sets it in SQL as well, and
+    # one clock keeps the change feed order consistent across write paths.
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
 
     def __repr__(self) -> str:
         return (
@@ -79,6 +206,24 @@ class ArtifactModel:
             description=self.description,
         )
 
+    @staticmethod
+    def entity_from_row(row: Row[Any]) -> ArtifactEntity:
+        """Build the entity straight from a Core row of ``artifact_table``.
+
+        Skips ORM instance construction, identity map and attribute
+        instrumentation, which dominate per-row cost on read-heavy paths.
+        """
+        return ArtifactEntity(
+            inventory_id=row.inventory_id,
+            created_at=row.created_at,
+            acquisition_date=row.acquisition_date,
+            name=row.name,
+            department=row.department,
+            era=Era(value=row.era),
+            material=Material(value=row.material),
+            description=row.description,
+        )
+
     @classmethod
     def from_dataclass(
         cls: type["ArtifactModel"], artifact: ArtifactEntity
@@ -93,3 +238,54 @@ class ArtifactModel:
             material=str(artifact.material),
             description=artifact.description,
         )
+
+
+artifact_table: Table = mapper_registry.metadata.tables[ArtifactModel.__tablename__]
+
+# Per-bucket artifact counts, kept in step with artifacts by every write path
+# (repository save and the bulk loader) in the same transaction. Buckets that
+# drop to zero are kept with a zero count.
+artifact_stats_table = Table(
+    "artifact_stats",
+    mapper_registry.metadata,
+    Column("dimension", String(length=32), primary_key=True),
+    Column("bucket", String(length=255), primary_key=True),
+    Column("artifact_count", BigInteger, nullable=False),
+)
+
+
+# HTTP validators (ETag, Last-Modified) of the museum API's last full payload
+# per artifact, sent back on refresh so unchanged artifacts answer 304. Kept
+# out of artifacts so storing them does not touch updated_at and re-emit the
+# artifact on the change feed.
+artifact_museum_validators_table = Table(
+    "artifact_museum_validators",
+    mapper_registry.metadata,
+    Column("inventory_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("etag", Text, nullable=True),
+    Column("last_modified", String(length=64), nullable=True),
+)
+
+
+# What was last published to the public catalog per artifact: a SHA-256 of the
+# publication payload and the public_id the catalog assigned, so identical
+# content is not sent again.
+artifact_catalog_publications_table = Table(
+    "artifact_catalog_publications",
+    mapper_registry.metadata,
+    Column("inventory_id", PG_UUID(as_uuid=True), primary_key=True),
+    Column("content_hash", String(length=64), nullable=False),
+    Column("public_id", String(length=255), nullable=False),
+)
+
+
+def description_tsvector() -> ColumnElement[Any]:
+    """Expression indexed by ``ix_artifacts_description_fts``.
+
+    Rendered with literals only, so the planner can match it to the index.
+    """
+    return func.to_tsvector(
+        literal_column(f"'{SEARCH_TS_CONFIG}'::regconfig"),
+        func.coalesce(artifact_table.c.description, literal_column("''")),
+        type_=TSVECTOR,
+    )
@@ -1,51 +1,426 @@
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
-from typing import final
+from datetime import datetime, timedelta
+from typing import Any, final
 from uuid import UUID
 
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy import (
+    Executable,
+    Interval,
+    Result,
+    Select,
+    and_,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    table,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import DBAPIError, IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from src.application.dtos.artifact import (
+    ArtifactListFilterDTO,
+    CatalogPublicationRecordDTO,
+    MuseumValidatorsDTO,
+)
+from src.application.dtos.pagination import (
+    ChangesCursorDTO,
+    KeysetCursorDTO,
+    SearchCursorDTO,
+)
+from src.application.exceptions import DeadlineExceededError
 from src.application.interfaces.repositories import ArtifactRepositoryProtocol
 from src.domain.entities.artifact import ArtifactEntity
 from src.infrastructures.db.exceptions import (
     RepositoryConflictError,
+    RepositoryReadError,
     RepositorySaveError,
 )
-from src.infrastructures.db.models.artifact import ArtifactModel
+from src.infrastructures.db.models.artifact import (
+    SEARCH_TS_CONFIG,
+    ArtifactModel,
+    artifact_catalog_publications_table,
+    artifact_museum_validators_table,
+    artifact_stats_table,
+    artifact_table,
+    description_tsvector,
+)
+from src.infrastructures.db.repositories.artifact_stats import (
+    StatsKey,
+    apply_stats_delta,
+    entity_stats_keys,
+    stats_delta,
+    stats_keys,
+)
+from src.infrastructures.db.routing import pin_to_primary
+from src.infrastructures.deadline import within_deadline
+
+# The columns of the server's session view the change feed horizon needs
+pg_stat_activity = table(
+    "pg_stat_activity",
+    column("pid"),
+    column("datname"),
+    column("backend_type"),
+    column("xact_start"),
+)
 
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
     session: AsyncSession
+    retry_reads_on_disconnect: bool = False
 
     async def get_by_inventory_id(
         self, inventory_id: str | UUID
     ) -> ArtifactEntity | None:
         try:
-            stmt = select(ArtifactModel).where(
-                ArtifactModel.inventory_id == inventory_id
+            stmt = select(artifact_table).where(
+                artifact_table.c.inventory_id == inventory_id
             )
-            result = await self.session.execute(stmt)
-            artifact_model = result.scalar_one_or_none()
-            if artifact_model is None:
+            result = await self._execute_read(stmt)
+            row = result.one_or_none()
+            if row is None:
                 return None
-            return artifact_model.to_dataclass()
+            return ArtifactModel.entity_from_row(row)
         except SQLAlchemyError as e:
-            raise RepositorySaveError(
+            raise RepositoryReadError(
                 f"Failed to retrieve artifact by inventory_id '{inventory_id}': {e}"
             ) from e
 
+    async def get_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> list[ArtifactEntity]:
+        if not inventory_ids:
+            return []
+        try:
+            stmt = select(artifact_table).where(
+                artifact_table.c.inventory_id.in_(inventory_ids)
+            )
+            result = await self._execute_read(stmt)
+            return [ArtifactModel.entity_from_row(row) for row in result]
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(
+                f"Failed to retrieve {len(inventory_ids)} artifacts by inventory_id: {e}"
+            ) from e
+
+    async def list_artifacts(
+        self,
+        filters: ArtifactListFilterDTO,
+        *,
+        after: KeysetCursorDTO | None = None,
+        limit: int,
+    ) -> list[ArtifactEntity]:
+        columns = artifact_table.c
+        stmt = _apply_filters(select(artifact_table), filters)
+        if after is not None:
+            # Row-value comparison lets Postgres seek straight into the
+            # (…, created_at, inventory_id) indexes instead of skipping rows.
+            stmt = stmt.where(
+                tuple_(columns.created_at, columns.inventory_id)
+                > tuple_(after.created_at, after.inventory_id)
+            )
+        stmt = stmt.order_by(columns.created_at, columns.inventory_id).limit(limit)
+
+        try:
+            result = await self._execute_read(stmt)
+            return [ArtifactModel.entity_from_row(row) for row in result]
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(f"Failed to list artifacts: {e}") from e
+
+    async def stream_artifacts(
+        self, filters: ArtifactListFilterDTO, *, batch_size: int = 1000
+    ) -> AsyncIterator[ArtifactEntity]:
+        columns = artifact_table.c
+        stmt = (
+            _apply_filters(select(artifact_table), filters)
+            .order_by(columns.created_at, columns.inventory_id)
+            # Server-side cursor: only batch_size rows are buffered at a time
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            result = await self.session.stream(stmt)
+            async for row in result:
+                yield ArtifactModel.entity_from_row(row)
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(f"Failed to stream artifacts: {e}") from e
+
+    async def change_feed_horizon(self, settle_window: timedelta) -> datetime:
+        # updated_at is the writer's transaction start, so no transaction still
+        # open can commit a row older than its start. Any open transaction
+        # counts, not only those with an xid: a writer gets one at its first
+        # write, but stamps its rows with when it began. Only sessions the
+        # role may inspect are seen, i.e. the application's own or all with
+        # pg_read_all_stats. Both this and list_changes run on the primary,
+        # which is where the writers are and has no replay lag.
+        pin_to_primary(self.session)
+        oldest_open = (
+            select(func.min(pg_stat_activity.c.xact_start))
+            .where(
+                pg_stat_activity.c.datname == func.current_database(),
+                pg_stat_activity.c.backend_type == "client backend",
+                pg_stat_activity.c.pid != func.pg_backend_pid(),
+            )
+            .scalar_subquery()
+        )
+        # least() ignores the NULL when no other transaction is open
+        stmt = select(
+            func.least(func.now() - literal(settle_window, Interval()), oldest_open)
+        )
+        try:
+            result = await self._execute_read(stmt)
+            horizon: datetime = result.scalar_one()
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(
+                f"Failed to compute the change feed horizon: {e}"
+            ) from e
+        return horizon
+
+    async def list_changes(
+        self,
+        *,
+        after: ChangesCursorDTO | None = None,
+        until: datetime,
+        limit: int,
+    ) -> list[tuple[ArtifactEntity, datetime]]:
+        pin_to_primary(self.session)
+        columns = artifact_table.c
+        stmt = select(artifact_table).where(columns.updated_at < until)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(columns.updated_at, columns.inventory_id)
+                > tuple_(after.updated_at, after.inventory_id)
+            )
+        stmt = stmt.order_by(columns.updated_at, columns.inventory_id).limit(limit)
+
+        try:
+            result = await self._execute_read(stmt)
+            return [
+                (ArtifactModel.entity_from_row(row), row.updated_at) for row in result
+            ]
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(f"Failed to list artifact changes: {e}") from e
+
+    async def search(
+        self,
+        query: str,
+        *,
+        after: SearchCursorDTO | None = None,
+        limit: int,
+    ) -> list[tuple[ArtifactEntity, float]]:
+        ts_query = func.websearch_to_tsquery(
+            literal_column(f"'{SEARCH_TS_CONFIG}'::regconfig"), query
+        )
+        ts_vector = description_tsvector()
+        pattern = "%" + _escape_like(query) + "%"
+
+        # Each branch is served by a GIN index: ILIKE and % by the trigram
+        # index on name, @@ by the tsvector index on description.
+        matches = or_(
+            artifact_table.c.name.ilike(pattern, escape="\\"),
+            artifact_table.c.name.op("%")(query),
+            ts_vector.op("@@")(ts_query),
+        )
+        score = func.greatest(
+            func.word_similarity(query, artifact_table.c.name),
+            func.ts_rank_cd(ts_vector, ts_query),
+        )
+
+        stmt = select(artifact_table, score.label("score")).where(matches)
+        if after is not None:
+            stmt = stmt.where(
+                or_(
+                    score < after.score,
+                    and_(
+                        score == after.score,
+                        artifact_table.c.inventory_id > after.inventory_id,
+                    ),
+                )
+            )
+        stmt = stmt.order_by(score.desc(), artifact_table.c.inventory_id).limit(limit)
+
+        try:
+            result = await self._execute_read(stmt)
+            return [
+                (ArtifactModel.entity_from_row(row), float(row.score)) for row in result
+            ]
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(
+                f"Failed to search artifacts for {query!r}: {e}"
+            ) from e
+
+    async def get_collection_stats(self) -> dict[str, dict[str, int]]:
+        stats = artifact_stats_table.c
+        stmt = select(stats.dimension, stats.bucket, stats.artifact_count).where(
+            stats.artifact_count > 0
+        )
+        try:
+            result = await self._execute_read(stmt)
+            counts: dict[str, dict[str, int]] = {}
+            for row in result:
+                counts.setdefault(row.dimension, {})[row.bucket] = row.artifact_count
+            return counts
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(f"Failed to read collection stats: {e}") from e
+
+    async def get_museum_validators(
+        self, inventory_ids: Sequence[UUID]
+    ) -> dict[UUID, MuseumValidatorsDTO]:
+        if not inventory_ids:
+            return {}
+        validators = artifact_museum_validators_table.c
+        stmt = select(artifact_museum_validators_table).where(
+            validators.inventory_id.in_(inventory_ids)
+        )
+        try:
+            result = await self._execute_read(stmt)
+            return {
+                row.inventory_id: MuseumValidatorsDTO(
+                    etag=row.etag, last_modified=row.last_modified
+                )
+                for row in result
+            }
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(
+                f"Failed to read museum validators of {len(inventory_ids)} artifacts: {e}"
+            ) from e
+
+    async def save_museum_validators(
+        self, inventory_id: UUID, validators: MuseumValidatorsDTO
+    ) -> None:
+        pin_to_primary(self.session)
+        stmt = pg_insert(artifact_museum_validators_table).values(
+            inventory_id=inventory_id,
+            etag=validators.etag,
+            last_modified=validators.last_modified,
+        )
+        try:
+            async with within_deadline():
+                await self.session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[
+                            artifact_museum_validators_table.c.inventory_id
+                        ],
+                        set_={
+                            "etag": stmt.excluded.etag,
+                            "last_modified": stmt.excluded.last_modified,
+                        },
+                    )
+                )
+                await self.session.commit()
+        except DeadlineExceededError:
+            await self.session.rollback()
+            raise
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositorySaveError(
+                f"Failed to save museum validators of '{inventory_id}': {e}"
+            ) from e
+
+    async def get_catalog_publication(
+        self, inventory_id: UUID
+    ) -> CatalogPublicationRecordDTO | None:
+        stmt = select(artifact_catalog_publications_table).where(
+            artifact_catalog_publications_table.c.inventory_id == inventory_id
+        )
+        try:
+            result = await self._execute_read(stmt)
+            row = result.one_or_none()
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(
+                f"Failed to read catalog publication of '{inventory_id}': {e}"
+            ) from e
+        if row is None:
+            return None
+        return CatalogPublicationRecordDTO(
+            inventory_id=row.inventory_id,
+            content_hash=row.content_hash,
+            public_id=row.public_id,
+        )
+
+    async def save_catalog_publication(
+        self, publication: CatalogPublicationRecordDTO
+    ) -> None:
+        pin_to_primary(self.session)
+        stmt = pg_insert(artifact_catalog_publications_table).values(
+            inventory_id=publication.inventory_id,
+            content_hash=publication.content_hash,
+            public_id=publication.public_id,
+        )
+        try:
+            async with within_deadline():
+                await self.session.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[
+                            artifact_catalog_publications_table.c.inventory_id
+                        ],
+                        set_={
+                            "content_hash": stmt.excluded.content_hash,
+                            "public_id": stmt.excluded.public_id,
+                        },
+                    )
+                )
+                await self.session.commit()
+        except DeadlineExceededError:
+            await self.session.rollback()
+            raise
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositorySaveError(
+                "Failed to save catalog publication of "
+                f"'{publication.inventory_id}': {e}"
+            ) from e
+
+    async def _execute_read(self, stmt: Executable) -> Result[Any]:
+        # The deadline covers the pool wait as well as the query itself
+        async with within_deadline():
+            try:
+                return await self.session.execute(stmt)
+            except DBAPIError as e:
+                if not (self.retry_reads_on_disconnect and e.connection_invalidated):
+                    raise
+            # The connection died since the last idle check. Reads are safe to
+            # repeat, and save() never leaves uncommitted work in the session,
+            # so discard the broken transaction and retry once on a new one.
+            await self.session.rollback()
+            return await self.session.execute(stmt)
+
     async def save(self, artifact: ArtifactEntity) -> None:
+        # The existence check must see the primary, and later reads in this
+        # session must too, or they could miss the row we are writing.
+        pin_to_primary(self.session)
         try:
-            stmt = select(ArtifactModel).where(
-                ArtifactModel.inventory_id == artifact.inventory_id
+            async with within_deadline():
+                await self._save(artifact)
+        except DeadlineExceededError:
+            await self.session.rollback()
+            raise
+
+    async def _save(self, artifact: ArtifactEntity) -> None:
+        try:
+            # Locked so a concurrent update cannot subtract the same old
+            # stats buckets twice.
+            stmt = (
+                select(ArtifactModel)
+                .where(ArtifactModel.inventory_id == artifact.inventory_id)
+                .with_for_update()
             )
             result = await self.session.execute(stmt)
             model = result.scalar_one_or_none()
 
+            previous: tuple[StatsKey, ...] = ()
             if model:
+                previous = stats_keys(
+                    department=model.department,
+                    era=model.era,
+                    material=model.material,
+                    acquisition_date=model.acquisition_date,
+                )
                 model.name = artifact.name
                 model.era = artifact.era.value
                 model.material = artifact.material.value
@@ -56,6 +431,9 @@ class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
                 model = ArtifactModel.from_dataclass(artifact)
 
             self.session.add(model)
+            await apply_stats_delta(
+                self.session, stats_delta(entity_stats_keys(artifact), previous)
+            )
             await self.session.commit()
         except IntegrityError as e:
             await self.session.rollback()
@@ -72,3 +450,27 @@ class ArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
             raise RepositorySaveError(
                 f"Unexpected error while saving artifact '{artifact.inventory_id}': {e}"
             ) from e
+
+
+def _apply_filters(stmt: Select[Any], filters: ArtifactListFilterDTO) -> Select[Any]:
+    columns = artifact_table.c
+    if filters.department is not None:
+        stmt = stmt.where(columns.department == filters.department)
+    if filters.era is not None:
+        stmt = stmt.where(columns.era == filters.era.value)
+    # Compared as chronological smallint codes, see ERA_CODES
+    if filters.era_from is not None:
+        stmt = stmt.where(columns.era >= filters.era_from.value)
+    if filters.era_to is not None:
+        stmt = stmt.where(columns.era <= filters.era_to.value)
+    if filters.material is not None:
+        stmt = stmt.where(columns.material == filters.material.value)
+    if filters.acquired_from is not None:
+        stmt = stmt.where(columns.acquisition_date >= filters.acquired_from)
+    if filters.acquired_to is not None:
+        stmt = stmt.where(columns.acquisition_date <= filters.acquired_to)
+    return stmt
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -0,0 +1,138 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import final
+
+from sqlalchemy import column, func, select, table, text, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.repositories import ArtifactBulkLoaderProtocol
+from src.domain.entities.artifact import ArtifactEntity
+from src.infrastructures.db.exceptions import RepositorySaveError
+from src.infrastructures.db.models.artifact import (
+    ERA_CODES,
+    MATERIAL_CODES,
+    artifact_table,
+)
+from src.infrastructures.db.repositories.artifact_stats import (
+    apply_stats_delta,
+    entity_stats_keys,
+    stats_delta,
+    stats_keys,
+)
+from src.infrastructures.db.routing import pin_to_primary
+
+STAGING_TABLE = "artifacts_import_staging"
+
+COPY_COLUMNS = (
+    "inventory_id",
+    "created_at",
+    "acquisition_date",
+    "name",
+    "department",
+    "era",
+    "material",
+    "description",
+)
+
+# ON COMMIT DELETE ROWS empties the staging table after every batch while
+# keeping it around for the next batch on the same connection.
+CREATE_STAGING_SQL = text(
+    f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+    f"(LIKE {artifact_table.name} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+)
+
+_staging = table(STAGING_TABLE, *(column(name) for name in COPY_COLUMNS))
+_upsert = pg_insert(artifact_table).from_select(
+    COPY_COLUMNS, select(*(_staging.c[name] for name in COPY_COLUMNS))
+)
+_UPDATED_COLUMNS = [
+    name for name in COPY_COLUMNS if name not in {"inventory_id", "created_at"}
+]
+# created_at is kept from the first load; re-importing a row updates the
+# descriptive columns only. Unchanged rows are skipped entirely, so a repeated
+# import neither bumps updated_at (the change feed) nor writes dead tuples.
+MERGE_STMT = _upsert.on_conflict_do_update(
+    index_elements=[artifact_table.c.inventory_id],
+    set_={
+        **{name: _upsert.excluded[name] for name in _UPDATED_COLUMNS},
+        "updated_at": func.now(),
+    },
+    where=tuple_(
+        *(artifact_table.c[name] for name in _UPDATED_COLUMNS)
+    ).is_distinct_from(tuple_(*(_upsert.excluded[name] for name in _UPDATED_COLUMNS))),
+)
+# Current values of the rows the batch is about to overwrite, locked until
+# commit so the stats delta computed from them stays correct.
+PREVIOUS_STMT = (
+    select(
+        artifact_table.c.department,
+        artifact_table.c.era,
+        artifact_table.c.material,
+        artifact_table.c.acquisition_date,
+    )
+    .join(_staging, _staging.c.inventory_id == artifact_table.c.inventory_id)
+    .with_for_update(of=artifact_table)
+)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ArtifactBulkLoaderPostgres(ArtifactBulkLoaderProtocol):
+    """Loads batches with COPY into a staging table, then upserts them."""
+
+    session: AsyncSession
+
+    async def load(self, artifacts: Sequence[ArtifactEntity]) -> int:
+        # ON CONFLICT cannot touch one row twice in a statement: keep the
+        # last occurrence of each inventory_id in the batch.
+        unique = {artifact.inventory_id: artifact for artifact in artifacts}
+        # COPY bypasses SQLAlchemy column types, so encode era/material here
+        records = [
+            (
+                artifact.inventory_id,
+                artifact.created_at,
+                artifact.acquisition_date,
+                artifact.name,
+                artifact.department,
+                ERA_CODES[artifact.era.value],
+                MATERIAL_CODES[artifact.material.value],
+                artifact.description,
+            )
+            for artifact in unique.values()
+        ]
+        pin_to_primary(self.session)
+        try:
+            connection = await self.session.connection()
+            await connection.execute(CREATE_STAGING_SQL)
+            raw_connection = await connection.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            if driver_connection is None:
+                raise RuntimeError("Connection was invalidated before COPY")
+            # asyncpg binary COPY; runs inside the transaction opened above
+            await driver_connection.copy_records_to_table(
+                STAGING_TABLE, records=records, columns=COPY_COLUMNS
+            )
+            previous = await connection.execute(PREVIOUS_STMT)
+            await apply_stats_delta(
+                connection,
+                stats_delta(
+                    (key for a in unique.values() for key in entity_stats_keys(a)),
+                    (key for row in previous.mappings() for key in stats_keys(**row)),
+                ),
+            )
+            await connection.execute(MERGE_STMT)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            raise RepositorySaveError(
+                f"Failed to bulk load {len(records)} artifacts: {e}"
+            ) from e
+        except Exception as e:
+            # COPY goes straight to asyncpg, so its errors are not wrapped
+            await self.session.rollback()
+            raise RepositorySaveError(
+                f"Unexpected error while bulk loading {len(records)} artifacts: {e}"
+            ) from e
+        return len(records)
@@ -0,0 +1,70 @@
+from collections import Counter
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from src.domain.entities.artifact import ArtifactEntity
+from src.infrastructures.db.models.artifact import artifact_stats_table
+
+StatsKey = tuple[str, str]
+
+
+def stats_keys(
+    *, department: str, era: str, material: str, acquisition_date: datetime
+) -> tuple[StatsKey, ...]:
+    """Return the ``artifact_stats`` buckets one artifact is counted in."""
+    # Naive values only come from SQLite, which stores them as UTC
+    if acquisition_date.tzinfo is not None:
+        acquisition_date = acquisition_date.astimezone(UTC)
+    return (
+        ("department", department),
+        ("era", era),
+        ("material", material),
+        ("acquisition_year", str(acquisition_date.year)),
+    )
+
+
+def entity_stats_keys(artifact: ArtifactEntity) -> tuple[StatsKey, ...]:
+    return stats_keys(
+        department=artifact.department,
+        era=artifact.era.value,
+        material=artifact.material.value,
+        acquisition_date=artifact.acquisition_date,
+    )
+
+
+def stats_delta(
+    added: Iterable[StatsKey], removed: Iterable[StatsKey]
+) -> Counter[StatsKey]:
+    delta = Counter(added)
+    delta.subtract(removed)
+    return delta
+
+
+async def apply_stats_delta(
+    executor: AsyncSession | AsyncConnection, delta: Counter[StatsKey]
+) -> None:
+    """Add ``delta`` to the stored counts inside the caller's transaction."""
+    # Sorted so concurrent writers lock the stats rows in the same order
+    rows = [
+        {"dimension": dimension, "bucket": bucket, "artifact_count": count}
+        for (dimension, bucket), count in sorted(delta.items())
+        if count
+    ]
+    if not rows:
+        return
+    stmt = pg_insert(artifact_stats_table).values(rows)
+    await executor.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[
+                artifact_stats_table.c.dimension,
+                artifact_stats_table.c.bucket,
+            ],
+            set_={
+                "artifact_count": artifact_stats_table.c.artifact_count
+                + stmt.excluded.artifact_count
+            },
+        )
+    )
@@ -0,0 +1,162 @@
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+import itertools
+import logging
+import math
+from typing import Any, final
+
+from sqlalchemy import Connection, Delete, Engine, Insert, Update, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PIN_PRIMARY_KEY = "pin_primary"
+REPLICA_KEY = "replica"
+
+# Whether the server is a standby, whether its WAL receiver is streaming
+# from the primary, whether it has replayed all WAL it has received, and how
+# long ago the last replayed transaction committed. pg_stat_wal_receiver
+# shows the status only to roles with pg_read_all_stats (e.g. via
+# pg_monitor); without it every replica reads as disconnected.
+REPLICA_LAG_SQL = text(
+    "SELECT pg_is_in_recovery(), "
+    "(SELECT status = 'streaming' FROM pg_stat_wal_receiver), "
+    "pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn(), "
+    "EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())"
+)
+
+
+def replica_lag(
+    in_recovery: bool,
+    streaming: bool | None,
+    caught_up: bool | None,
+    replay_delay: float | None,
+) -> float:
+    """Seconds a server is behind its primary.
+
+    The time since the last replayed commit only measures lag while replay
+    is behind: on a caught-up standby it keeps growing whenever the primary
+    has no writes, so a caught-up standby reports 0. Being caught up only
+    means something while WAL is still arriving: a standby whose receiver
+    is not streaming has replayed everything it got and falls further
+    behind unseen, so its lag is unbounded.
+    """
+    if not in_recovery:
+        return 0.0
+    if not streaming:
+        return math.inf
+    if caught_up:
+        return 0.0
+    return float(replay_delay or 0.0)
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class ReplicaRouter:
+    """Tracks replica health and picks the engine a read should use."""
+
+    primary: AsyncEngine
+    replicas: list[AsyncEngine] = field(default_factory=list)
+    max_lag_seconds: float = 5.0
+    check_interval: float = 10.0
+    check_timeout: float = 2.0
+
+    _healthy: list[AsyncEngine] = field(default_factory=list, init=False)
+    _cycle: "itertools.cycle[AsyncEngine] | None" = field(default=None, init=False)
+    _task: "asyncio.Task[None] | None" = field(default=None, init=False)
+
+    def pick_read_engine(self) -> AsyncEngine:
+        if not self._healthy or self._cycle is None:
+            return self.primary
+        return next(self._cycle)
+
+    def set_healthy(self, replicas: list[AsyncEngine]) -> None:
+        if replicas == self._healthy:
+            return
+        self._healthy = replicas
+        self._cycle = itertools.cycle(replicas) if replicas else None
+        logger.info(
+            "Replica set changed",
+            extra={"healthy": len(replicas), "total": len(self.replicas)},
+        )
+
+    async def check_replicas(self) -> None:
+        results = await asyncio.gather(
+            *(self._is_usable(replica) for replica in self.replicas)
+        )
+        self.set_healthy(
+            [replica for replica, ok in zip(self.replicas, results, strict=True) if ok]
+        )
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        for engine in (self.primary, *self.replicas):
+            await engine.dispose()
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_replicas()
+            await asyncio.sleep(self.check_interval)
+
+    async def _is_usable(self, replica: AsyncEngine) -> bool:
+        try:
+            async with asyncio.timeout(self.check_timeout):
+                async with replica.connect() as conn:
+                    row = (await conn.execute(REPLICA_LAG_SQL)).one()
+            lag = replica_lag(*row)
+        except (TimeoutError, OSError, SQLAlchemyError) as e:
+            logger.warning(
+                "Replica health check failed",
+                extra={"replica": replica.url.host, "error": str(e)},
+            )
+            return False
+        if lag > self.max_lag_seconds:
+            logger.warning(
+                "Replica lag above threshold",
+                extra={"replica": replica.url.host, "lag_seconds": lag},
+            )
+            return False
+        return True
+
+
+class RoutingSession(Session):
+    """Sends reads to a replica and writes to the primary.
+
+    The replica is chosen once per session so a request sees one snapshot
+    source. After the first write (or an explicit ``pin_to_primary``) every
+    later statement in the session goes to the primary, which gives the
+    session read-your-writes.
+    """
+
+    def __init__(self, *, router: ReplicaRouter | None = None, **kw: Any) -> None:
+        super().__init__(**kw)
+        self.router = router
+
+    def get_bind(
+        self, mapper: Any = None, *, clause: Any = None, **kw: Any
+    ) -> Engine | Connection:
+        if self.router is None:
+            return super().get_bind(mapper, clause=clause, **kw)
+        if self._flushing or isinstance(clause, Insert | Update | Delete):
+            self.info[PIN_PRIMARY_KEY] = True
+        if self.info.get(PIN_PRIMARY_KEY):
+            return self.router.primary.sync_engine
+        if REPLICA_KEY not in self.info:
+            self.info[REPLICA_KEY] = self.router.pick_read_engine()
+        engine: AsyncEngine = self.info[REPLICA_KEY]
+        return engine.sync_engine
+
+
+def pin_to_primary(session: AsyncSession) -> None:
+    session.info[PIN_PRIMARY_KEY] = True
@@ -1,26 +1,99 @@
+import logging
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
+
+from src.infrastructures.db.instrumentation import InstrumentedQueuePool
+from src.infrastructures.db.routing import ReplicaRouter, RoutingSession
+
+logger = logging.getLogger(__name__)
+
+
+def pgbouncer_connect_args() -> dict[str, Any]:
+    """Return asyncpg options for PgBouncer in transaction pooling mode.
+
+    Consecutive transactions may land on different server connections, so
+    prepared statements must neither be cached per client connection nor
+    reuse names another client may already have prepared on that server.
+    """
+    return {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+    }
 
 
-def create_engine(url: str, is_echo: bool = True) -> AsyncEngine:
+def create_engine(
+    url: str,
+    is_echo: bool = True,
+    *,
+    pool_size: int = 20,
+    max_overflow: int = 30,
+    pool_timeout: float = 30.0,
+    pool_recycle: int = 3600,
+    pool_pre_ping: bool = True,
+    pgbouncer: bool = False,
+    statement_timeout_ms: int = 0,
+) -> AsyncEngine:
+    is_asyncpg = make_url(url).get_driver_name() == "asyncpg"
+    connect_args: dict[str, Any] = {}
+    if pgbouncer:
+        if not is_asyncpg:
+            raise ValueError("PgBouncer mode requires the postgresql+asyncpg driver")
+        connect_args.update(pgbouncer_connect_args())
+    if statement_timeout_ms > 0 and is_asyncpg:
+        if pgbouncer:
+            # PgBouncer rejects unknown startup parameters
+            logger.warning(
+                "statement_timeout is not sent through PgBouncer; "
+                "set it on the database role instead",
+                extra={"statement_timeout_ms": statement_timeout_ms},
+            )
+        else:
+            connect_args["server_settings"] = {
+                "statement_timeout": str(statement_timeout_ms)
+            }
+    options: dict[str, Any] = {"connect_args": connect_args} if connect_args else {}
+    # pool_size=0 leaves pooling to PgBouncer: every checkout opens a new
+    # client connection, which is cheap when PgBouncer is local.
+    if pool_size == 0:
+        return create_async_engine(url=url, echo=is_echo, poolclass=NullPool, **options)
     return create_async_engine(
         url=url,
         echo=is_echo,
-        pool_size=20,
-        max_overflow=30,
-        pool_pre_ping=True,
-        pool_recycle=3600,
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_pre_ping=pool_pre_ping,
+        pool_recycle=pool_recycle,
+        **options,
     )
 
 
-def get_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+def get_session_factory(
+    engine: AsyncEngine, router: ReplicaRouter | None = None
+) -> async_sessionmaker[AsyncSession]:
+    if router is None or not router.replicas:
+        return async_sessionmaker(
+            bind=engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
     return async_sessionmaker(
         bind=engine,
         class_=AsyncSession,
+        sync_session_class=RoutingSession,
         expire_on_commit=False,
         autoflush=False,
+        router=router,
     )
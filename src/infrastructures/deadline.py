@@ -0,0 +1,57 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+import time
+
+from src.application.exceptions import DeadlineExceededError
+
+# Absolute time.monotonic() by which the current request must be answered.
+# Set by the HTTP middleware; unset (None) for the CLI and background work.
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(seconds: float) -> Iterator[float]:
+    """Give the current task and the tasks it starts ``seconds`` to finish.
+
+    A nested deadline can only shorten the one already in effect.
+    """
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Seconds left before the request deadline, or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@asynccontextmanager
+async def within_deadline() -> AsyncIterator[None]:
+    """Cancel the enclosed awaits once the request deadline passes.
+
+    Raises :class:`DeadlineExceededError` instead of starting work when the
+    budget is already spent, and when it runs out part way through.
+    """
+    left = remaining()
+    if left is None:
+        yield
+        return
+    if left <= 0:
+        raise DeadlineExceededError("Request deadline exceeded")
+    timeout = asyncio.timeout(left)
+    try:
+        async with timeout:
+            yield
+    except TimeoutError as e:
+        if not timeout.expired():
+            raise
+        raise DeadlineExceededError("Request deadline exceeded") from e
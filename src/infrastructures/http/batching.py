@@ -0,0 +1,122 @@
+import asyncio
+import contextvars
+import logging
+from typing import TYPE_CHECKING, final
+
+from src.application.dtos.artifact import ArtifactCatalogPublicationDTO
+from src.application.interfaces.http_clients import PublicCatalogAPIProtocol
+from src.infrastructures.deadline import within_deadline
+from src.infrastructures.http.clients import PublicCatalogAPIClient
+from src.infrastructures.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+
+Pending = tuple[ArtifactCatalogPublicationDTO, asyncio.Future[str]]
+
+
+@final
+class BatchingCatalogPublisher(PublicCatalogAPIProtocol):
+    """Publishes artifacts through the catalog's bulk endpoint.
+
+    Callers wait until ``max_batch_size`` artifacts are queued or the oldest
+    has waited ``linger`` seconds; one bulk request then carries the batch and
+    every caller gets the public_id of its own artifact, or the batch's error.
+    Each caller's wait is bounded by its own request deadline; the bulk
+    request itself runs outside any one request's deadline.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: PublicCatalogAPIClient,
+        metrics: MetricsRegistry,
+        max_batch_size: int = 100,
+        linger: float = 0.05,
+    ) -> None:
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self.linger = linger
+        self._pending: list[Pending] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task[None]] = set()
+        self._batch_sizes = metrics.histogram(
+            "catalog_publish_batch_size",
+            "Artifacts per bulk catalog publish, by what triggered the flush",
+            labelnames=("trigger",),
+            buckets=BATCH_SIZE_BUCKETS,
+        )
+
+    async def publish_artifact(self, artifact: ArtifactCatalogPublicationDTO) -> str:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        self._pending.append((artifact, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush("size")
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush, "linger")
+        # A caller that gives up cancels its future, which leaves its
+        # artifact out if the batch has not been sent yet.
+        async with within_deadline():
+            return await future
+
+    async def aclose(self) -> None:
+        """Send what is still queued and wait for batches in flight."""
+        self._flush("close")
+        if self._sending:
+            await asyncio.gather(*self._sending, return_exceptions=True)
+
+    def _flush(self, trigger: str) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        # A fresh context, so the request that happened to fill the batch
+        # does not impose its deadline on everyone else's artifacts.
+        task = asyncio.get_running_loop().create_task(
+            self._send(batch, trigger), context=contextvars.Context()
+        )
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: list[Pending], trigger: str) -> None:
+        waiting = [
+            (artifact, future) for artifact, future in batch if not future.done()
+        ]
+        # The same artifact requested twice in a batch is published once
+        artifacts: dict[UUID, ArtifactCatalogPublicationDTO] = {
+            artifact.inventory_id: artifact for artifact, _ in waiting
+        }
+        if not artifacts:
+            return
+        self._batch_sizes.observe(len(artifacts), trigger=trigger)
+
+        try:
+            public_ids = await self.client.publish_artifacts(list(artifacts.values()))
+        except Exception as e:  # noqa: BLE001 - handed to every caller instead
+            logger.warning(
+                "Bulk catalog publish of %d artifacts failed: %s", len(artifacts), e
+            )
+            for _, future in waiting:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for artifact, future in waiting:
+            if future.done():
+                continue
+            public_id = public_ids.get(artifact.inventory_id)
+            if public_id is None:
+                future.set_exception(
+                    ValueError(
+                        f"Catalog did not publish artifact {artifact.inventory_id}"
+                    )
+                )
+            else:
+                future.set_result(public_id)
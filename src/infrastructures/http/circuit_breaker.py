@@ -0,0 +1,200 @@
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import StrEnum
+import logging
+import math
+import time
+from typing import final
+
+import httpx
+
+from src.application.exceptions import UpstreamUnavailableError
+from src.infrastructures.deadline import remaining
+from src.infrastructures.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+# Exported as a number so dashboards can graph and alert on it
+STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Count transport errors and 5xx/429 replies, not the caller's 4xx."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(exc, httpx.TransportError)
+
+
+@final
+class CircuitBreaker:
+    """Stops calling an upstream that keeps failing or answering slowly.
+
+    Outcomes of the last ``window_size`` calls are kept. Once at least
+    ``minimum_calls`` are recorded and the failure or slow-call rate reaches
+    its threshold, the circuit opens and calls fail at once with
+    :class:`UpstreamUnavailableError`. After ``open_duration`` seconds up to
+    ``half_open_probes`` calls are let through: if all succeed the circuit
+    closes, a single failure opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        upstream: str,
+        metrics: MetricsRegistry,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_seconds: float = 2.0,
+        slow_call_rate_threshold: float = 0.8,
+        open_duration: float = 30.0,
+        half_open_probes: int = 3,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.upstream = upstream
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_seconds = slow_call_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._outcomes: deque[tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self._transitions = metrics.counter(
+            "http_client_circuit_transitions_total",
+            "Circuit breaker state changes",
+            labelnames=("upstream", "state"),
+        )
+        self._rejected = metrics.counter(
+            "http_client_circuit_rejected_total",
+            "Outbound calls refused while the circuit was open",
+            labelnames=("upstream",),
+        )
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+        return self._state
+
+    def allows_calls(self) -> bool:
+        state = self.state
+        if state is CircuitState.HALF_OPEN:
+            return self._probes_started < self.half_open_probes
+        return state is CircuitState.CLOSED
+
+    @asynccontextmanager
+    async def call(self) -> AsyncIterator[None]:
+        if not self.allows_calls():
+            self._rejected.inc(upstream=self.upstream)
+            retry_in = max(0.0, self._opened_at + self.open_duration - self._clock())
+            raise UpstreamUnavailableError(
+                f"{self.upstream} API circuit is open, retry in {math.ceil(retry_in)}s"
+            )
+        probing = self._state is CircuitState.HALF_OPEN
+        if probing:
+            self._probes_started += 1
+        started = self._clock()
+        try:
+            yield
+        except Exception as exc:
+            self._record(
+                failed=is_upstream_failure(exc), elapsed=self._clock() - started
+            )
+            raise
+        except BaseException:
+            elapsed = self._clock() - started
+            left = remaining()
+            if left is not None and left <= 0 and elapsed >= self.slow_call_seconds:
+                # Cut off by the request deadline after running as long as a
+                # slow call: the hang the breaker exists to notice. Shorter
+                # cutoffs only reflect the budget the client chose.
+                self._record(failed=False, elapsed=elapsed)
+                raise
+            # Otherwise cancelled by the caller: says nothing about the upstream
+            if probing and self._state is CircuitState.HALF_OPEN:
+                self._probes_started -= 1
+            raise
+        else:
+            self._record(failed=False, elapsed=self._clock() - started)
+
+    def _record(self, *, failed: bool, elapsed: float) -> None:
+        slow = elapsed >= self.slow_call_seconds
+        if self._state is CircuitState.HALF_OPEN:
+            if failed or slow:
+                self._open()
+                return
+            self._probes_succeeded += 1
+            if self._probes_succeeded >= self.half_open_probes:
+                self._transition(CircuitState.CLOSED)
+            return
+        if self._state is CircuitState.OPEN:
+            # Calls started before the circuit opened
+            return
+
+        self._outcomes.append((failed, slow))
+        calls = len(self._outcomes)
+        if calls < self.minimum_calls:
+            return
+        failures = sum(failed for failed, _ in self._outcomes)
+        slow_calls = sum(slow for _, slow in self._outcomes)
+        if (
+            failures / calls >= self.failure_rate_threshold
+            or slow_calls / calls >= self.slow_call_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        logger.warning(
+            "Circuit breaker state changed",
+            extra={"upstream": self.upstream, "previous": self._state, "state": state},
+        )
+        self._state = state
+        self._outcomes.clear()
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self._transitions.inc(upstream=self.upstream, state=state)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UpstreamCircuitBreakers:
+    museum: CircuitBreaker
+    catalog: CircuitBreaker
+
+
+def instrument_circuit_breakers(
+    breakers: Iterable[CircuitBreaker], metrics: MetricsRegistry
+) -> None:
+    """Export the current state of each breaker as one gauge."""
+    breakers = tuple(breakers)
+    metrics.gauge(
+        "http_client_circuit_state",
+        "Circuit breaker state: 0 closed, 1 half-open, 2 open",
+        lambda: {
+            (breaker.upstream,): float(STATE_VALUES[breaker.state])
+            for breaker in breakers
+        },
+        labelnames=("upstream",),
+    )
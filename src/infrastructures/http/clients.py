@@ -1,17 +1,32 @@
+from collections.abc import Sequence
+from contextlib import AsyncExitStack
 from dataclasses import dataclass
 import logging
-from typing import final
+from typing import Any, final
 from uuid import UUID
 
 import httpx
-import stamina
 
-from src.application.dtos.artifact import ArtifactCatalogPublicationDTO, ArtifactDTO
-from src.application.exceptions import ArtifactNotFoundError
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    ArtifactDTO,
+    MuseumValidatorsDTO,
+)
+from src.application.exceptions import (
+    ArtifactNotFoundError,
+    DeadlineExceededError,
+    UpstreamBusyError,
+    UpstreamUnavailableError,
+)
 from src.application.interfaces.http_clients import (
     ExternalMuseumAPIProtocol,
     PublicCatalogAPIProtocol,
 )
+from src.infrastructures.deadline import within_deadline
+from src.infrastructures.http.circuit_breaker import CircuitBreaker
+from src.infrastructures.http.hedging import HedgePolicy
+from src.infrastructures.http.retry import RetryPolicy
+from src.infrastructures.http.throttling import OutboundLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -21,52 +36,75 @@ logger = logging.getLogger(__name__)
 class ExternalMuseumAPIClient(ExternalMuseumAPIProtocol):
     base_url: str
     client: httpx.AsyncClient
+    limiter: OutboundLimiter | None = None
+    breaker: CircuitBreaker | None = None
+    hedging: HedgePolicy | None = None
+    retry: RetryPolicy | None = None
 
-    @stamina.retry(
-        on=(httpx.HTTPError, httpx.RequestError),
-        attempts=3,
-        wait_initial=0.5,
-        wait_jitter=1.0,
-    )
     async def fetch_artifact(self, inventory_id: str | UUID) -> ArtifactDTO:
         inventory_id_str = (
             str(inventory_id) if isinstance(inventory_id, UUID) else inventory_id
         )
+        response = await self._fetch(inventory_id_str, headers={})
+        return self._parse(inventory_id_str, response)
+
+    async def fetch_artifact_if_changed(
+        self, inventory_id: str | UUID, validators: MuseumValidatorsDTO | None
+    ) -> tuple[ArtifactDTO, MuseumValidatorsDTO] | None:
+        inventory_id_str = (
+            str(inventory_id) if isinstance(inventory_id, UUID) else inventory_id
+        )
+        headers: dict[str, str] = {}
+        if validators is not None and validators.etag is not None:
+            headers["If-None-Match"] = validators.etag
+        if validators is not None and validators.last_modified is not None:
+            headers["If-Modified-Since"] = validators.last_modified
+
+        response = await self._fetch(inventory_id_str, headers=headers)
+        if headers and response.status_code == 304:
+            logger.debug("Artifact %s unchanged (304).", inventory_id_str)
+            return None
+        return self._parse(inventory_id_str, response), MuseumValidatorsDTO(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+
+    def _should_retry(self, exc: Exception) -> bool:
+        # Checked before the backoff sleep, so once the circuit opens the
+        # remaining attempts are skipped instead of waited for.
+        return isinstance(exc, httpx.HTTPError) and (
+            self.breaker is None or self.breaker.allows_calls()
+        )
+
+    async def _fetch(
+        self, inventory_id_str: str, headers: dict[str, str]
+    ) -> httpx.Response:
+        if self.retry is None:
+            return await self._fetch_once(inventory_id_str, headers)
+        return await self.retry.call(
+            lambda: self._fetch_once(inventory_id_str, headers),
+            retryable=self._should_retry,
+        )
+
+    async def _fetch_once(
+        self, inventory_id_str: str, headers: dict[str, str]
+    ) -> httpx.Response:
         url = f"{self.base_url}/artifacts/{inventory_id_str}"
         logger.debug("Fetching artifact from URL: %s", url)
 
         try:
-            response = await self.client.get(url)
-            if response.status_code == 404:
-                logger.warning("Artifact %s not found (404).", inventory_id_str)
-                raise ArtifactNotFoundError(
-                    f"Artifact {inventory_id_str} not found in external service"
-                )
-
-            response.raise_for_status()
-            data = response.json()
-
-            artifact = ArtifactDTO(
-                inventory_id=data["inventory_id"],
-                name=data["name"],
-                era=data["era"],
-                material=data["material"],
-                description=data["description"],
-                acquisition_date=data["acquisition_date"],
-                department=data["department"],
-            )
-            logger.debug("Successfully fetched artifact: %s", artifact)
-            return artifact
-
+            response = await self._get(url, headers)
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             logger.exception(
                 "HTTP error while fetching artifact %s: %s", inventory_id_str, e
             )
             raise
-        except ValueError as e:
-            logger.exception(
-                "Data validation error for artifact %s : %s", inventory_id_str, e
-            )
+        except (
+            UpstreamBusyError,
+            UpstreamUnavailableError,
+            DeadlineExceededError,
+        ) as e:
+            logger.warning("Museum API call for %s refused: %s", inventory_id_str, e)
             raise
         except Exception as e:
             logger.exception(
@@ -74,47 +112,138 @@ class ExternalMuseumAPIClient(ExternalMuseumAPIProtocol):
             )
             raise
 
+        if response.status_code == 404:
+            logger.warning("Artifact %s not found (404).", inventory_id_str)
+            raise ArtifactNotFoundError(
+                f"Artifact {inventory_id_str} not found in external service"
+            )
+        return response
+
+    def _parse(self, inventory_id_str: str, response: httpx.Response) -> ArtifactDTO:
+        try:
+            # Validated straight from the response bytes by pydantic-core, with
+            # no intermediate dict; fields the DTO does not know are dropped.
+            artifact = ArtifactDTO.model_validate_json(response.content, extra="ignore")
+        except ValueError as e:
+            logger.exception(
+                "Data validation error for artifact %s : %s", inventory_id_str, e
+            )
+            raise
+        logger.debug("Successfully fetched artifact: %s", artifact)
+        return artifact
+
+    async def _get(self, url: str, headers: dict[str, str]) -> httpx.Response:
+        if self.hedging is None:
+            return await self._send(url, headers)
+        return await self.hedging.run(lambda: self._send(url, headers))
+
+    async def _send(self, url: str, headers: dict[str, str]) -> httpx.Response:
+        # Runs once per attempt and per hedge, so every retry waits for its
+        # own slot and cannot push the upstream past the configured rate. The
+        # breaker sits inside the limiter so queueing is not mistaken for a
+        # slow upstream. The request deadline bounds queueing, pool wait and
+        # the call itself.
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(within_deadline())
+            if self.limiter is not None:
+                await stack.enter_async_context(self.limiter.slot())
+            if self.breaker is not None:
+                await stack.enter_async_context(self.breaker.call())
+            response = await self.client.get(url, headers=headers)
+            # Answers the caller handles: not found, and not modified
+            if response.status_code not in (304, 404):
+                response.raise_for_status()
+            return response
+
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class PublicCatalogAPIClient(PublicCatalogAPIProtocol):
     base_url: str
     client: httpx.AsyncClient
+    breaker: CircuitBreaker | None = None
+    retry: RetryPolicy | None = None
 
-    @stamina.retry(
-        on=(httpx.HTTPError, httpx.RequestError),
-        attempts=3,
-        wait_initial=1.0,
-        wait_jitter=1.0,
-    )
     async def publish_artifact(self, artifact: ArtifactCatalogPublicationDTO) -> str:
+        if self.retry is None:
+            return await self._publish_artifact(artifact)
+        return await self.retry.call(
+            lambda: self._publish_artifact(artifact), retryable=self._should_retry
+        )
+
+    def _should_retry(self, exc: Exception) -> bool:
+        return isinstance(exc, httpx.HTTPError) and (
+            self.breaker is None or self.breaker.allows_calls()
+        )
+
+    async def publish_artifacts(
+        self, artifacts: Sequence[ArtifactCatalogPublicationDTO]
+    ) -> dict[UUID, str]:
+        """Publish through the bulk endpoint; public_ids by inventory_id.
+
+        Artifacts the catalog rejected are missing from the result.
+        """
+        if self.retry is None:
+            return await self._publish_artifacts(artifacts)
+        return await self.retry.call(
+            lambda: self._publish_artifacts(artifacts), retryable=self._should_retry
+        )
+
+    async def _publish_artifact(self, artifact: ArtifactCatalogPublicationDTO) -> str:
         url = f"{self.base_url}/items"
+        payload = artifact.model_dump(mode="json")
+        logger.debug("Publishing artifact to URL %s with payload: %s", url, payload)
+        data = await self._post_json(url, payload)
+
+        public_id = str(data.get("public_id", ""))
+        if not public_id:
+            logger.exception("Response JSON missing 'public_id' field: %s", data)
+            raise ValueError("Invalid response data: missing 'public_id'")
+
+        logger.debug("Successfully published artifact, public_id: %s", public_id)
+        return public_id
+
+    async def _publish_artifacts(
+        self, artifacts: Sequence[ArtifactCatalogPublicationDTO]
+    ) -> dict[UUID, str]:
+        url = f"{self.base_url}/items/bulk"
         payload = {
-            "inventory_id": artifact.inventory_id,
-            "name": artifact.name,
-            "era": artifact.era,
-            "material": artifact.material,
-            "description": artifact.description,
+            "items": [artifact.model_dump(mode="json") for artifact in artifacts]
         }
-        logger.debug("Publishing artifact to URL %s with payload: %s", url, payload)
+        logger.debug("Publishing %d artifacts to URL %s", len(artifacts), url)
+        data = await self._post_json(url, payload)
+
+        public_ids: dict[UUID, str] = {}
+        for item in data.get("items", []):
+            if item.get("public_id"):
+                public_ids[UUID(str(item["inventory_id"]))] = str(item["public_id"])
+            else:
+                logger.warning("Catalog rejected artifact in bulk publish: %s", item)
+        logger.debug(
+            "Bulk published %d of %d artifacts", len(public_ids), len(artifacts)
+        )
+        return public_ids
 
+    async def _post_json(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
         try:
-            response = await self.client.post(
-                url, json=payload, timeout=httpx.Timeout(10.0)
-            )
-            response.raise_for_status()
-            data = response.json()
+            response = await self._post(url, payload)
+            data: dict[str, Any] = response.json()
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             logger.exception("Error during HTTP request to %s: %s", url, e)
             raise
+        except (UpstreamUnavailableError, DeadlineExceededError) as e:
+            logger.warning("Catalog publish refused: %s", e)
+            raise
         except Exception as e:
             logger.exception("Unexpected error during publishing artifact: %s", e)
             raise Exception("Failed to publish artifact to catalog: %s", e) from e
-
-        public_id = str(data.get("public_id", ""))
-        if not public_id:
-            logger.exception("Response JSON missing 'public_id' field: %s", data)
-            raise ValueError("Invalid response data: missing 'public_id'")
-
-        logger.debug("Successfully published artifact, public_id: %s", public_id)
-        return public_id
+        return data
+
+    async def _post(self, url: str, payload: dict[str, Any]) -> httpx.Response:
+        async with AsyncExitStack() as stack:
+            await stack.enter_async_context(within_deadline())
+            if self.breaker is not None:
+                await stack.enter_async_context(self.breaker.call())
+            response = await self.client.post(url, json=payload)
+            response.raise_for_status()
+            return response
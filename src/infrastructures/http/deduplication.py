@@ -0,0 +1,74 @@
+import hashlib
+import logging
+from typing import final
+
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    CatalogPublicationRecordDTO,
+)
+from src.application.interfaces.http_clients import PublicCatalogAPIProtocol
+from src.application.interfaces.repositories import ArtifactRepositoryProtocol
+from src.infrastructures.db.exceptions import RepositoryReadError, RepositorySaveError
+from src.infrastructures.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+
+def publication_hash(artifact: ArtifactCatalogPublicationDTO) -> str:
+    """SHA-256 of the publication as it is serialized for the catalog."""
+    return hashlib.sha256(artifact.model_dump_json().encode()).hexdigest()
+
+
+@final
+class DeduplicatingCatalogPublisher(PublicCatalogAPIProtocol):
+    """Skips publishing content the catalog already has.
+
+    The hash of each published payload is recorded with the public_id the
+    catalog returned; an artifact whose payload hashes the same is answered
+    with the recorded public_id instead of another request to ``publisher``.
+    The record is only an optimization: failing to read or write it falls
+    back to publishing.
+    """
+
+    def __init__(
+        self,
+        *,
+        publisher: PublicCatalogAPIProtocol,
+        repository: ArtifactRepositoryProtocol,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self.publisher = publisher
+        self.repository = repository
+        self._publishes = metrics.counter(
+            "catalog_publish_dedup_total",
+            "Catalog publishes, by whether the content was sent or already there",
+            labelnames=("result",),
+        )
+
+    async def publish_artifact(self, artifact: ArtifactCatalogPublicationDTO) -> str:
+        content_hash = publication_hash(artifact)
+        try:
+            published = await self.repository.get_catalog_publication(
+                artifact.inventory_id
+            )
+        except RepositoryReadError as e:
+            logger.warning("Catalog publication record unavailable: %s", e)
+            published = None
+        if published is not None and published.content_hash == content_hash:
+            self._publishes.inc(result="skipped")
+            return published.public_id
+
+        public_id = await self.publisher.publish_artifact(artifact)
+        self._publishes.inc(result="published")
+        try:
+            await self.repository.save_catalog_publication(
+                CatalogPublicationRecordDTO(
+                    inventory_id=artifact.inventory_id,
+                    content_hash=content_hash,
+                    public_id=public_id,
+                )
+            )
+        except RepositorySaveError as e:
+            # Only costs one redundant publish next time
+            logger.warning("Failed to record catalog publication: %s", e)
+        return public_id
@@ -0,0 +1,116 @@
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+import math
+import time
+from typing import TypeVar, final
+
+from src.infrastructures.metrics import MetricsRegistry
+
+T = TypeVar("T")
+
+
+@final
+class HedgePolicy:
+    """Sends a backup request when the first one is slower than usual.
+
+    The hedge delay is the ``percentile`` of recent successful call latencies
+    (never below ``min_delay``; ``initial_delay`` until ``min_samples`` are
+    seen). Hedges are paid for from a budget that every call tops up by
+    ``budget_ratio``, so at most that fraction of calls is ever sent twice.
+    Only use it for idempotent requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        upstream: str,
+        metrics: MetricsRegistry,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        initial_delay: float = 0.5,
+        budget_ratio: float = 0.1,
+        budget_burst: float = 10.0,
+        window_size: int = 500,
+        min_samples: int = 50,
+        recompute_every: int = 50,
+    ) -> None:
+        self.upstream = upstream
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget_ratio = budget_ratio
+        self.budget_burst = budget_burst
+        self.min_samples = min_samples
+        self.recompute_every = recompute_every
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self._samples_since_recompute = 0
+        self._delay = max(min_delay, initial_delay)
+        # Starts empty: a cold start is exactly when doubling load hurts most
+        self._budget = 0.0
+        self._hedges = metrics.counter(
+            "http_client_hedges_total",
+            "Backup requests: won or lost against the first one, or skipped "
+            "because the hedge budget was spent",
+            labelnames=("upstream", "result"),
+        )
+        metrics.gauge(
+            "http_client_hedge_delay_seconds",
+            "Current delay before a backup request is sent",
+            lambda: {(self.upstream,): self._delay},
+            labelnames=("upstream",),
+        )
+
+    @property
+    def delay(self) -> float:
+        return self._delay
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call``, racing a second one if the first is slow."""
+        self._budget = min(self.budget_burst, self._budget + self.budget_ratio)
+        primary = asyncio.ensure_future(self._timed(call))
+        pending: set[asyncio.Future[T]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self._delay)
+            if done:
+                return primary.result()
+            if self._budget < 1:
+                self._hedges.inc(upstream=self.upstream, result="over_budget")
+                return await primary
+            self._budget -= 1
+            hedge = asyncio.ensure_future(self._timed(call))
+            pending.add(hedge)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        result = "won" if task is hedge else "lost"
+                        self._hedges.inc(upstream=self.upstream, result=result)
+                        return task.result()
+            # Both failed: re-raise the first request's error
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            # Wait for the losers to release their limiter slots and sockets
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _timed(self, call: Callable[[], Awaitable[T]]) -> T:
+        started = time.perf_counter()
+        result = await call()
+        self._observe(time.perf_counter() - started)
+        return result
+
+    def _observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+        self._samples_since_recompute += 1
+        if (
+            len(self._samples) >= self.min_samples
+            and self._samples_since_recompute >= self.recompute_every
+        ):
+            self._samples_since_recompute = 0
+            ordered = sorted(self._samples)
+            index = math.ceil(self.percentile / 100 * len(ordered)) - 1
+            self._delay = max(self.min_delay, ordered[max(0, index)])
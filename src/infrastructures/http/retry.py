@@ -0,0 +1,130 @@
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import random
+import time
+from typing import TypeVar, final
+
+import stamina
+
+from src.infrastructures.deadline import remaining
+from src.infrastructures.metrics import MetricsRegistry
+
+T = TypeVar("T")
+
+
+@final
+class RetryPolicy:
+    """Retries towards one upstream, paid for from a shared retry budget.
+
+    Over the last ``budget_window`` seconds retries may add at most
+    ``budget_ratio`` of the successful requests, plus a small floor of
+    ``min_retries_per_second`` so a quiet service can still retry. When the
+    upstream struggles successes dry up and so do retries, instead of every
+    caller tripling its load.
+
+    A retry is also skipped when its backoff plus the duration of the attempt
+    that just failed would end past the call's deadline: ``timeout`` after the
+    first attempt, or the request deadline if that comes first.
+    """
+
+    def __init__(
+        self,
+        *,
+        upstream: str,
+        metrics: MetricsRegistry,
+        max_attempts: int = 3,
+        wait_initial: float = 0.5,
+        wait_max: float = 5.0,
+        wait_jitter: float = 1.0,
+        timeout: float = 15.0,
+        budget_ratio: float = 0.2,
+        min_retries_per_second: float = 1.0,
+        budget_window: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.upstream = upstream
+        self.max_attempts = max_attempts
+        self.wait_initial = wait_initial
+        self.wait_max = wait_max
+        self.wait_jitter = wait_jitter
+        self.timeout = timeout
+        self.budget_ratio = budget_ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.budget_window = budget_window
+        self._clock = clock
+        self._successes: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._counter = metrics.counter(
+            "http_client_retries_total",
+            "Retry decisions: attempted, or denied by the budget or the deadline",
+            labelnames=("upstream", "result"),
+        )
+
+    async def call(
+        self,
+        operation: Callable[[], Awaitable[T]],
+        *,
+        retryable: Callable[[Exception], bool],
+    ) -> T:
+        deadline = self._clock() + self.timeout
+        request_left = remaining()
+        if request_left is not None:
+            deadline = min(deadline, self._clock() + request_left)
+        retries = 0
+        attempt_started = self._clock()
+
+        def backoff_hook(exc: Exception) -> bool | float:
+            nonlocal retries, attempt_started
+            if retries + 1 >= self.max_attempts or not retryable(exc):
+                return False
+            now = self._clock()
+            backoff = self._backoff(retries)
+            if now + backoff + (now - attempt_started) > deadline:
+                self._counter.inc(upstream=self.upstream, result="denied_deadline")
+                return False
+            if not self._withdraw(now):
+                self._counter.inc(upstream=self.upstream, result="denied_budget")
+                return False
+            self._counter.inc(upstream=self.upstream, result="attempted")
+            retries += 1
+            attempt_started = now + backoff
+            return backoff
+
+        async for attempt in stamina.retry_context(
+            on=backoff_hook, attempts=self.max_attempts, timeout=None
+        ):
+            with attempt:
+                result = await operation()
+        now = self._clock()
+        self._prune(now)
+        self._successes.append(now)
+        return result
+
+    def _backoff(self, retries: int) -> float:
+        jitter = random.uniform(0, self.wait_jitter)  # noqa: S311
+        return min(self.wait_max, self.wait_initial * 2.0**retries + jitter)
+
+    def _withdraw(self, now: float) -> bool:
+        self._prune(now)
+        allowed = (
+            self.budget_ratio * len(self._successes)
+            + self.min_retries_per_second * self.budget_window
+        )
+        if len(self._retries) + 1 > allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.budget_window
+        for events in (self._successes, self._retries):
+            while events and events[0] < horizon:
+                events.popleft()
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UpstreamRetryPolicies:
+    museum: RetryPolicy
+    catalog: RetryPolicy
@@ -0,0 +1,186 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+import logging
+import math
+import time
+from typing import Any, NoReturn, Protocol, final
+
+from redis.asyncio import Redis
+import redis.exceptions
+
+from src.application.exceptions import UpstreamBusyError
+from src.infrastructures.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+# Refill, then take one token. A caller that would have to wait longer than
+# ARGV[3] takes nothing and gets -1; otherwise the token is reserved now
+# (the balance may go negative) and the caller sleeps for the returned wait.
+# The wait is returned as a string: Lua numbers become integer replies.
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens < 1 then
+  wait = (1 - tokens) / rate
+  if wait > max_wait then
+    return '-1'
+  end
+end
+tokens = tokens - 1
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((burst - tokens) / rate * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class TokenBucketProtocol(Protocol):
+    async def reserve(self, max_wait: float) -> float | None:
+        """Reserve one token; return the wait before using it, or None."""
+        ...
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class LocalTokenBucket(TokenBucketProtocol):
+    """In-process token bucket with the same semantics as the Redis one."""
+
+    rate: float
+    burst: float
+    _tokens: float | None = field(default=None, init=False)
+    _updated: float = field(default=0.0, init=False)
+
+    async def reserve(self, max_wait: float) -> float | None:
+        now = time.monotonic()
+        tokens = self.burst if self._tokens is None else self._tokens
+        tokens = min(self.burst, tokens + (now - self._updated) * self.rate)
+        wait = 0.0
+        if tokens < 1:
+            wait = (1 - tokens) / self.rate
+            if wait > max_wait:
+                return None
+        self._tokens = tokens - 1
+        self._updated = now
+        return wait
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class RedisTokenBucket(TokenBucketProtocol):
+    """Token bucket shared by every worker through one Redis key.
+
+    When Redis is unreachable the ``fallback`` bucket keeps limiting this
+    process, so an outage of the cache does not unleash the full load.
+    """
+
+    client: Redis
+    key: str
+    rate: float
+    burst: float
+    fallback: LocalTokenBucket
+    _script: Any = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self._script = self.client.register_script(_RESERVE_SCRIPT)
+
+    async def reserve(self, max_wait: float) -> float | None:
+        try:
+            wait = float(
+                await self._script(
+                    keys=[self.key], args=[self.rate, self.burst, max_wait]
+                )
+            )
+        except (ConnectionError, redis.exceptions.RedisError) as e:
+            logger.warning(
+                "Shared rate limit unavailable, limiting locally",
+                extra={"key": self.key, "error": str(e)},
+            )
+            return await self.fallback.reserve(max_wait)
+        return None if wait < 0 else wait
+
+
+@final
+class OutboundLimiter:
+    """Caps concurrency and request rate towards one upstream.
+
+    A call first takes an in-flight slot, then a rate token. Both waits come
+    out of one queueing budget; a call that cannot start within it raises
+    :class:`UpstreamBusyError` at once instead of joining an ever longer queue.
+    """
+
+    def __init__(
+        self,
+        *,
+        upstream: str,
+        bucket: TokenBucketProtocol | None,
+        max_in_flight: int,
+        max_queue_wait: float,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self.upstream = upstream
+        self.max_queue_wait = max_queue_wait
+        self._bucket = bucket
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+        self._queue_wait = metrics.histogram(
+            "http_client_throttle_wait_seconds",
+            "Time outbound requests queued in the client-side limiter",
+            labelnames=("upstream",),
+            buckets=THROTTLE_WAIT_BUCKETS,
+        )
+        self._rejected = metrics.counter(
+            "http_client_throttled_total",
+            "Outbound requests rejected by the client-side limiter",
+            labelnames=("upstream", "reason"),
+        )
+        metrics.gauge(
+            "http_client_in_flight",
+            "Outbound requests currently holding a limiter slot",
+            lambda: {(self.upstream,): float(self._in_flight)},
+            labelnames=("upstream",),
+        )
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self.max_queue_wait):
+                await self._slots.acquire()
+        except TimeoutError:
+            self._reject("in_flight")
+        try:
+            if self._bucket is not None:
+                remaining = self.max_queue_wait - (time.perf_counter() - started)
+                wait = await self._bucket.reserve(max(0.0, remaining))
+                if wait is None:
+                    self._reject("rate")
+                if wait:
+                    await asyncio.sleep(wait)
+            self._queue_wait.observe(
+                time.perf_counter() - started, upstream=self.upstream
+            )
+            self._in_flight += 1
+            try:
+                yield
+            finally:
+                self._in_flight -= 1
+        finally:
+            self._slots.release()
+
+    def _reject(self, reason: str) -> NoReturn:
+        self._rejected.inc(upstream=self.upstream, reason=reason)
+        raise UpstreamBusyError(
+            f"{self.upstream} API limiter is saturated ({reason}), "
+            f"retry in {math.ceil(self.max_queue_wait)}s"
+        )
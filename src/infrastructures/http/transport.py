@@ -0,0 +1,104 @@
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any, NewType, final
+
+import httpx
+
+from src.infrastructures.metrics import MetricsRegistry
+
+# One client per upstream: each gets its own pool, limits and timeouts, so a
+# slow catalog cannot hold the connections museum lookups are waiting for.
+MuseumHTTPClient = NewType("MuseumHTTPClient", httpx.AsyncClient)
+CatalogHTTPClient = NewType("CatalogHTTPClient", httpx.AsyncClient)
+
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+
+TraceCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+@final
+class InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Transport that reports how long requests queue for a pooled connection.
+
+    httpcore emits its first trace event once the pool has handed the request
+    a connection (either opening a new one or sending on a reused one), so the
+    time until that event is the pool wait.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        upstream: str,
+        metrics: MetricsRegistry,
+    ) -> None:
+        self._transport = transport
+        self._upstream = upstream
+        self._pool_wait = metrics.histogram(
+            "http_client_pool_wait_seconds",
+            "Time outbound requests waited for a pooled connection",
+            labelnames=("upstream",),
+            buckets=POOL_WAIT_BUCKETS,
+        )
+        self._pool_timeouts = metrics.counter(
+            "http_client_pool_timeouts_total",
+            "Outbound requests that gave up waiting for a pooled connection",
+            labelnames=("upstream",),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.perf_counter()
+        waited: list[float] = []
+        inner_trace: TraceCallback | None = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if not waited:
+                waited.append(time.perf_counter() - started)
+                self._pool_wait.observe(waited[0], upstream=self._upstream)
+            if inner_trace is not None:
+                await inner_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        try:
+            return await self._transport.handle_async_request(request)
+        except httpx.PoolTimeout:
+            self._pool_timeouts.inc(upstream=self._upstream)
+            if not waited:
+                self._pool_wait.observe(
+                    time.perf_counter() - started, upstream=self._upstream
+                )
+            raise
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def create_http_client(
+    *,
+    upstream: str,
+    metrics: MetricsRegistry,
+    max_connections: int,
+    max_keepalive_connections: int,
+    keepalive_expiry: float,
+    http2: bool,
+    connect_timeout: float,
+    read_timeout: float,
+    pool_timeout: float,
+) -> httpx.AsyncClient:
+    """Build a pooled client for one upstream.
+
+    ``http2=True`` needs the optional ``h2`` package (``httpx[http2]``).
+    """
+    transport = httpx.AsyncHTTPTransport(
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=http2,
+    )
+    return httpx.AsyncClient(
+        transport=InstrumentedTransport(transport, upstream=upstream, metrics=metrics),
+        # Writes share the read timeout; bodies sent upstream are small
+        timeout=httpx.Timeout(read_timeout, connect=connect_timeout, pool=pool_timeout),
+    )
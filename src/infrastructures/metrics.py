@@ -0,0 +1,191 @@
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+import math
+from typing import final
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)
+    )
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+@dataclass(slots=True, kw_only=True)
+class _Metric:
+    name: str
+    description: str
+    labelnames: tuple[str, ...] = ()
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class Counter(_Metric):
+    _values: dict[LabelValues, float] = field(default_factory=dict, init=False)
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> Iterable[str]:
+        yield f"# TYPE {self.name} counter"
+        for key, value in sorted(self._values.items()):
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class Gauge(_Metric):
+    """Gauge whose samples are read from a callback at scrape time."""
+
+    collect: Callable[[], dict[LabelValues, float]]
+
+    def render(self) -> Iterable[str]:
+        yield f"# TYPE {self.name} gauge"
+        for key, value in sorted(self.collect().items()):
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+@final
+@dataclass(slots=True, kw_only=True)
+class Histogram(_Metric):
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    _counts: dict[LabelValues, list[int]] = field(default_factory=dict, init=False)
+    _sums: dict[LabelValues, float] = field(default_factory=dict, init=False)
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] = self._sums.get(key, 0.0) + value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def total(self, **labels: str) -> float:
+        return self._sums.get(self._key(labels), 0.0)
+
+    def render(self) -> Iterable[str]:
+        yield f"# TYPE {self.name} histogram"
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                labels = _format_labels(
+                    (*self.labelnames, "le"), (*key, _format_value(bound))
+                )
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(self._sums[key])}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+@final
+@dataclass(slots=True)
+class MetricsRegistry:
+    """In-process metrics rendered in the Prometheus text exposition format."""
+
+    _metrics: dict[str, Counter | Gauge | Histogram] = field(default_factory=dict)
+
+    def counter(
+        self, name: str, description: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = Counter(
+                name=name, description=description, labelnames=tuple(labelnames)
+            )
+            self._metrics[name] = metric
+        if not isinstance(metric, Counter):
+            raise ValueError(f"Metric {name} is already registered as another type")
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = Histogram(
+                name=name,
+                description=description,
+                labelnames=tuple(labelnames),
+                buckets=tuple(sorted(buckets)),
+            )
+            self._metrics[name] = metric
+        if not isinstance(metric, Histogram):
+            raise ValueError(f"Metric {name} is already registered as another type")
+        return metric
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        collect: Callable[[], dict[LabelValues, float]],
+        labelnames: Sequence[str] = (),
+    ) -> Gauge:
+        # Re-registering replaces the callback, e.g. when an engine is rebuilt.
+        metric = Gauge(
+            name=name,
+            description=description,
+            labelnames=tuple(labelnames),
+            collect=collect,
+        )
+        self._metrics[name] = metric
+        return metric
+
+    def get(self, name: str) -> Counter | Gauge | Histogram | None:
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            lines.append(f"# HELP {name} {metric.description}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
@@ -6,8 +6,14 @@ from dishka import AsyncContainer, make_async_container
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
 
+from src.application.exceptions import DeadlineExceededError
 from src.config.ioc.di import get_providers
 from src.config.logging import setup_logging
+from src.presentation.api.rest.middlewares import (
+    deadline_exceeded_handler,
+    deadline_middleware,
+    pool_checkout_middleware,
+)
 from src.presentation.api.rest.v1.routers import api_v1_router
 
 setup_logging()
@@ -15,10 +21,11 @@ logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     logger.info("Starting application...")
     yield
     logger.info("Shutting down application...")
+    await app.state.dishka_container.close()
 
 
 def create_app() -> FastAPI:
@@ -33,6 +40,10 @@ def create_app() -> FastAPI:
     )
 
     container: AsyncContainer = make_async_container(*get_providers())
+    app.middleware("http")(pool_checkout_middleware)
+    # Registered last so it runs first and its deadline covers everything
+    app.middleware("http")(deadline_middleware)
+    app.add_exception_handler(DeadlineExceededError, deadline_exceeded_handler)
     setup_dishka(container, app)
 
     app.include_router(api_v1_router, prefix="/api")
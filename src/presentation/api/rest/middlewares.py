@@ -1 +1,92 @@
-# TODO
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import math
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+
+from src.application.exceptions import DeadlineExceededError
+from src.config.base import Settings
+from src.infrastructures.db.instrumentation import (
+    CHECKOUTS_PER_REQUEST_BUCKETS,
+    track_request_checkouts,
+)
+from src.infrastructures.deadline import request_deadline
+from src.infrastructures.metrics import MetricsRegistry
+
+logger = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT_HEADER = "X-Request-Timeout"
+# The outer timeout is a backstop for work that never checks the deadline;
+# it fires a little later so steps that do check get to answer first.
+DEADLINE_BACKSTOP_GRACE = 0.1
+
+
+async def pool_checkout_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    with track_request_checkouts() as checkouts:
+        response = await call_next(request)
+
+    route = request.scope.get("route")
+    metrics = await request.app.state.dishka_container.get(MetricsRegistry)
+    metrics.histogram(
+        "db_pool_checkouts_per_request",
+        "Connections checked out of the pool while serving one request",
+        ["route"],
+        buckets=CHECKOUTS_PER_REQUEST_BUCKETS,
+    ).observe(checkouts[0], route=getattr(route, "path", "unmatched"))
+    return response
+
+
+async def deadline_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    container = request.app.state.dishka_container
+    settings = await container.get(Settings)
+    budget = settings.request_timeout
+    requested = request.headers.get(REQUEST_TIMEOUT_HEADER)
+    if requested is not None:
+        try:
+            budget = float(requested)
+        except ValueError:
+            budget = math.nan
+        # float() also accepts "nan" and "inf", which no timer can use
+        if not math.isfinite(budget) or budget <= 0:
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={
+                    "detail": f"{REQUEST_TIMEOUT_HEADER} must be a positive "
+                    "number of seconds"
+                },
+            )
+        budget = min(budget, settings.request_timeout_max)
+
+    # Every step awaits with the remaining budget and raises
+    # DeadlineExceededError, answered by deadline_exceeded_handler. Streamed
+    # bodies are sent after call_next returns and so are not bounded.
+    try:
+        with request_deadline(budget):
+            async with asyncio.timeout(budget + DEADLINE_BACKSTOP_GRACE):
+                return await call_next(request)
+    except TimeoutError:
+        return await deadline_exceeded_handler(request, DeadlineExceededError())
+
+
+async def deadline_exceeded_handler(
+    request: Request,
+    exc: Exception,  # noqa: ARG001
+) -> Response:
+    route = request.scope.get("route")
+    metrics = await request.app.state.dishka_container.get(MetricsRegistry)
+    metrics.counter(
+        "http_request_deadline_exceeded_total",
+        "Requests answered with 504 because their deadline passed",
+        ["route"],
+    ).inc(route=getattr(route, "path", "unmatched"))
+    logger.warning("Request deadline exceeded", extra={"path": request.url.path})
+    return JSONResponse(
+        status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+        content={"detail": "Request deadline exceeded."},
+    )
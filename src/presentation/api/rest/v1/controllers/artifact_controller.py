@@ -1,21 +1,245 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Literal
 from uuid import UUID
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import inject
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import AwareDatetime, ValidationError
 
-from src.application.dtos.artifact import ArtifactDTO
+from src.application.dtos.artifact import (
+    ArtifactChangesPageDTO,
+    ArtifactDTO,
+    ArtifactListFilterDTO,
+    ArtifactPageDTO,
+    ArtifactSearchPageDTO,
+    ArtifactStatsDTO,
+    EraDTO,
+    MaterialDTO,
+)
 from src.application.exceptions import (
     ArtifactNotFoundError,
     FailedFetchArtifactMuseumAPIException,
     FailedPublishArtifactInCatalogException,
     FailedPublishArtifactMessageBrokerException,
+    InvalidCursorError,
+    InvalidSearchQueryError,
+    UpstreamBusyError,
+    UpstreamUnavailableError,
+)
+from src.application.use_cases.export_artifacts import (
+    ExportArtifactsUseCase,
+    ExportFormat,
 )
 from src.application.use_cases.get_artifact import GetArtifactUseCase
+from src.application.use_cases.get_collection_stats import GetCollectionStatsUseCase
+from src.application.use_cases.list_artifact_changes import (
+    ListArtifactChangesUseCase,
+)
+from src.application.use_cases.list_artifacts import ListArtifactsUseCase
+from src.application.use_cases.search_artifacts import SearchArtifactsUseCase
 
 router = APIRouter(prefix="/v1/artifacts", tags=["Artifacts"])
 
+EraParam = Literal[
+    "paleolithic",
+    "neolithic",
+    "bronze_age",
+    "iron_age",
+    "antiquity",
+    "middle_ages",
+    "modern",
+]
+MaterialParam = Literal[
+    "ceramic", "metal", "stone", "glass", "bone", "wood", "textile", "other"
+]
+
+EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+def _build_filters(
+    department: str | None,
+    era: EraParam | None,
+    material: MaterialParam | None,
+    acquired_from: datetime | None,
+    acquired_to: datetime | None,
+    era_from: EraParam | None = None,
+    era_to: EraParam | None = None,
+) -> ArtifactListFilterDTO:
+    try:
+        return ArtifactListFilterDTO(
+            department=department,
+            era=EraDTO(value=era) if era else None,
+            era_from=EraDTO(value=era_from) if era_from else None,
+            era_to=EraDTO(value=era_to) if era_to else None,
+            material=MaterialDTO(value=material) if material else None,
+            acquired_from=acquired_from,
+            acquired_to=acquired_to,
+        )
+    except ValidationError as err:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=err.errors(include_url=False, include_context=False),
+        ) from err
+
+
+@router.get(
+    "",
+    response_model=ArtifactPageDTO,
+    summary="List artifacts with keyset pagination",
+    responses={
+        200: {"description": "Page of artifacts retrieved successfully"},
+        400: {"description": "Malformed pagination cursor"},
+        422: {"description": "Invalid filter parameters"},
+    },
+)
+@inject
+async def list_artifacts(
+    use_case: Annotated[ListArtifactsUseCase, FromDishka()],
+    department: Annotated[str | None, Query(min_length=2, max_length=100)] = None,
+    era: EraParam | None = None,
+    era_from: EraParam | None = None,
+    era_to: EraParam | None = None,
+    material: MaterialParam | None = None,
+    acquired_from: datetime | None = None,
+    acquired_to: datetime | None = None,
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=ListArtifactsUseCase.max_page_size)] = 50,
+) -> ArtifactPageDTO:
+    filters = _build_filters(
+        department, era, material, acquired_from, acquired_to, era_from, era_to
+    )
+    try:
+        return await use_case.execute(filters, cursor=cursor, limit=limit)
+    except InvalidCursorError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+        ) from err
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Export the collection as NDJSON or CSV",
+    responses={
+        200: {
+            "description": "Artifacts streamed in creation order",
+            "content": {
+                "application/x-ndjson": {},
+                "text/csv": {},
+                "application/gzip": {},
+            },
+        },
+        422: {"description": "Invalid filter parameters"},
+    },
+)
+@inject
+async def export_artifacts(
+    use_case: Annotated[ExportArtifactsUseCase, FromDishka()],
+    export_format: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    gzip: bool = False,
+    department: Annotated[str | None, Query(min_length=2, max_length=100)] = None,
+    era: EraParam | None = None,
+    era_from: EraParam | None = None,
+    era_to: EraParam | None = None,
+    material: MaterialParam | None = None,
+    acquired_from: datetime | None = None,
+    acquired_to: datetime | None = None,
+) -> StreamingResponse:
+    filters = _build_filters(
+        department, era, material, acquired_from, acquired_to, era_from, era_to
+    )
+    filename = f"artifacts.{export_format}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    if gzip:
+        filename += ".gz"
+        media_type = "application/gzip"
+    return StreamingResponse(
+        use_case.execute(filters, export_format=export_format, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/search",
+    response_model=ArtifactSearchPageDTO,
+    summary="Search artifacts by name and description",
+    responses={
+        200: {"description": "Ranked search hits retrieved successfully"},
+        400: {"description": "Blank search query or malformed pagination cursor"},
+    },
+)
+@inject
+async def search_artifacts(
+    use_case: Annotated[SearchArtifactsUseCase, FromDishka()],
+    q: Annotated[str, Query(min_length=2, max_length=100)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=SearchArtifactsUseCase.max_page_size)] = 20,
+) -> ArtifactSearchPageDTO:
+    try:
+        return await use_case.execute(q, cursor=cursor, limit=limit)
+    except InvalidSearchQueryError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(err),
+        ) from err
+    except InvalidCursorError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor.",
+        ) from err
+
+
+@router.get(
+    "/changes",
+    response_model=ArtifactChangesPageDTO,
+    summary="Artifacts created or updated since a point in time",
+    responses={
+        200: {"description": "Changes in (updated_at, inventory_id) order"},
+        400: {"description": "Malformed sync cursor"},
+        422: {"description": "since without a UTC offset"},
+    },
+)
+@inject
+async def list_artifact_changes(
+    use_case: Annotated[ListArtifactChangesUseCase, FromDishka()],
+    # updated_at is timestamptz: a naive time would be read in the session
+    # time zone, so an explicit offset is required
+    since: AwareDatetime | None = None,
+    cursor: str | None = None,
+    limit: Annotated[
+        int, Query(ge=1, le=ListArtifactChangesUseCase.max_page_size)
+    ] = 500,
+) -> ArtifactChangesPageDTO:
+    try:
+        return await use_case.execute(since=since, cursor=cursor, limit=limit)
+    except InvalidCursorError as err:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync cursor.",
+        ) from err
+
+
+@router.get(
+    "/stats",
+    response_model=ArtifactStatsDTO,
+    summary="Collection counts by department, era, material and acquisition year",
+    responses={
+        200: {"description": "Collection statistics retrieved successfully"},
+    },
+)
+@inject
+async def get_collection_stats(
+    use_case: Annotated[GetCollectionStatsUseCase, FromDishka()],
+) -> ArtifactStatsDTO:
+    return await use_case.execute()
+
 
 @router.get(
     "/{inventory_id}",
@@ -27,6 +251,7 @@ router = APIRouter(prefix="/v1/artifacts", tags=["Artifacts"])
         404: {"description": "Artifact not found"},
         500: {"description": "Internal server error"},
         502: {"description": "Failed to notify via message broker"},
+        503: {"description": "Museum API is saturated or failing, retry later"},
     },
 )
 @inject
@@ -56,3 +281,15 @@ async def get_artifact(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Failed to send notification via message broker.",
         ) from err
+    except UpstreamBusyError as err:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Museum API is busy, please retry later.",
+            headers={"Retry-After": "1"},
+        ) from err
+    except UpstreamUnavailableError as err:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Museum API is temporarily unavailable, please retry later.",
+            headers={"Retry-After": "30"},
+        ) from err
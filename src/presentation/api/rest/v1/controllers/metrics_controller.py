@@ -0,0 +1,24 @@
+from typing import Annotated
+
+from dishka import FromDishka
+from dishka.integrations.fastapi import inject
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.infrastructures.metrics import MetricsRegistry
+
+router = APIRouter(prefix="/v1/metrics", tags=["Metrics"])
+
+
+@router.get(
+    "",
+    response_class=PlainTextResponse,
+    summary="Service metrics in Prometheus text format",
+)
+@inject
+async def get_metrics(
+    metrics: Annotated[MetricsRegistry, FromDishka()],
+) -> PlainTextResponse:
+    return PlainTextResponse(
+        metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -3,6 +3,10 @@ from fastapi import APIRouter
 from src.presentation.api.rest.v1.controllers.artifact_controller import (
     router as artifact_router,
 )
+from src.presentation.api.rest.v1.controllers.metrics_controller import (
+    router as metrics_router,
+)
 
 api_v1_router = APIRouter()
 api_v1_router.include_router(artifact_router)
+api_v1_router.include_router(metrics_router)
@@ -0,0 +1,3 @@
+from src.presentation.cli.main import main
+
+raise SystemExit(main())
@@ -0,0 +1,88 @@
+import argparse
+from collections.abc import AsyncIterable
+from datetime import datetime
+import logging
+from pathlib import Path
+import sys
+import time
+from typing import Any, BinaryIO, get_args
+
+from dishka import AsyncContainer
+from pydantic import ValidationError
+
+from src.application.dtos.artifact import ArtifactListFilterDTO, EraDTO, MaterialDTO
+from src.application.use_cases.export_artifacts import (
+    ExportArtifactsUseCase,
+    ExportFormat,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def add_parser(subparsers: "argparse._SubParsersAction[Any]") -> None:
+    parser = subparsers.add_parser(
+        "export",
+        help="Stream the collection to a file or stdout as NDJSON or CSV",
+    )
+    parser.add_argument("--format", choices=get_args(ExportFormat), default="ndjson")
+    parser.add_argument("--gzip", action="store_true", help="gzip the output")
+    parser.add_argument(
+        "--output", "-o", type=Path, help="Destination file (default: stdout)"
+    )
+    parser.add_argument("--department")
+    eras = get_args(EraDTO.model_fields["value"].annotation)
+    parser.add_argument("--era", choices=eras)
+    parser.add_argument("--era-from", choices=eras, help="earliest era, inclusive")
+    parser.add_argument("--era-to", choices=eras, help="latest era, inclusive")
+    parser.add_argument(
+        "--material", choices=get_args(MaterialDTO.model_fields["value"].annotation)
+    )
+    parser.add_argument("--acquired-from", type=datetime.fromisoformat)
+    parser.add_argument("--acquired-to", type=datetime.fromisoformat)
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace, container: AsyncContainer) -> int:
+    try:
+        filters = ArtifactListFilterDTO(
+            department=args.department,
+            era=EraDTO(value=args.era) if args.era else None,
+            era_from=EraDTO(value=args.era_from) if args.era_from else None,
+            era_to=EraDTO(value=args.era_to) if args.era_to else None,
+            material=MaterialDTO(value=args.material) if args.material else None,
+            acquired_from=args.acquired_from,
+            acquired_to=args.acquired_to,
+        )
+    except ValidationError as err:
+        print(f"Invalid filters: {err}", file=sys.stderr)
+        return 2
+    async with container() as request_container:
+        use_case = await request_container.get(ExportArtifactsUseCase)
+        chunks = use_case.execute(
+            filters, export_format=args.format, compress=args.gzip
+        )
+        started = time.perf_counter()
+        if args.output is None:
+            written = await write_chunks(chunks, sys.stdout.buffer)
+        else:
+            with args.output.open("wb") as output:
+                written = await write_chunks(chunks, output)
+
+    logger.info(
+        "Export finished",
+        extra={
+            "bytes": written,
+            "seconds": round(time.perf_counter() - started, 2),
+            "output": str(args.output or "stdout"),
+        },
+    )
+    return 0
+
+
+async def write_chunks(chunks: AsyncIterable[bytes], output: BinaryIO) -> int:
+    written = 0
+    async for chunk in chunks:
+        output.write(chunk)
+        written += len(chunk)
+    output.flush()
+    return written
@@ -0,0 +1,219 @@
+import argparse
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import contextlib
+import csv
+from dataclasses import dataclass, field
+import gzip
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+import sys
+import time
+from typing import IO, Any, get_args
+
+from dishka import AsyncContainer
+
+from src.application.use_cases.import_artifacts import (
+    ImportArtifactsUseCase,
+    ImportBatchResult,
+    ImportFormat,
+    RawRecord,
+    RecordBatch,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def add_parser(subparsers: "argparse._SubParsersAction[Any]") -> None:
+    parser = subparsers.add_parser(
+        "import",
+        help="Bulk load artifacts from an NDJSON or CSV file (optionally .gz)",
+    )
+    parser.add_argument("path", type=Path)
+    parser.add_argument(
+        "--format",
+        choices=get_args(ImportFormat),
+        help="Input format (default: from the file extension)",
+    )
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        # The main process reads the file and drives COPY; on a single core
+        # a pool only adds pickling overhead, so validate inline there.
+        default=max((os.cpu_count() or 1) - 1, 0),
+        help="Validation processes; 0 validates in the main process",
+    )
+    parser.add_argument(
+        "--rejects", type=Path, help="Rejected records (default: <path>.rejects.ndjson)"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        type=Path,
+        help="Progress file (default: <path>.import-state.json)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip records already loaded by an interrupted run",
+    )
+    parser.set_defaults(handler=run)
+
+
+@dataclass(slots=True)
+class ImportProgress:
+    records: int = 0
+    loaded: int = 0
+    rejected: int = 0
+    started: float = field(default_factory=time.perf_counter)
+
+    def add(self, result: ImportBatchResult) -> None:
+        self.records += result.size
+        self.loaded += result.loaded
+        self.rejected += len(result.rejected)
+
+    def as_log_extra(self) -> dict[str, Any]:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "records": self.records,
+            "loaded": self.loaded,
+            "rejected": self.rejected,
+            "records_per_second": round(self.records / elapsed) if elapsed else 0,
+        }
+
+
+async def run(args: argparse.Namespace, container: AsyncContainer) -> int:
+    path: Path = args.path
+    import_format: ImportFormat = args.format or detect_format(path)
+    checkpoint_path = args.checkpoint or path.with_name(
+        f"{path.name}.import-state.json"
+    )
+    rejects_path = args.rejects or path.with_name(f"{path.name}.rejects.ndjson")
+
+    source = source_identity(path)
+    start = 0
+    if args.resume and checkpoint_path.exists():
+        state = json.loads(checkpoint_path.read_text())
+        if state["source"] != source:
+            print(
+                f"{checkpoint_path} belongs to a different or modified input file",
+                file=sys.stderr,
+            )
+            return 2
+        start = state["records_done"]
+        # Rejects written after the last checkpoint belong to batches that
+        # are about to be replayed, which would write them again
+        rejects_offset = state.get("rejects_offset")
+        if (
+            rejects_offset is not None
+            and rejects_path.exists()
+            and rejects_path.stat().st_size > rejects_offset
+        ):
+            os.truncate(rejects_path, rejects_offset)
+        logger.info("Resuming import", extra={"records_done": start})
+
+    progress = ImportProgress()
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 0 else None
+    with (
+        executor or contextlib.nullcontext(),
+        open_input(path) as stream,
+        rejects_path.open("ab" if start else "wb") as rejects,
+    ):
+        batches = make_batches(
+            read_records(stream, import_format), start=start, size=args.batch_size
+        )
+        async with container() as request_container:
+            use_case = await request_container.get(ImportArtifactsUseCase)
+            async for result in use_case.execute(batches, executor=executor):
+                for rejected in result.rejected:
+                    line = json.dumps(
+                        {
+                            "record": rejected.record + 1,
+                            "error": rejected.error,
+                            "raw": rejected.raw,
+                        },
+                        ensure_ascii=False,
+                    )
+                    rejects.write(line.encode("utf-8") + b"\n")
+                rejects.flush()
+                # Written only after the batch is committed, so a resumed run
+                # never skips unloaded records (re-merging is idempotent), and
+                # after its rejects, whose end it records for the resume.
+                save_checkpoint(
+                    checkpoint_path,
+                    source,
+                    result.next_record,
+                    rejects_offset=rejects.tell(),
+                )
+                progress.add(result)
+                logger.info("Import progress", extra=progress.as_log_extra())
+
+    checkpoint_path.unlink(missing_ok=True)
+    logger.info(
+        "Import finished",
+        extra={**progress.as_log_extra(), "rejects": str(rejects_path)},
+    )
+    return 0
+
+
+def detect_format(path: Path) -> ImportFormat:
+    suffixes = [suffix for suffix in path.suffixes if suffix != ".gz"]
+    return "csv" if suffixes and suffixes[-1] == ".csv" else "ndjson"
+
+
+def source_identity(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {
+        "path": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def open_input(path: Path) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    return path.open(encoding="utf-8", newline="")
+
+
+def read_records(stream: IO[str], import_format: ImportFormat) -> Iterator[RawRecord]:
+    if import_format == "csv":
+        # DictReader, not line splitting: quoted fields may contain newlines
+        yield from csv.DictReader(stream)
+        return
+    for line in stream:
+        if record := line.strip():
+            yield record
+
+
+async def make_batches(
+    records: Iterable[RawRecord], *, start: int, size: int
+) -> AsyncIterator[RecordBatch]:
+    remaining = itertools.islice(records, start, None)
+    first_record = start
+    while batch := list(itertools.islice(remaining, size)):
+        yield RecordBatch(first_record=first_record, records=batch)
+        first_record += len(batch)
+
+
+def save_checkpoint(
+    path: Path,
+    source: dict[str, Any],
+    records_done: int,
+    *,
+    rejects_offset: int = 0,
+) -> None:
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_text(
+        json.dumps(
+            {
+                "source": source,
+                "records_done": records_done,
+                "rejects_offset": rejects_offset,
+            }
+        )
+    )
+    tmp_path.replace(path)
@@ -0,0 +1,52 @@
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+import sys
+
+from dishka import AsyncContainer, Provider, Scope, make_async_container, provide
+
+from src.config.base import Settings
+from src.config.ioc.di import get_providers
+from src.config.logging import setup_logging
+from src.presentation.cli import changes, export, import_artifacts, refresh
+
+
+class CLISettingsProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_settings(self) -> Settings:
+        # SQL echo writes to stdout, which commands may use for their output
+        return Settings(DB_ECHO=False)  # type: ignore[call-arg]
+
+
+def make_container() -> AsyncContainer:
+    # Registered last, so it overrides the application's Settings provider
+    return make_async_container(*get_providers(), CLISettingsProvider())
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.presentation.cli",
+        description="Antiquarium service command line tools",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    export.add_parser(subparsers)
+    import_artifacts.add_parser(subparsers)
+    changes.add_parser(subparsers)
+    refresh.add_parser(subparsers)
+    return parser
+
+
+async def run(args: argparse.Namespace) -> int:
+    handler: Callable[[argparse.Namespace, AsyncContainer], Awaitable[int]]
+    handler = args.handler
+    container = make_container()
+    try:
+        return await handler(args, container)
+    finally:
+        await container.close()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    setup_logging(stream=sys.stderr)
+    return asyncio.run(run(args))
@@ -0,0 +1,79 @@
+import argparse
+import logging
+from pathlib import Path
+import sys
+from typing import Any
+
+from dishka import AsyncContainer
+
+from src.application.exceptions import (
+    DeadlineExceededError,
+    InvalidCursorError,
+    UpstreamBusyError,
+    UpstreamUnavailableError,
+)
+from src.application.use_cases.refresh_artifacts import RefreshArtifactsUseCase
+from src.presentation.cli.changes import save_cursor
+
+logger = logging.getLogger(__name__)
+
+
+def add_parser(subparsers: "argparse._SubParsersAction[Any]") -> None:
+    parser = subparsers.add_parser(
+        "refresh",
+        help="Re-fetch stored artifacts from the museum API, skipping unchanged ones",
+    )
+    parser.add_argument(
+        "--cursor-file",
+        type=Path,
+        help="Pass position; resumed from if present, removed once the pass ends",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help=f"artifacts per batch (max {RefreshArtifactsUseCase.max_page_size})",
+    )
+    parser.set_defaults(handler=run)
+
+
+async def run(args: argparse.Namespace, container: AsyncContainer) -> int:
+    cursor: str | None = None
+    if args.cursor_file is not None and args.cursor_file.exists():
+        cursor = args.cursor_file.read_text().strip() or None
+
+    checked = updated = failed = 0
+    while True:
+        # A request scope per batch: no session stays open for the whole pass
+        try:
+            async with container() as request_container:
+                use_case = await request_container.get(RefreshArtifactsUseCase)
+                page = await use_case.execute(cursor=cursor, limit=args.batch_size)
+        except InvalidCursorError as err:
+            print(f"Invalid cursor: {err}", file=sys.stderr)
+            return 2
+        except (
+            UpstreamBusyError,
+            UpstreamUnavailableError,
+            DeadlineExceededError,
+        ) as err:
+            # The cursor still points after the last finished batch
+            print(f"Museum API unavailable, stopping: {err}", file=sys.stderr)
+            return 1
+
+        checked += page.checked
+        updated += page.updated
+        failed += page.failed
+        cursor = page.next_cursor
+        if not page.has_more:
+            break
+        if cursor is not None and args.cursor_file is not None:
+            save_cursor(args.cursor_file, cursor)
+
+    if args.cursor_file is not None:
+        args.cursor_file.unlink(missing_ok=True)
+    logger.info(
+        "Artifact refresh finished",
+        extra={"checked": checked, "updated": updated, "failed": failed},
+    )
+    return 0
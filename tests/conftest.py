@@ -137,6 +137,7 @@ def mock_cache_client() -> AsyncMock:
     mock = AsyncMock(spec=CacheProtocol)
     # By default, return None to simulate cache miss
     mock.get.return_value = None
+    mock.get_raw.return_value = None
     return mock
 
 
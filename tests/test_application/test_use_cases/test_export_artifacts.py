@@ -0,0 +1,120 @@
+from collections.abc import AsyncIterator
+import csv
+from datetime import UTC, datetime
+import gzip
+import io
+import json
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.artifact import ArtifactListFilterDTO
+from src.application.mappers import ArtifactMapper
+from src.application.use_cases.export_artifacts import (
+    CSV_COLUMNS,
+    ExportArtifactsUseCase,
+)
+from src.domain.entities.artifact import ArtifactEntity
+from src.domain.value_objects.era import Era
+from src.domain.value_objects.material import Material
+
+
+def _entity(minute: int) -> ArtifactEntity:
+    return ArtifactEntity(
+        inventory_id=uuid4(),
+        created_at=datetime(2024, 1, 1, 0, minute, tzinfo=UTC),
+        acquisition_date=datetime(2023, 1, 1, tzinfo=UTC),
+        name=f"Artifact, no. {minute}",
+        department="Archaeology",
+        era=Era(value="antiquity"),
+        material=Material(value="ceramic"),
+        description="Line one\nline two" if minute % 2 else None,
+    )
+
+
+@pytest.fixture
+def entities() -> list[ArtifactEntity]:
+    return [_entity(i) for i in range(5)]
+
+
+@pytest.fixture
+def export_use_case(
+    mock_repository: AsyncMock, entities: list[ArtifactEntity]
+) -> ExportArtifactsUseCase:
+    async def stream(*_, **__) -> AsyncIterator[ArtifactEntity]:
+        for entity in entities:
+            yield entity
+
+    mock_repository.stream_artifacts = MagicMock(side_effect=stream)
+    return ExportArtifactsUseCase(
+        repository=mock_repository, artifact_mapper=ArtifactMapper()
+    )
+
+
+async def _collect(chunks: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+class TestExportArtifactsUseCase:
+    @pytest.mark.asyncio
+    async def test_ndjson_writes_one_artifact_per_line(
+        self,
+        export_use_case: ExportArtifactsUseCase,
+        entities: list[ArtifactEntity],
+        mock_repository: AsyncMock,
+    ):
+        """Test that NDJSON output has one JSON document per artifact"""
+        filters = ArtifactListFilterDTO(department="Archaeology")
+
+        body = await _collect(export_use_case.execute(filters))
+
+        lines = body.decode().splitlines()
+        assert [json.loads(line)["inventory_id"] for line in lines] == [
+            str(entity.inventory_id) for entity in entities
+        ]
+        mock_repository.stream_artifacts.assert_called_once_with(
+            filters, batch_size=ExportArtifactsUseCase.batch_size
+        )
+
+    @pytest.mark.asyncio
+    async def test_csv_has_header_and_quoted_rows(
+        self, export_use_case: ExportArtifactsUseCase, entities: list[ArtifactEntity]
+    ):
+        """Test that CSV output round-trips commas and newlines"""
+        body = await _collect(
+            export_use_case.execute(ArtifactListFilterDTO(), export_format="csv")
+        )
+
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert tuple(rows[0]) == CSV_COLUMNS
+        assert [row["name"] for row in rows] == [e.name for e in entities]
+        assert rows[1]["description"] == "Line one\nline two"
+        assert rows[0]["era"] == "antiquity"
+
+    @pytest.mark.asyncio
+    async def test_gzip_output_decompresses_to_plain_export(
+        self, export_use_case: ExportArtifactsUseCase
+    ):
+        """Test that compressed output is a valid gzip stream of the same rows"""
+        plain = await _collect(export_use_case.execute(ArtifactListFilterDTO()))
+        compressed = await _collect(
+            export_use_case.execute(ArtifactListFilterDTO(), compress=True)
+        )
+
+        assert gzip.decompress(compressed) == plain
+
+    @pytest.mark.asyncio
+    async def test_rows_are_emitted_in_bounded_chunks(
+        self,
+        export_use_case: ExportArtifactsUseCase,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that output is flushed incrementally instead of all at the end"""
+        monkeypatch.setattr(ExportArtifactsUseCase, "chunk_size", 1)
+
+        chunks = [
+            chunk async for chunk in export_use_case.execute(ArtifactListFilterDTO())
+        ]
+
+        assert len(chunks) == 5
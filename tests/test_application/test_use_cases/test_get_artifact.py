@@ -12,6 +12,7 @@ from src.application.exceptions import (
     FailedFetchArtifactMuseumAPIException,
     FailedPublishArtifactInCatalogException,
     FailedPublishArtifactMessageBrokerException,
+    UpstreamBusyError,
 )
 from src.application.use_cases.get_artifact import GetArtifactUseCase
 from src.domain.entities.artifact import ArtifactEntity
@@ -41,6 +42,26 @@ class TestGetArtifactUseCase:
         mock_museum_api = get_artifact_use_case.museum_api_client
         mock_museum_api.fetch_artifact.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_execute_artifact_served_from_cache(
+        self,
+        get_artifact_use_case: GetArtifactUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test a cache hit is validated from the cached JSON bytes"""
+        inventory_id = str(sample_artifact_dto.inventory_id)
+        mock_cache_client.get_raw.return_value = (
+            sample_artifact_dto.model_dump_json().encode()
+        )
+
+        result = await get_artifact_use_case.execute(inventory_id)
+
+        assert result == sample_artifact_dto
+        mock_cache_client.get_raw.assert_called_once_with(inventory_id)
+        mock_repository.get_by_inventory_id.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_artifact_not_found_locally_fetched_from_api(
         self,
@@ -118,6 +139,25 @@ class TestGetArtifactUseCase:
         mock_museum_api.fetch_artifact.assert_called_once_with(inventory_id)
         mock_repository.save.assert_not_called()
 
+    @pytest.mark.asyncio
+    async def test_execute_museum_api_busy(
+        self,
+        get_artifact_use_case: GetArtifactUseCase,
+        mock_repository: AsyncMock,
+        mock_museum_api: AsyncMock,
+        sample_artifact_entity: ArtifactEntity,
+    ):
+        """Test limiter rejections are passed through, not wrapped as failures"""
+        mock_repository.get_by_inventory_id.return_value = None
+        mock_museum_api.fetch_artifact.side_effect = UpstreamBusyError("busy")
+
+        with pytest.raises(UpstreamBusyError):
+            await get_artifact_use_case.execute(
+                str(sample_artifact_entity.inventory_id)
+            )
+
+        mock_repository.save.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_execute_message_broker_failure(
         self,
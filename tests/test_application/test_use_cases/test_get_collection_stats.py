@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.get_collection_stats import GetCollectionStatsUseCase
+
+
+@pytest.fixture
+def stats_use_case(
+    mock_repository: AsyncMock, mock_cache_client: AsyncMock
+) -> GetCollectionStatsUseCase:
+    return GetCollectionStatsUseCase(
+        repository=mock_repository, cache_client=mock_cache_client, cache_ttl=60
+    )
+
+
+class TestGetCollectionStatsUseCase:
+    @pytest.mark.asyncio
+    async def test_cache_miss_builds_ordered_stats(
+        self,
+        stats_use_case: GetCollectionStatsUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+    ):
+        """Test that summary counts are ordered and cached on a miss"""
+        mock_repository.get_collection_stats.return_value = {
+            "department": {"Numismatics": 2, "Archaeology": 3},
+            "era": {"modern": 1, "antiquity": 2, "bronze_age": 2},
+            "material": {"metal": 4, "ceramic": 1},
+            "acquisition_year": {"2010": 1, "1998": 4},
+        }
+
+        stats = await stats_use_case.execute()
+
+        assert stats.total == 5
+        assert list(stats.by_department) == ["Archaeology", "Numismatics"]
+        assert list(stats.by_era) == ["bronze_age", "antiquity", "modern"]
+        assert stats.by_acquisition_year == {1998: 4, 2010: 1}
+        mock_cache_client.set.assert_called_once_with(
+            "stats:collection", stats.model_dump(mode="json"), ttl=60
+        )
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_repository(
+        self,
+        stats_use_case: GetCollectionStatsUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+    ):
+        """Test that cached stats are served without touching the database"""
+        mock_cache_client.get.return_value = {
+            "total": 1,
+            "by_department": {"Archaeology": 1},
+            "by_era": {"antiquity": 1},
+            "by_material": {"ceramic": 1},
+            "by_acquisition_year": {"2001": 1},
+        }
+
+        stats = await stats_use_case.execute()
+
+        assert stats.by_acquisition_year == {2001: 1}
+        mock_repository.get_collection_stats.assert_not_called()
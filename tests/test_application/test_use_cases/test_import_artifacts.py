@@ -0,0 +1,153 @@
+from collections.abc import AsyncIterator
+from concurrent.futures import ProcessPoolExecutor
+import json
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.interfaces.repositories import ArtifactBulkLoaderProtocol
+from src.application.use_cases.import_artifacts import (
+    ImportArtifactsUseCase,
+    RecordBatch,
+    validate_batch,
+)
+
+
+def _ndjson(**overrides: object) -> str:
+    record = {
+        "inventory_id": str(uuid4()),
+        "created_at": "2024-01-01T00:00:00Z",
+        "acquisition_date": "2023-01-01T00:00:00Z",
+        "name": "Bronze Fibula",
+        "department": "Archaeology",
+        "era": {"value": "bronze_age"},
+        "material": {"value": "metal"},
+        "description": None,
+    }
+    record.update(overrides)
+    return json.dumps(record)
+
+
+def _csv_row(**overrides: str) -> dict[str, str]:
+    row = {
+        "inventory_id": str(uuid4()),
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "acquisition_date": "2023-01-01T00:00:00+00:00",
+        "name": "Glass Bead",
+        "department": "Archaeology",
+        "era": "antiquity",
+        "material": "glass",
+        "description": "",
+    }
+    row.update(overrides)
+    return row
+
+
+async def _batches(*batches: RecordBatch) -> AsyncIterator[RecordBatch]:
+    for batch in batches:
+        yield batch
+
+
+@pytest.fixture
+def mock_loader() -> AsyncMock:
+    loader = AsyncMock(spec=ArtifactBulkLoaderProtocol)
+    loader.load.side_effect = lambda artifacts: len(artifacts)
+    return loader
+
+
+class TestValidateBatch:
+    def test_ndjson_records_become_entities_or_rejects(self):
+        """Test that DTO rules split a batch into entities and rejects"""
+        batch = RecordBatch(
+            first_record=10,
+            records=[
+                _ndjson(),
+                _ndjson(era={"value": "jurassic"}),
+                "{not json",
+                _ndjson(acquisition_date="2999-01-01T00:00:00Z"),
+            ],
+        )
+
+        result = validate_batch(batch)
+
+        assert len(result.artifacts) == 1
+        assert result.artifacts[0].era.value == "bronze_age"
+        assert [r.record for r in result.rejected] == [11, 12, 13]
+        assert "Acquisition date cannot be in the future" in result.rejected[2].error
+
+    def test_imported_created_at_is_preserved(self):
+        """Test that the source created_at survives the DTO-to-entity mapping"""
+        result = validate_batch(
+            RecordBatch(
+                first_record=0,
+                records=[
+                    _ndjson(
+                        created_at="2020-05-05T00:00:00Z",
+                        acquisition_date="2019-01-01T00:00:00Z",
+                    )
+                ],
+            )
+        )
+
+        assert result.artifacts[0].created_at.year == 2020
+
+    def test_csv_rows_use_flat_era_and_material(self):
+        """Test that CSV rows from the export format validate"""
+        result = validate_batch(
+            RecordBatch(
+                first_record=0,
+                records=[_csv_row(), _csv_row(material="plastic")],
+            )
+        )
+
+        assert len(result.artifacts) == 1
+        assert result.artifacts[0].material.value == "glass"
+        assert result.artifacts[0].description is None
+        assert result.rejected[0].record == 1
+
+
+class TestImportArtifactsUseCase:
+    @pytest.mark.asyncio
+    async def test_batches_are_loaded_in_order(self, mock_loader: AsyncMock):
+        """Test that results follow input order with resume points"""
+        use_case = ImportArtifactsUseCase(loader=mock_loader)
+        batches = [
+            RecordBatch(first_record=i * 2, records=[_ndjson(), _ndjson(name="x")])
+            for i in range(3)
+        ]
+
+        results = [r async for r in use_case.execute(_batches(*batches))]
+
+        assert [r.next_record for r in results] == [2, 4, 6]
+        assert [r.loaded for r in results] == [1, 1, 1]
+        assert [len(r.rejected) for r in results] == [1, 1, 1]
+        assert mock_loader.load.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_fully_rejected_batch_skips_the_loader(self, mock_loader: AsyncMock):
+        """Test that a batch without valid records does not touch the database"""
+        use_case = ImportArtifactsUseCase(loader=mock_loader)
+
+        results = [
+            r
+            async for r in use_case.execute(
+                _batches(RecordBatch(first_record=0, records=["{}"]))
+            )
+        ]
+
+        assert results[0].loaded == 0
+        mock_loader.load.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_validation_runs_in_worker_processes(self, mock_loader: AsyncMock):
+        """Test that batches and results survive the trip to a process pool"""
+        use_case = ImportArtifactsUseCase(loader=mock_loader)
+        batches = [RecordBatch(first_record=i, records=[_ndjson()]) for i in range(3)]
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            results = [
+                r async for r in use_case.execute(_batches(*batches), executor=executor)
+            ]
+
+        assert sum(r.loaded for r in results) == 3
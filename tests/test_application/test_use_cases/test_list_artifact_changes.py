@@ -0,0 +1,97 @@
+import base64
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
+
+import pytest
+
+from src.application.dtos.artifact import ArtifactDTO
+from src.application.dtos.pagination import ChangesCursorDTO
+from src.application.exceptions import InvalidCursorError
+from src.application.use_cases.list_artifact_changes import (
+    ListArtifactChangesUseCase,
+)
+from src.domain.entities.artifact import ArtifactEntity
+
+
+@pytest.fixture
+def changes_use_case(
+    mock_repository: AsyncMock, mock_mapper: MagicMock, sample_artifact_dto: ArtifactDTO
+) -> ListArtifactChangesUseCase:
+    mock_mapper.to_dto.return_value = sample_artifact_dto
+    return ListArtifactChangesUseCase(
+        repository=mock_repository, artifact_mapper=mock_mapper
+    )
+
+
+class TestListArtifactChangesUseCase:
+    @pytest.mark.asyncio
+    async def test_since_starts_feed_and_returns_resume_cursor(
+        self,
+        changes_use_case: ListArtifactChangesUseCase,
+        mock_repository: AsyncMock,
+        sample_artifact_entity: ArtifactEntity,
+    ):
+        """Test that since becomes the first cursor and the last row the next"""
+        since = datetime(2024, 1, 1, tzinfo=UTC)
+        updated_at = datetime(2024, 1, 2, tzinfo=UTC)
+        horizon = datetime(2024, 1, 3, tzinfo=UTC)
+        mock_repository.change_feed_horizon.return_value = horizon
+        mock_repository.list_changes.return_value = [
+            (sample_artifact_entity, updated_at),
+            (sample_artifact_entity, updated_at),
+        ]
+
+        page = await changes_use_case.execute(since=since, limit=1)
+
+        kwargs = mock_repository.list_changes.call_args.kwargs
+        assert kwargs["after"] == ChangesCursorDTO(
+            updated_at=since, inventory_id=UUID(int=0)
+        )
+        assert kwargs["limit"] == 2
+        assert kwargs["until"] == horizon
+        mock_repository.change_feed_horizon.assert_called_once_with(
+            timedelta(seconds=5)
+        )
+        assert page.has_more is True
+        assert [item.updated_at for item in page.items] == [updated_at]
+        assert page.next_cursor is not None
+        assert ChangesCursorDTO.decode(page.next_cursor) == ChangesCursorDTO(
+            updated_at=updated_at, inventory_id=sample_artifact_entity.inventory_id
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_page_keeps_cursor(
+        self, changes_use_case: ListArtifactChangesUseCase, mock_repository: AsyncMock
+    ):
+        """Test that a caught-up consumer gets its own cursor back"""
+        cursor = ChangesCursorDTO(
+            updated_at=datetime(2024, 1, 2, tzinfo=UTC), inventory_id=UUID(int=7)
+        ).encode()
+        mock_repository.list_changes.return_value = []
+
+        page = await changes_use_case.execute(cursor=cursor)
+
+        assert page.items == []
+        assert page.has_more is False
+        assert page.next_cursor == cursor
+
+    @pytest.mark.asyncio
+    async def test_cursor_without_utc_offset_is_rejected(
+        self, changes_use_case: ListArtifactChangesUseCase, mock_repository: AsyncMock
+    ):
+        """Test a cursor holding a naive time is refused, not read as local time"""
+        cursor = (
+            base64.urlsafe_b64encode(
+                b'{"updated_at": "2024-01-02T00:00:00", "inventory_id": "'
+                + str(UUID(int=7)).encode()
+                + b'"}'
+            )
+            .decode()
+            .rstrip("=")
+        )
+
+        with pytest.raises(InvalidCursorError):
+            await changes_use_case.execute(cursor=cursor)
+
+        mock_repository.list_changes.assert_not_called()
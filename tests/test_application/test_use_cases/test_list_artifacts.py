@@ -0,0 +1,96 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.artifact import ArtifactDTO, ArtifactListFilterDTO
+from src.application.dtos.pagination import KeysetCursorDTO
+from src.application.exceptions import InvalidCursorError
+from src.application.use_cases.list_artifacts import ListArtifactsUseCase
+from src.domain.entities.artifact import ArtifactEntity
+from src.domain.value_objects.era import Era
+from src.domain.value_objects.material import Material
+
+
+def _entity(minute: int) -> ArtifactEntity:
+    return ArtifactEntity(
+        inventory_id=uuid4(),
+        created_at=datetime(2024, 1, 1, 0, minute, tzinfo=UTC),
+        acquisition_date=datetime(2023, 1, 1, tzinfo=UTC),
+        name=f"Artifact {minute}",
+        department="Archaeology",
+        era=Era(value="antiquity"),
+        material=Material(value="ceramic"),
+    )
+
+
+@pytest.fixture
+def list_artifacts_use_case(
+    mock_repository: AsyncMock, mock_mapper: MagicMock, sample_artifact_dto: ArtifactDTO
+) -> ListArtifactsUseCase:
+    mock_mapper.to_dto.return_value = sample_artifact_dto
+    return ListArtifactsUseCase(repository=mock_repository, artifact_mapper=mock_mapper)
+
+
+class TestListArtifactsUseCase:
+    @pytest.mark.asyncio
+    async def test_execute_returns_next_cursor_when_more_rows(
+        self, list_artifacts_use_case: ListArtifactsUseCase, mock_repository: AsyncMock
+    ):
+        """Test that an extra row produces a cursor pointing at the last item"""
+        entities = [_entity(i) for i in range(3)]
+        mock_repository.list_artifacts.return_value = entities
+
+        page = await list_artifacts_use_case.execute(ArtifactListFilterDTO(), limit=2)
+
+        assert len(page.items) == 2
+        assert page.next_cursor is not None
+        cursor = KeysetCursorDTO.decode(page.next_cursor)
+        assert cursor.inventory_id == entities[1].inventory_id
+        assert cursor.created_at == entities[1].created_at
+        mock_repository.list_artifacts.assert_called_once_with(
+            ArtifactListFilterDTO(), after=None, limit=3
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_last_page_has_no_cursor(
+        self, list_artifacts_use_case: ListArtifactsUseCase, mock_repository: AsyncMock
+    ):
+        """Test that a short page ends pagination"""
+        mock_repository.list_artifacts.return_value = [_entity(0)]
+
+        page = await list_artifacts_use_case.execute(ArtifactListFilterDTO(), limit=2)
+
+        assert len(page.items) == 1
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_execute_passes_decoded_cursor(
+        self, list_artifacts_use_case: ListArtifactsUseCase, mock_repository: AsyncMock
+    ):
+        """Test that the opaque cursor is decoded before reaching the repository"""
+        mock_repository.list_artifacts.return_value = []
+        cursor = KeysetCursorDTO(
+            created_at=datetime(2024, 1, 1, tzinfo=UTC), inventory_id=uuid4()
+        )
+
+        await list_artifacts_use_case.execute(
+            ArtifactListFilterDTO(), cursor=cursor.encode(), limit=500
+        )
+
+        mock_repository.list_artifacts.assert_called_once_with(
+            ArtifactListFilterDTO(),
+            after=cursor,
+            limit=ListArtifactsUseCase.max_page_size + 1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_execute_invalid_cursor(
+        self, list_artifacts_use_case: ListArtifactsUseCase
+    ):
+        """Test that a tampered cursor is rejected"""
+        with pytest.raises(InvalidCursorError):
+            await list_artifacts_use_case.execute(
+                ArtifactListFilterDTO(), cursor="not-a-cursor"
+            )
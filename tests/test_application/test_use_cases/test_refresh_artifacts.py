@@ -0,0 +1,166 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+
+from src.application.dtos.artifact import ArtifactDTO, MuseumValidatorsDTO
+from src.application.dtos.pagination import KeysetCursorDTO
+from src.application.exceptions import ArtifactNotFoundError, UpstreamBusyError
+from src.application.mappers import ArtifactMapper
+from src.application.use_cases.refresh_artifacts import RefreshArtifactsUseCase
+from src.domain.entities.artifact import ArtifactEntity
+
+STORED_CREATED_AT = datetime(2024, 5, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+def stored_artifact(sample_artifact_dto: ArtifactDTO) -> ArtifactEntity:
+    entity = ArtifactMapper().to_entity(sample_artifact_dto)
+    return ArtifactEntity(
+        inventory_id=entity.inventory_id,
+        created_at=STORED_CREATED_AT,
+        acquisition_date=entity.acquisition_date,
+        name=entity.name,
+        department=entity.department,
+        era=entity.era,
+        material=entity.material,
+        description=entity.description,
+    )
+
+
+@pytest.fixture
+def refresh_use_case(
+    mock_repository: AsyncMock,
+    mock_museum_api: AsyncMock,
+    mock_catalog_api: AsyncMock,
+    mock_cache_client: AsyncMock,
+) -> RefreshArtifactsUseCase:
+    return RefreshArtifactsUseCase(
+        repository=mock_repository,
+        museum_api_client=mock_museum_api,
+        catalog_api_client=mock_catalog_api,
+        artifact_mapper=ArtifactMapper(),
+        cache_client=mock_cache_client,
+    )
+
+
+class TestRefreshArtifactsUseCase:
+    @pytest.mark.asyncio
+    async def test_unchanged_artifact_is_skipped(
+        self,
+        refresh_use_case: RefreshArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_museum_api: AsyncMock,
+        mock_catalog_api: AsyncMock,
+        mock_cache_client: AsyncMock,
+        stored_artifact: ArtifactEntity,
+    ):
+        """Test a 304 skips save, cache write and republication"""
+        validators = MuseumValidatorsDTO(etag='"v1"')
+        mock_repository.list_artifacts.return_value = [stored_artifact]
+        mock_repository.get_museum_validators.return_value = {
+            stored_artifact.inventory_id: validators
+        }
+        mock_museum_api.fetch_artifact_if_changed.return_value = None
+
+        page = await refresh_use_case.execute(limit=10)
+
+        assert (page.checked, page.updated, page.failed) == (1, 0, 0)
+        assert not page.has_more
+        mock_museum_api.fetch_artifact_if_changed.assert_called_once_with(
+            stored_artifact.inventory_id, validators
+        )
+        mock_repository.save.assert_not_called()
+        mock_repository.save_museum_validators.assert_not_called()
+        mock_cache_client.set_raw.assert_not_called()
+        mock_catalog_api.publish_artifact.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_changed_artifact_is_saved_and_republished(
+        self,
+        refresh_use_case: RefreshArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_museum_api: AsyncMock,
+        mock_catalog_api: AsyncMock,
+        mock_cache_client: AsyncMock,
+        stored_artifact: ArtifactEntity,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test a changed artifact is stored, cached, published, then its validators"""
+        changed = sample_artifact_dto.model_copy(update={"name": "Restored Vase"})
+        new_validators = MuseumValidatorsDTO(etag='"v2"')
+        mock_repository.list_artifacts.return_value = [stored_artifact]
+        mock_repository.get_museum_validators.return_value = {}
+        mock_museum_api.fetch_artifact_if_changed.return_value = (
+            changed,
+            new_validators,
+        )
+        order = MagicMock()
+        order.attach_mock(mock_repository.save, "save")
+        order.attach_mock(mock_catalog_api.publish_artifact, "publish")
+        order.attach_mock(mock_repository.save_museum_validators, "validators")
+
+        page = await refresh_use_case.execute(limit=10)
+
+        assert (page.checked, page.updated, page.failed) == (1, 1, 0)
+        mock_museum_api.fetch_artifact_if_changed.assert_called_once_with(
+            stored_artifact.inventory_id, None
+        )
+        saved = mock_repository.save.call_args.args[0]
+        assert saved.name == "Restored Vase"
+        assert saved.created_at == STORED_CREATED_AT
+        key, cached = mock_cache_client.set_raw.call_args.args
+        assert key == str(stored_artifact.inventory_id)
+        assert ArtifactDTO.model_validate_json(cached).name == "Restored Vase"
+        assert [c[0] for c in order.mock_calls] == ["save", "publish", "validators"]
+        assert order.mock_calls[-1] == call.validators(
+            stored_artifact.inventory_id, new_validators
+        )
+
+    @pytest.mark.asyncio
+    async def test_failures_are_counted_and_pages_resume(
+        self,
+        refresh_use_case: RefreshArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_museum_api: AsyncMock,
+        stored_artifact: ArtifactEntity,
+    ):
+        """Test a failing artifact does not stop the page and the cursor advances"""
+        mock_repository.list_artifacts.return_value = [stored_artifact] * 3
+        mock_repository.get_museum_validators.return_value = {}
+        mock_museum_api.fetch_artifact_if_changed.side_effect = [
+            ArtifactNotFoundError("gone"),
+            None,
+            None,
+        ]
+
+        page = await refresh_use_case.execute(limit=2)
+
+        assert (page.checked, page.updated, page.failed) == (2, 0, 1)
+        assert page.has_more
+        assert page.next_cursor is not None
+        after = KeysetCursorDTO.decode(page.next_cursor)
+        assert after.inventory_id == stored_artifact.inventory_id
+
+        await refresh_use_case.execute(cursor=page.next_cursor, limit=2)
+        assert mock_repository.list_artifacts.call_args.kwargs["after"] == after
+
+    @pytest.mark.asyncio
+    async def test_busy_museum_api_stops_the_page(
+        self,
+        refresh_use_case: RefreshArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_museum_api: AsyncMock,
+        stored_artifact: ArtifactEntity,
+    ):
+        """Test load shedding by the museum API aborts instead of failing each artifact"""
+        mock_repository.list_artifacts.return_value = [stored_artifact] * 2
+        mock_repository.get_museum_validators.return_value = {}
+        mock_museum_api.fetch_artifact_if_changed.side_effect = UpstreamBusyError(
+            "busy"
+        )
+
+        with pytest.raises(UpstreamBusyError):
+            await refresh_use_case.execute(limit=10)
+
+        assert mock_museum_api.fetch_artifact_if_changed.call_count == 1
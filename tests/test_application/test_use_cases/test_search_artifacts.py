@@ -0,0 +1,120 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.dtos.artifact import ArtifactDTO
+from src.application.dtos.pagination import SearchCursorDTO
+from src.application.exceptions import InvalidSearchQueryError
+from src.application.use_cases.search_artifacts import SearchArtifactsUseCase
+from src.domain.entities.artifact import ArtifactEntity
+
+
+@pytest.fixture
+def search_use_case(
+    mock_repository: AsyncMock,
+    mock_mapper: MagicMock,
+    mock_cache_client: AsyncMock,
+    sample_artifact_dto: ArtifactDTO,
+) -> SearchArtifactsUseCase:
+    mock_mapper.to_dto.return_value = sample_artifact_dto
+    return SearchArtifactsUseCase(
+        repository=mock_repository,
+        artifact_mapper=mock_mapper,
+        cache_client=mock_cache_client,
+        cache_ttl=60,
+    )
+
+
+class TestSearchArtifactsUseCase:
+    @pytest.mark.asyncio
+    async def test_first_page_is_cached(
+        self,
+        search_use_case: SearchArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+        sample_artifact_entity: ArtifactEntity,
+    ):
+        """Test that a cache miss queries the repository and stores the page"""
+        mock_repository.search.return_value = [(sample_artifact_entity, 0.8)]
+
+        page = await search_use_case.execute("  Ancient   VASE ", limit=5)
+
+        assert [hit.score for hit in page.items] == [0.8]
+        assert page.next_cursor is None
+        mock_repository.search.assert_called_once_with(
+            "ancient vase", after=None, limit=6
+        )
+        key, value = mock_cache_client.set.call_args[0]
+        assert key.startswith("search:5:")
+        assert value == page.model_dump(mode="json")
+        assert mock_cache_client.set.call_args.kwargs == {"ttl": 60}
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_repository(
+        self,
+        search_use_case: SearchArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test that popular queries are served from cache"""
+        cached = {
+            "items": [
+                {"artifact": sample_artifact_dto.model_dump(mode="json"), "score": 1}
+            ],
+            "next_cursor": None,
+        }
+        mock_cache_client.get.return_value = cached
+
+        page = await search_use_case.execute("vase")
+
+        assert page.items[0].artifact == sample_artifact_dto
+        mock_repository.search.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_next_page_uses_cursor_and_bypasses_cache(
+        self,
+        search_use_case: SearchArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+        sample_artifact_entity: ArtifactEntity,
+    ):
+        """Test cursor round trip for ranked results"""
+        mock_repository.search.return_value = [
+            (sample_artifact_entity, 0.9),
+            (sample_artifact_entity, 0.5),
+        ]
+
+        page = await search_use_case.execute("vase", limit=1)
+        assert page.next_cursor is not None
+        mock_cache_client.reset_mock()
+        mock_repository.search.reset_mock()
+        mock_repository.search.return_value = []
+
+        await search_use_case.execute("vase", cursor=page.next_cursor, limit=1)
+
+        mock_repository.search.assert_called_once_with(
+            "vase",
+            after=SearchCursorDTO(
+                score=0.9, inventory_id=sample_artifact_entity.inventory_id
+            ),
+            limit=2,
+        )
+        mock_cache_client.get.assert_not_called()
+        mock_cache_client.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query", ["  ", " \t\n ", " a "])
+    async def test_blank_query_is_rejected(
+        self,
+        search_use_case: SearchArtifactsUseCase,
+        mock_repository: AsyncMock,
+        mock_cache_client: AsyncMock,
+        query: str,
+    ):
+        """Test the length check applies to the normalized query, not the raw one"""
+        with pytest.raises(InvalidSearchQueryError):
+            await search_use_case.execute(query)
+
+        mock_repository.search.assert_not_called()
+        mock_cache_client.get.assert_not_called()
@@ -2,6 +2,7 @@ import pytest
 
 from src.domain.exceptions import InvalidEraException
 from src.domain.value_objects.era import Era
+from src.infrastructures.db.models.artifact import ERA_CODES
 
 
 class TestEra:
@@ -64,6 +65,15 @@ class TestEra:
         era2 = Era(value="modern")
 
         assert era1 != era2
+        assert Era(value="modern") > Era(value="bronze_age") >= Era(value="bronze_age")
+
+    def test_era_sorting_matches_stored_codes(self):
+        """Test Python sorting agrees with ORDER BY on the stored era codes"""
+        eras = [Era(value=value) for value in sorted(ERA_CODES)]
+
+        assert [era.value for era in sorted(eras)] == sorted(
+            ERA_CODES, key=ERA_CODES.__getitem__
+        )
 
     def test_era_hash(self):
         """Test that Era can be hashed"""
@@ -108,6 +118,16 @@ class TestEra:
         }
         assert Era._allowed_values == expected_values
 
+    def test_era_chronology_covers_allowed_values(self):
+        """Test that chronology lists every allowed era once, oldest first"""
+        assert len(set(Era.chronology)) == len(Era.chronology)
+        assert [Era(value=value).value for value in Era.chronology] == list(
+            Era.chronology
+        )
+        assert set(Era.chronology) == set(ERA_CODES)
+        assert Era.chronology[0] == "paleolithic"
+        assert Era.chronology[-1] == "modern"
+
     def test_era_post_init_validation(self):
         """Test that validation happens in __post_init__"""
         with pytest.raises(InvalidEraException):
@@ -1,15 +1,20 @@
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import final
 from uuid import UUID
 
+from sqlalchemy import tuple_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from src.application.dtos.artifact import ArtifactListFilterDTO
+from src.application.dtos.pagination import KeysetCursorDTO
 from src.application.interfaces.repositories import ArtifactRepositoryProtocol
 from src.domain.entities.artifact import ArtifactEntity
 from src.infrastructures.db.exceptions import (
     RepositoryConflictError,
+    RepositoryReadError,
     RepositorySaveError,
 )
 from tests.test_infrastructure.test_db.models.test_artifact_model import (
@@ -41,10 +46,57 @@ class TestArtifactRepositorySQLAlchemy(ArtifactRepositoryProtocol):
                 return None
             return artifact_model.to_dataclass()
         except SQLAlchemyError as e:
-            raise RepositorySaveError(
+            raise RepositoryReadError(
                 f"Failed to retrieve artifact by inventory_id '{inventory_id}': {e}"
             ) from e
 
+    async def get_by_inventory_ids(
+        self, inventory_ids: Sequence[str | UUID]
+    ) -> list[ArtifactEntity]:
+        stmt = select(TestArtifactModel).where(
+            TestArtifactModel.inventory_id.in_([str(i) for i in inventory_ids])
+        )
+        try:
+            result = await self.session.execute(stmt)
+            return [model.to_dataclass() for model in result.scalars()]
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(f"Failed to retrieve artifacts: {e}") from e
+
+    async def list_artifacts(
+        self,
+        filters: ArtifactListFilterDTO,
+        *,
+        after: KeysetCursorDTO | None = None,
+        limit: int,
+    ) -> list[ArtifactEntity]:
+        stmt = select(TestArtifactModel)
+        if filters.department is not None:
+            stmt = stmt.where(TestArtifactModel.department == filters.department)
+        if filters.era is not None:
+            stmt = stmt.where(TestArtifactModel.era == filters.era.value)
+        if filters.material is not None:
+            stmt = stmt.where(TestArtifactModel.material == filters.material.value)
+        if filters.acquired_from is not None:
+            stmt = stmt.where(
+                TestArtifactModel.acquisition_date >= filters.acquired_from
+            )
+        if filters.acquired_to is not None:
+            stmt = stmt.where(TestArtifactModel.acquisition_date <= filters.acquired_to)
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(TestArtifactModel.created_at, TestArtifactModel.inventory_id)
+                > tuple_(after.created_at, str(after.inventory_id))
+            )
+        stmt = stmt.order_by(
+            TestArtifactModel.created_at, TestArtifactModel.inventory_id
+        ).limit(limit)
+
+        try:
+            result = await self.session.execute(stmt)
+            return [model.to_dataclass() for model in result.scalars()]
+        except SQLAlchemyError as e:
+            raise RepositoryReadError(f"Failed to list artifacts: {e}") from e
+
     async def save(self, artifact: ArtifactEntity) -> None:
         try:
             inventory_id_str = str(artifact.inventory_id)
@@ -0,0 +1,209 @@
+from collections.abc import AsyncGenerator
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from src.application.dtos.artifact import ArtifactDTO
+from src.application.interfaces.mappers import DtoEntityMapperProtocol
+from src.application.mappers import ArtifactMapper
+from src.application.use_cases.get_artifact import GetArtifactUseCase
+from src.domain.entities.artifact import ArtifactEntity
+from src.infrastructures.db.instrumentation import (
+    instrument_pool_checkouts,
+    instrument_pool_usage,
+    instrument_statements,
+    normalize_statement,
+    redact_parameters,
+    track_request_checkouts,
+)
+from src.infrastructures.db.session import create_engine
+from src.infrastructures.metrics import MetricsRegistry
+from tests.test_infrastructure.test_db.models.test_artifact_model import (
+    TestArtifactModel,
+    test_mapper_registry,
+)
+from tests.test_infrastructure.test_db.repositories.test_artifact_repository_impl import (
+    TestArtifactRepositorySQLAlchemy,
+)
+
+
+@pytest.fixture
+async def instrumented_engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(test_mapper_registry.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+def _use_case(
+    session: AsyncSession,
+    cache_client: AsyncMock,
+    mapper: DtoEntityMapperProtocol | None = None,
+) -> GetArtifactUseCase:
+    return GetArtifactUseCase(
+        repository=TestArtifactRepositorySQLAlchemy(session=session),
+        museum_api_client=AsyncMock(),
+        catalog_api_client=AsyncMock(),
+        message_broker=AsyncMock(),
+        artifact_mapper=mapper or ArtifactMapper(),
+        cache_client=cache_client,
+    )
+
+
+class TestPoolCheckoutInstrumentation:
+    @pytest.mark.asyncio
+    async def test_cache_hit_does_not_check_out_connection(
+        self,
+        instrumented_engine: AsyncEngine,
+        mock_cache_client: AsyncMock,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test that a request served from cache never touches the pool"""
+        metrics = MetricsRegistry()
+        instrument_pool_checkouts(instrumented_engine, metrics, role="primary")
+        factory = async_sessionmaker(instrumented_engine, expire_on_commit=False)
+        mock_cache_client.get_raw.return_value = sample_artifact_dto.model_dump_json()
+
+        with track_request_checkouts() as checkouts:
+            async with factory() as session:
+                result = await _use_case(session, mock_cache_client).execute(
+                    str(sample_artifact_dto.inventory_id)
+                )
+
+        assert result == sample_artifact_dto
+        assert checkouts[0] == 0
+        assert metrics.counter("db_pool_checkouts_total", "").value(role="primary") == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_checks_out_connection(
+        self,
+        instrumented_engine: AsyncEngine,
+        mock_cache_client: AsyncMock,
+        mock_mapper: MagicMock,
+        sample_artifact_entity: ArtifactEntity,
+        sample_artifact_dto: ArtifactDTO,
+    ):
+        """Test that a repository read is counted against the request"""
+        metrics = MetricsRegistry()
+        instrument_pool_checkouts(instrumented_engine, metrics, role="primary")
+        factory = async_sessionmaker(instrumented_engine, expire_on_commit=False)
+        mock_mapper.to_dto.return_value = sample_artifact_dto
+        async with factory() as session:
+            session.add(TestArtifactModel.from_dataclass(sample_artifact_entity))
+            await session.commit()
+
+        with track_request_checkouts() as checkouts:
+            async with factory() as session:
+                result = await _use_case(
+                    session, mock_cache_client, mock_mapper
+                ).execute(str(sample_artifact_entity.inventory_id))
+
+        assert result == sample_artifact_dto
+        assert checkouts[0] == 1
+        mock_cache_client.set_raw.assert_called_once()
+
+
+class TestPoolUsageInstrumentation:
+    @pytest.mark.asyncio
+    async def test_pool_gauges_acquire_time_and_timeouts(self):
+        """Test occupancy gauges, acquire histogram and timeout counter"""
+        engine = create_engine(
+            "sqlite+aiosqlite:///:memory:",
+            is_echo=False,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.05,
+        )
+        metrics = MetricsRegistry()
+        instrument_pool_usage({"primary": engine}, metrics)
+
+        try:
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+                assert 'db_pool_checked_out{pool="primary"} 1' in metrics.render()
+
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+        finally:
+            await engine.dispose()
+
+        acquire = metrics.histogram("db_pool_acquire_seconds", "", ["pool"])
+        assert acquire.count(pool="primary") == 2
+        assert (
+            metrics.counter("db_pool_timeouts_total", "", ["pool"]).value(
+                pool="primary"
+            )
+            == 1
+        )
+        output = metrics.render()
+        assert 'db_pool_checked_out{pool="primary"} 0' in output
+        assert 'db_pool_size{pool="primary"} 1' in output
+
+
+class TestStatementInstrumentation:
+    def test_normalize_statement_strips_literals_and_in_lists(self):
+        """Test that statements differing only in values share one shape"""
+        first = normalize_statement(
+            "SELECT *\n  FROM artifacts WHERE inventory_id IN ($1, $2, $3)"
+            " AND name = 'Amphora' LIMIT 20"
+        )
+        second = normalize_statement(
+            "SELECT * FROM artifacts WHERE inventory_id IN ($1)"
+            " AND name = 'Krater' LIMIT 50"
+        )
+
+        assert first == second
+        assert first == (
+            "SELECT * FROM artifacts WHERE inventory_id IN (...) AND name = ? LIMIT ?"
+        )
+
+    def test_normalize_statement_keeps_casts(self):
+        """Test that ::type casts are not mistaken for named parameters"""
+        assert normalize_statement("SELECT 'simple'::regconfig, :name") == (
+            "SELECT ?::regconfig, ?"
+        )
+
+    def test_redact_parameters(self):
+        """Test that bound values are replaced with their type names"""
+        assert redact_parameters(("secret", 42, None)) == ["<str>", "<int>", None]
+        assert redact_parameters({"name": "secret"}) == {"name": "<str>"}
+        assert redact_parameters([(1,), (2,)], executemany=True) == (
+            "<2 parameter sets>"
+        )
+
+    @pytest.mark.asyncio
+    async def test_statements_are_timed_and_slow_ones_logged(
+        self, caplog: pytest.LogCaptureFixture
+    ):
+        """Test per-statement histograms and the redacted slow-query log"""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        metrics = MetricsRegistry()
+        instrument_statements(engine, metrics, slow_query_threshold=0.0)
+
+        try:
+            with caplog.at_level(logging.WARNING):
+                async with engine.connect() as conn:
+                    for value in ("first secret", "second secret"):
+                        await conn.execute(text("SELECT :value"), {"value": value})
+                    with pytest.raises(exc.OperationalError):
+                        await conn.execute(text("SELECT * FROM missing_table"))
+        finally:
+            await engine.dispose()
+
+        durations = metrics.histogram("db_statement_seconds", "", ["statement"])
+        assert durations.count(statement="SELECT ?") == 2
+        assert durations.count(statement="SELECT * FROM missing_table") == 1
+        slow = [r for r in caplog.records if r.getMessage() == "Slow query"]
+        assert [r.parameters for r in slow[:2]] == [["<str>"], ["<str>"]]
+        assert slow[-1].error == "OperationalError"
+        assert "secret" not in caplog.text
@@ -0,0 +1,64 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructures.db.liveness import IdleConnectionChecker
+from src.infrastructures.db.session import create_engine
+from src.infrastructures.metrics import MetricsRegistry
+
+
+@pytest.fixture
+async def pooled_engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_engine(
+        "sqlite+aiosqlite:///:memory:",
+        is_echo=False,
+        pool_size=2,
+        max_overflow=0,
+        pool_pre_ping=False,
+    )
+    # Open two connections at once so the pool keeps two idle ones
+    async with engine.connect() as first, engine.connect() as second:
+        await first.execute(text("SELECT 1"))
+        await second.execute(text("SELECT 1"))
+    yield engine
+    await engine.dispose()
+
+
+class TestIdleConnectionChecker:
+    @pytest.mark.asyncio
+    async def test_live_idle_connections_are_kept(self, pooled_engine: AsyncEngine):
+        """Test that healthy idle connections stay in the pool untouched"""
+        checker = IdleConnectionChecker(
+            engines={"primary": pooled_engine}, metrics=MetricsRegistry()
+        )
+
+        assert await checker.check_once() == 0
+        assert pooled_engine.sync_engine.pool.checkedin() == 2
+
+    @pytest.mark.asyncio
+    async def test_dead_idle_connections_are_invalidated(
+        self, pooled_engine: AsyncEngine, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that dead idle connections are invalidated and counted"""
+        metrics = MetricsRegistry()
+        checker = IdleConnectionChecker(
+            engines={"primary": pooled_engine}, metrics=metrics
+        )
+        pool = pooled_engine.sync_engine.pool
+        # The pool pings through the engine's dialect
+        monkeypatch.setattr(
+            pooled_engine.sync_engine.dialect, "_do_ping_w_event", lambda _: False
+        )
+
+        assert await checker.check_once() == 2
+        assert pool.checkedin() == 2
+        invalidated = metrics.counter(
+            "db_idle_connections_invalidated_total", "", ["pool"]
+        )
+        assert invalidated.value(pool="primary") == 2
+
+        monkeypatch.undo()
+        async with pooled_engine.connect() as conn:
+            assert (await conn.execute(text("SELECT 1"))).scalar_one() == 1
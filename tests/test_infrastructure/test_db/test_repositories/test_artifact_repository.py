@@ -1,10 +1,12 @@
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from uuid import uuid4
 
 import pytest
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.dtos.artifact import ArtifactListFilterDTO, EraDTO
+from src.application.dtos.pagination import KeysetCursorDTO
 from src.domain.entities.artifact import ArtifactEntity
 from src.domain.value_objects.era import Era
 from src.domain.value_objects.material import Material
@@ -338,3 +340,80 @@ class TestArtifactRepository:
 
         result = await repository.get_by_inventory_id("not-a-uuid")
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_list_artifacts_keyset_pages(self, test_session: AsyncSession):
+        """Test that keyset pages cover every row once in creation order"""
+        repository = TestArtifactRepositorySQLAlchemy(session=test_session)
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        for i in range(5):
+            test_session.add(
+                TestArtifactModel(
+                    inventory_id=uuid4(),
+                    created_at=base + timedelta(minutes=i),
+                    acquisition_date=datetime(2023, 1, 1, tzinfo=UTC),
+                    name=f"Artifact {i}",
+                    department="Archaeology",
+                    era="antiquity",
+                    material="ceramic",
+                )
+            )
+        await test_session.commit()
+
+        first = await repository.list_artifacts(ArtifactListFilterDTO(), limit=2)
+        cursor = KeysetCursorDTO(
+            created_at=first[-1].created_at, inventory_id=first[-1].inventory_id
+        )
+        rest = await repository.list_artifacts(
+            ArtifactListFilterDTO(), after=cursor, limit=10
+        )
+
+        names = [a.name for a in first + rest]
+        assert names == [f"Artifact {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_list_artifacts_filters(self, test_session: AsyncSession):
+        """Test department, era and acquisition date filters"""
+        repository = TestArtifactRepositorySQLAlchemy(session=test_session)
+        rows = [
+            ("Archaeology", "antiquity", datetime(2020, 1, 1, tzinfo=UTC)),
+            ("Archaeology", "modern", datetime(2021, 1, 1, tzinfo=UTC)),
+            ("Numismatics", "antiquity", datetime(2022, 1, 1, tzinfo=UTC)),
+        ]
+        for department, era, acquired in rows:
+            test_session.add(
+                TestArtifactModel(
+                    inventory_id=uuid4(),
+                    created_at=datetime.now(UTC),
+                    acquisition_date=acquired,
+                    name=f"{department} {era}",
+                    department=department,
+                    era=era,
+                    material="metal",
+                )
+            )
+        await test_session.commit()
+
+        by_department = await repository.list_artifacts(
+            ArtifactListFilterDTO(department="Archaeology"), limit=10
+        )
+        by_era = await repository.list_artifacts(
+            ArtifactListFilterDTO(era=EraDTO(value="antiquity")), limit=10
+        )
+        by_date = await repository.list_artifacts(
+            ArtifactListFilterDTO(
+                acquired_from=datetime(2020, 6, 1, tzinfo=UTC),
+                acquired_to=datetime(2021, 6, 1, tzinfo=UTC),
+            ),
+            limit=10,
+        )
+
+        assert {a.name for a in by_department} == {
+            "Archaeology antiquity",
+            "Archaeology modern",
+        }
+        assert {a.name for a in by_era} == {
+            "Archaeology antiquity",
+            "Numismatics antiquity",
+        }
+        assert [a.name for a in by_date] == ["Archaeology modern"]
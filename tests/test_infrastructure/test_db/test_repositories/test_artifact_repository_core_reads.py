@@ -0,0 +1,339 @@
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import Integer, insert, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from src.application.dtos.artifact import (
+    ArtifactListFilterDTO,
+    CatalogPublicationRecordDTO,
+    EraDTO,
+    MuseumValidatorsDTO,
+)
+from src.application.dtos.pagination import ChangesCursorDTO
+from src.domain.entities.artifact import ArtifactEntity
+from src.domain.value_objects.era import Era
+from src.domain.value_objects.material import Material
+from src.infrastructures.db.exceptions import RepositoryReadError
+from src.infrastructures.db.models.artifact import (
+    ERA_CODES,
+    MATERIAL_CODES,
+    artifact_catalog_publications_table,
+    artifact_museum_validators_table,
+    artifact_stats_table,
+    artifact_table,
+)
+from src.infrastructures.db.repositories.artifact import ArtifactRepositorySQLAlchemy
+
+
+@pytest.fixture
+async def core_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
+    # Table only: the production indexes use Postgres-only GIN/tsvector DDL
+    async with test_engine.begin() as conn:
+        await conn.execute(CreateTable(artifact_table))
+        await conn.execute(CreateTable(artifact_stats_table))
+        await conn.execute(CreateTable(artifact_museum_validators_table))
+        await conn.execute(CreateTable(artifact_catalog_publications_table))
+    factory = async_sessionmaker(test_engine, expire_on_commit=False)
+    async with factory() as session:
+        yield session
+
+
+def _fail_first_execute(
+    monkeypatch: pytest.MonkeyPatch, session: AsyncSession, *, disconnect: bool
+) -> list[int]:
+    real_execute = session.execute
+    calls = [0]
+
+    async def execute(*args, **kwargs):
+        calls[0] += 1
+        if calls[0] == 1:
+            raise DBAPIError(
+                "SELECT",
+                {},
+                ConnectionResetError("connection is closed"),
+                connection_invalidated=disconnect,
+            )
+        return await real_execute(*args, **kwargs)
+
+    monkeypatch.setattr(session, "execute", execute)
+    return calls
+
+
+def _entity(name: str) -> ArtifactEntity:
+    return ArtifactEntity(
+        inventory_id=uuid4(),
+        acquisition_date=datetime(2023, 1, 1, tzinfo=UTC),
+        name=name,
+        department="Archaeology",
+        era=Era(value="bronze_age"),
+        material=Material(value="metal"),
+        description=f"{name} description",
+    )
+
+
+class TestArtifactRepositoryCoreReads:
+    @pytest.mark.asyncio
+    async def test_get_by_inventory_id_builds_entity_from_row(
+        self, core_session: AsyncSession
+    ):
+        """Test that the Core read path returns a fully mapped entity"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        artifact = _entity("Bronze Dagger")
+        await repository.save(artifact)
+
+        result = await repository.get_by_inventory_id(artifact.inventory_id)
+
+        assert result is not None
+        assert result.inventory_id == artifact.inventory_id
+        assert result.name == "Bronze Dagger"
+        assert result.era == Era(value="bronze_age")
+        assert result.material == Material(value="metal")
+        assert result.description == "Bronze Dagger description"
+
+    @pytest.mark.asyncio
+    async def test_get_by_inventory_id_missing(self, core_session: AsyncSession):
+        """Test that a missing artifact yields None"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+
+        assert await repository.get_by_inventory_id(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_museum_validators_are_upserted(self, core_session: AsyncSession):
+        """Test validators are stored per artifact and replaced on refresh"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        first, second = uuid4(), uuid4()
+        await repository.save_museum_validators(first, MuseumValidatorsDTO(etag='"v1"'))
+        await repository.save_museum_validators(
+            first,
+            MuseumValidatorsDTO(
+                etag='"v2"', last_modified="Thu, 02 Jan 2025 00:00:00 GMT"
+            ),
+        )
+
+        stored = await repository.get_museum_validators([first, second])
+
+        assert stored == {
+            first: MuseumValidatorsDTO(
+                etag='"v2"', last_modified="Thu, 02 Jan 2025 00:00:00 GMT"
+            )
+        }
+        assert await repository.get_museum_validators([]) == {}
+
+    @pytest.mark.asyncio
+    async def test_catalog_publication_is_upserted(self, core_session: AsyncSession):
+        """Test the last catalog publication is replaced on republish"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        inventory_id = uuid4()
+        assert await repository.get_catalog_publication(inventory_id) is None
+
+        for content_hash, public_id in (("a" * 64, "pub-1"), ("b" * 64, "pub-2")):
+            await repository.save_catalog_publication(
+                CatalogPublicationRecordDTO(
+                    inventory_id=inventory_id,
+                    content_hash=content_hash,
+                    public_id=public_id,
+                )
+            )
+
+        stored = await repository.get_catalog_publication(inventory_id)
+        assert stored == CatalogPublicationRecordDTO(
+            inventory_id=inventory_id, content_hash="b" * 64, public_id="pub-2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_get_by_inventory_ids_batch(self, core_session: AsyncSession):
+        """Test that batch reads return only the requested artifacts"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        artifacts = [_entity(f"Artifact {i}") for i in range(4)]
+        for artifact in artifacts:
+            await repository.save(artifact)
+
+        wanted = [artifacts[0].inventory_id, artifacts[2].inventory_id, uuid4()]
+        result = await repository.get_by_inventory_ids(wanted)
+
+        assert {a.name for a in result} == {"Artifact 0", "Artifact 2"}
+        assert await repository.get_by_inventory_ids([]) == []
+
+    @pytest.mark.asyncio
+    async def test_stream_artifacts_filters_and_orders(
+        self, core_session: AsyncSession
+    ):
+        """Test that streaming yields filtered rows in creation order"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        artifacts = [_entity(f"Artifact {i}") for i in range(5)]
+        for artifact in artifacts:
+            await repository.save(artifact)
+        other = ArtifactEntity(
+            inventory_id=uuid4(),
+            acquisition_date=datetime(2023, 1, 1, tzinfo=UTC),
+            name="Silver Coin",
+            department="Numismatics",
+            era=Era(value="antiquity"),
+            material=Material(value="metal"),
+        )
+        await repository.save(other)
+
+        streamed = [
+            artifact
+            async for artifact in repository.stream_artifacts(
+                ArtifactListFilterDTO(department="Archaeology"), batch_size=2
+            )
+        ]
+
+        assert [a.name for a in streamed] == [a.name for a in artifacts]
+
+    @pytest.mark.asyncio
+    async def test_era_and_material_are_stored_as_codes(
+        self, core_session: AsyncSession
+    ):
+        """Test that era and material are persisted as their smallint codes"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        artifact = _entity("Bronze Dagger")
+        await repository.save(artifact)
+
+        raw = select(
+            artifact_table.c.era.cast(Integer), artifact_table.c.material.cast(Integer)
+        )
+        era, material = (await core_session.execute(raw)).one()
+
+        assert era == ERA_CODES["bronze_age"]
+        assert material == MATERIAL_CODES["metal"]
+
+    @pytest.mark.asyncio
+    async def test_era_range_filter_is_chronological(self, core_session: AsyncSession):
+        """Test that era_from/era_to select eras in chronological order"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        for era in Era.chronology:
+            await repository.save(
+                ArtifactEntity(
+                    inventory_id=uuid4(),
+                    acquisition_date=datetime(2023, 1, 1, tzinfo=UTC),
+                    name=era,
+                    department="Archaeology",
+                    era=Era(value=era),
+                    material=Material(value="stone"),
+                )
+            )
+
+        filters = ArtifactListFilterDTO(
+            era_from=EraDTO(value="bronze_age"), era_to=EraDTO(value="antiquity")
+        )
+        streamed = [a async for a in repository.stream_artifacts(filters)]
+
+        assert [a.era.value for a in streamed] == [
+            "bronze_age",
+            "iron_age",
+            "antiquity",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_keeps_collection_stats_in_step(
+        self, core_session: AsyncSession
+    ):
+        """Test that inserts and updates move counts between stats buckets"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        first, second = _entity("Bronze Dagger"), _entity("Bronze Axe")
+        await repository.save(first)
+        await repository.save(second)
+        await repository.save(
+            ArtifactEntity(
+                inventory_id=second.inventory_id,
+                acquisition_date=datetime(1999, 6, 1, tzinfo=UTC),
+                name="Bronze Axe",
+                department="Arms",
+                era=Era(value="iron_age"),
+                material=Material(value="metal"),
+            )
+        )
+
+        stats = await repository.get_collection_stats()
+
+        assert stats == {
+            "department": {"Archaeology": 1, "Arms": 1},
+            "era": {"bronze_age": 1, "iron_age": 1},
+            "material": {"metal": 2},
+            "acquisition_year": {"2023": 1, "1999": 1},
+        }
+
+    @pytest.mark.asyncio
+    async def test_list_changes_orders_and_resumes(self, core_session: AsyncSession):
+        """Test that the change feed pages by (updated_at, inventory_id)"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        base = datetime(2024, 1, 1, tzinfo=UTC)
+        rows = [
+            {
+                "inventory_id": uuid4(),
+                "created_at": base,
+                "updated_at": base + timedelta(minutes=minute),
+                "acquisition_date": base,
+                "name": f"Artifact {minute}",
+                "department": "Archaeology",
+                "era": "antiquity",
+                "material": "ceramic",
+            }
+            for minute in (3, 1, 2, 9)
+        ]
+        await core_session.execute(insert(artifact_table), rows)
+        until = base + timedelta(minutes=5)
+
+        first = await repository.list_changes(until=until, limit=2)
+        # SQLite drops the offset that timestamptz keeps on Postgres
+        after = ChangesCursorDTO(
+            updated_at=first[-1][1].replace(tzinfo=UTC),
+            inventory_id=first[-1][0].inventory_id,
+        )
+        rest = await repository.list_changes(after=after, until=until, limit=10)
+
+        assert [e.name for e, _ in first] == ["Artifact 1", "Artifact 2"]
+        assert [e.name for e, _ in rest] == ["Artifact 3"]
+
+
+class TestArtifactRepositoryDisconnectRetry:
+    @pytest.mark.asyncio
+    async def test_read_is_retried_once_after_disconnect(
+        self, core_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a read on a dead connection is retried on a fresh one"""
+        repository = ArtifactRepositorySQLAlchemy(
+            session=core_session, retry_reads_on_disconnect=True
+        )
+        artifact = _entity("Bronze Mirror")
+        await repository.save(artifact)
+        calls = _fail_first_execute(monkeypatch, core_session, disconnect=True)
+
+        result = await repository.get_by_inventory_id(artifact.inventory_id)
+
+        assert result is not None
+        assert result.name == "Bronze Mirror"
+        assert calls[0] == 2
+
+    @pytest.mark.asyncio
+    async def test_disconnect_is_not_retried_when_disabled(
+        self, core_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that pre-ping mode surfaces disconnects without retrying"""
+        repository = ArtifactRepositorySQLAlchemy(session=core_session)
+        calls = _fail_first_execute(monkeypatch, core_session, disconnect=True)
+
+        with pytest.raises(RepositoryReadError):
+            await repository.get_by_inventory_ids([uuid4()])
+        assert calls[0] == 1
+
+    @pytest.mark.asyncio
+    async def test_other_database_errors_are_not_retried(
+        self, core_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that only invalidated connections trigger the retry"""
+        repository = ArtifactRepositorySQLAlchemy(
+            session=core_session, retry_reads_on_disconnect=True
+        )
+        calls = _fail_first_execute(monkeypatch, core_session, disconnect=False)
+
+        with pytest.raises(RepositoryReadError):
+            await repository.get_by_inventory_id(uuid4())
+        assert calls[0] == 1
@@ -0,0 +1,121 @@
+from collections.abc import AsyncGenerator
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from src.infrastructures.db import routing
+from src.infrastructures.db.models.artifact import ArtifactModel
+from src.infrastructures.db.routing import ReplicaRouter, pin_to_primary
+from src.infrastructures.db.session import get_session_factory
+
+
+@pytest.fixture
+async def router() -> AsyncGenerator[ReplicaRouter, None]:
+    def engine() -> AsyncEngine:
+        return create_async_engine("sqlite+aiosqlite:///:memory:")
+
+    router = ReplicaRouter(primary=engine(), replicas=[engine(), engine()])
+    yield router
+    await router.close()
+
+
+class TestReplicaRouting:
+    @pytest.mark.asyncio
+    async def test_reads_go_to_healthy_replica(self, router: ReplicaRouter):
+        """Test that plain reads are routed to a healthy replica"""
+        router.set_healthy([router.replicas[1]])
+        factory = get_session_factory(router.primary, router)
+
+        async with factory() as session:
+            bind = session.get_bind(clause=select(ArtifactModel))
+
+        assert bind is router.replicas[1].sync_engine
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_primary_without_healthy_replicas(
+        self, router: ReplicaRouter
+    ):
+        """Test that reads use the primary when every replica is unhealthy"""
+        router.set_healthy([])
+        factory = get_session_factory(router.primary, router)
+
+        async with factory() as session:
+            bind = session.get_bind(clause=select(ArtifactModel))
+
+        assert bind is router.primary.sync_engine
+
+    @pytest.mark.asyncio
+    async def test_session_reads_its_writes_from_primary(self, router: ReplicaRouter):
+        """Test that a session sticks to the primary after writing"""
+        router.set_healthy(list(router.replicas))
+        factory = get_session_factory(router.primary, router)
+
+        async with factory() as session:
+            write_bind = session.get_bind(clause=insert(ArtifactModel))
+            read_bind = session.get_bind(clause=select(ArtifactModel))
+
+        assert write_bind is router.primary.sync_engine
+        assert read_bind is router.primary.sync_engine
+
+    @pytest.mark.asyncio
+    async def test_pin_to_primary(self, router: ReplicaRouter):
+        """Test explicit pinning used by the repository before saving"""
+        router.set_healthy(list(router.replicas))
+        factory = get_session_factory(router.primary, router)
+
+        async with factory() as session:
+            pin_to_primary(session)
+            bind = session.get_bind(clause=select(ArtifactModel))
+
+        assert bind is router.primary.sync_engine
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_is_marked_unhealthy(self, router: ReplicaRouter):
+        """Test that a failing health check removes the replica from rotation"""
+        router.set_healthy(list(router.replicas))
+
+        # SQLite has no pg_is_in_recovery(), so the lag probe fails
+        await router.check_replicas()
+
+        assert router.pick_read_engine() is router.primary
+
+    @pytest.mark.asyncio
+    async def test_idle_caught_up_replica_stays_healthy(
+        self, router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a standby with no WAL left to replay is not lagging while idle"""
+        # Streaming standby, replayed everything received, last commit an hour ago
+        monkeypatch.setattr(routing, "REPLICA_LAG_SQL", text("SELECT 1, 1, 1, 3600.0"))
+
+        await router.check_replicas()
+
+        assert router.pick_read_engine() in router.replicas
+
+    @pytest.mark.asyncio
+    async def test_replica_behind_on_replay_is_unhealthy(
+        self, router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test replay delay counts as lag while received WAL is unreplayed"""
+        router.set_healthy(list(router.replicas))
+        monkeypatch.setattr(routing, "REPLICA_LAG_SQL", text("SELECT 1, 1, 0, 60.0"))
+
+        await router.check_replicas()
+
+        assert router.pick_read_engine() is router.primary
+
+    @pytest.mark.parametrize("streaming", ["0", "NULL"])
+    @pytest.mark.asyncio
+    async def test_disconnected_wal_receiver_is_unhealthy(
+        self, router: ReplicaRouter, monkeypatch: pytest.MonkeyPatch, streaming: str
+    ):
+        """Test a standby that stopped receiving WAL is ejected though caught up"""
+        router.set_healthy(list(router.replicas))
+        # Replayed all it received, but the receiver is stopped or gone
+        monkeypatch.setattr(
+            routing, "REPLICA_LAG_SQL", text(f"SELECT 1, {streaming}, 1, 0.0")
+        )
+
+        await router.check_replicas()
+
+        assert router.pick_read_engine() is router.primary
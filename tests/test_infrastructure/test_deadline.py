@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+from src.application.exceptions import DeadlineExceededError
+from src.infrastructures.deadline import remaining, request_deadline, within_deadline
+
+
+class TestRequestDeadline:
+    def test_no_deadline_by_default(self):
+        """Test code outside a request has no deadline"""
+        assert remaining() is None
+
+    def test_nested_deadline_only_shortens(self):
+        """Test an inner deadline cannot extend the outer one"""
+        with request_deadline(1.0):
+            with request_deadline(10.0):
+                assert remaining() <= 1.0
+            with request_deadline(0.1):
+                assert remaining() <= 0.1
+        assert remaining() is None
+
+    @pytest.mark.asyncio
+    async def test_within_deadline_is_noop_without_deadline(self):
+        """Test steps run unbounded outside a request"""
+        async with within_deadline():
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_within_deadline_cancels_slow_step(self):
+        """Test a step still running at the deadline is cancelled"""
+        with request_deadline(0.05), pytest.raises(DeadlineExceededError):
+            async with within_deadline():
+                await asyncio.sleep(5)
+
+    @pytest.mark.asyncio
+    async def test_spent_deadline_starts_nothing(self):
+        """Test no step starts once the budget is spent"""
+        started = False
+        with request_deadline(0.0), pytest.raises(DeadlineExceededError):
+            async with within_deadline():
+                started = True
+        assert not started
+
+    @pytest.mark.asyncio
+    async def test_deadline_reaches_child_tasks(self):
+        """Test tasks started by the request inherit its deadline"""
+        with request_deadline(1.0):
+            child_remaining = await asyncio.create_task(asyncio.sleep(0, remaining()))
+        assert 0 < child_remaining <= 1.0
@@ -0,0 +1,179 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, field
+import json
+from typing import Any
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    EraDTO,
+    MaterialDTO,
+)
+from src.infrastructures.http.batching import BatchingCatalogPublisher
+from src.infrastructures.http.clients import PublicCatalogAPIClient
+from src.infrastructures.metrics import MetricsRegistry
+
+
+@dataclass
+class StandInCatalog:
+    """Bulk endpoint of the catalog: one public_id per accepted item."""
+
+    url: str = ""
+    status: int = 200
+    requests: list[dict[str, Any]] = field(default_factory=list)
+
+    def respond(self, path: str, body: dict[str, Any]) -> tuple[int, dict[str, Any]]:
+        self.requests.append({"path": path, "body": body})
+        if self.status != 200:
+            return self.status, {"detail": "unavailable"}
+        return 200, {
+            "items": [
+                {"inventory_id": item["inventory_id"], "error": "rejected"}
+                if item["name"] == "Rejected"
+                else {
+                    "inventory_id": item["inventory_id"],
+                    "public_id": f"pub-{item['inventory_id']}",
+                }
+                for item in body["items"]
+            ]
+        }
+
+
+@pytest.fixture
+async def catalog() -> AsyncGenerator[StandInCatalog, None]:
+    stand_in = StandInCatalog()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while head := await reader.readuntil(b"\r\n\r\n"):
+            request_line, *header_lines = head.decode().split("\r\n")
+            headers = dict(
+                line.lower().split(": ", 1) for line in header_lines if ": " in line
+            )
+            body = json.loads(await reader.readexactly(int(headers["content-length"])))
+            status, payload = stand_in.respond(request_line.split()[1], body)
+            content = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status} X\r\nContent-Length: {len(content)}\r\n"
+                "Content-Type: application/json\r\n\r\n".encode()
+                + content
+            )
+            await writer.drain()
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    stand_in.url = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    async with server:
+        yield stand_in
+
+
+@pytest.fixture
+async def http_client() -> AsyncGenerator[httpx.AsyncClient, None]:
+    async with httpx.AsyncClient() as client:
+        yield client
+
+
+def make_publisher(
+    catalog: StandInCatalog,
+    http_client: httpx.AsyncClient,
+    metrics: MetricsRegistry | None = None,
+    **options: float,
+) -> BatchingCatalogPublisher:
+    return BatchingCatalogPublisher(
+        client=PublicCatalogAPIClient(base_url=catalog.url, client=http_client),
+        metrics=metrics or MetricsRegistry(),
+        **options,
+    )
+
+
+def publication(name: str = "Ancient Vase") -> ArtifactCatalogPublicationDTO:
+    return ArtifactCatalogPublicationDTO(
+        inventory_id=uuid4(),
+        name=name,
+        era=EraDTO(value="antiquity"),
+        material=MaterialDTO(value="ceramic"),
+    )
+
+
+class TestBatchingCatalogPublisher:
+    @pytest.mark.asyncio
+    async def test_concurrent_publishes_share_one_request(self, catalog, http_client):
+        """Test callers within the linger time share a bulk request"""
+        metrics = MetricsRegistry()
+        publisher = make_publisher(
+            catalog, http_client, metrics, max_batch_size=10, linger=0.05
+        )
+        artifacts = [publication() for _ in range(5)]
+
+        public_ids = await asyncio.gather(
+            *(publisher.publish_artifact(artifact) for artifact in artifacts)
+        )
+
+        assert public_ids == [f"pub-{a.inventory_id}" for a in artifacts]
+        assert len(catalog.requests) == 1
+        assert catalog.requests[0]["path"] == "/items/bulk"
+        assert catalog.requests[0]["body"]["items"][0]["era"] == {"value": "antiquity"}
+        batch_sizes = metrics.histogram("catalog_publish_batch_size", "")
+        assert batch_sizes.total(trigger="linger") == 5
+
+    @pytest.mark.asyncio
+    async def test_full_batch_is_sent_without_lingering(self, catalog, http_client):
+        """Test a batch goes out as soon as it reaches max_batch_size"""
+        publisher = make_publisher(catalog, http_client, max_batch_size=2, linger=30)
+
+        async with asyncio.timeout(5):
+            await asyncio.gather(
+                *(publisher.publish_artifact(publication()) for _ in range(4))
+            )
+
+        assert [len(r["body"]["items"]) for r in catalog.requests] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_rejected_artifact_fails_only_its_caller(self, catalog, http_client):
+        """Test an item without a public_id fails alone"""
+        publisher = make_publisher(catalog, http_client, linger=0.01)
+
+        accepted, rejected = await asyncio.gather(
+            publisher.publish_artifact(publication()),
+            publisher.publish_artifact(publication("Rejected")),
+            return_exceptions=True,
+        )
+
+        assert isinstance(accepted, str)
+        assert isinstance(rejected, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_failed_request_fails_every_caller(self, catalog, http_client):
+        """Test a failed bulk request is reported to each caller of the batch"""
+        catalog.status = 503
+        publisher = make_publisher(catalog, http_client, linger=0.01)
+
+        results = await asyncio.gather(
+            *(publisher.publish_artifact(publication()) for _ in range(3)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        assert len(catalog.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_close_sends_queued_artifacts(self, catalog, http_client):
+        """Test shutdown flushes artifacts still waiting for their batch"""
+        publisher = make_publisher(catalog, http_client, linger=30)
+        artifact = publication()
+        pending = asyncio.create_task(publisher.publish_artifact(artifact))
+        await asyncio.sleep(0)
+
+        await publisher.aclose()
+
+        assert await pending == f"pub-{artifact.inventory_id}"
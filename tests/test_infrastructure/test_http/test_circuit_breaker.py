@@ -0,0 +1,214 @@
+import asyncio
+
+import httpx
+import pytest
+import stamina
+
+from src.application.exceptions import DeadlineExceededError, UpstreamUnavailableError
+from src.infrastructures.deadline import request_deadline
+from src.infrastructures.http.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    instrument_circuit_breakers,
+)
+from src.infrastructures.http.clients import ExternalMuseumAPIClient
+from src.infrastructures.http.retry import RetryPolicy
+from src.infrastructures.metrics import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_breaker(clock: FakeClock, metrics: MetricsRegistry) -> CircuitBreaker:
+    return CircuitBreaker(
+        upstream="museum",
+        metrics=metrics,
+        window_size=4,
+        minimum_calls=4,
+        failure_rate_threshold=0.5,
+        slow_call_seconds=1.0,
+        slow_call_rate_threshold=0.75,
+        open_duration=10.0,
+        half_open_probes=2,
+        clock=clock,
+    )
+
+
+async def fail(breaker: CircuitBreaker) -> None:
+    request = httpx.Request("GET", "http://museum/artifacts/1")
+    with pytest.raises(httpx.ConnectError):
+        async with breaker.call():
+            raise httpx.ConnectError("refused", request=request)
+
+
+async def succeed(breaker: CircuitBreaker, clock: FakeClock, took: float = 0.0) -> None:
+    async with breaker.call():
+        clock.now += took
+
+
+class TestCircuitBreaker:
+    @pytest.mark.asyncio
+    async def test_opens_on_failure_rate(self):
+        """Test the circuit opens once failures reach the threshold"""
+        clock, metrics = FakeClock(), MetricsRegistry()
+        breaker = make_breaker(clock, metrics)
+
+        await succeed(breaker, clock)
+        await succeed(breaker, clock)
+        await fail(breaker)
+        assert breaker.state is CircuitState.CLOSED  # below minimum_calls
+        await fail(breaker)
+
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(UpstreamUnavailableError):
+            await succeed(breaker, clock)
+        rejected = metrics.counter("http_client_circuit_rejected_total", "")
+        assert rejected.value(upstream="museum") == 1
+
+    @pytest.mark.asyncio
+    async def test_opens_on_slow_calls(self):
+        """Test successful but slow calls also open the circuit"""
+        clock = FakeClock()
+        breaker = make_breaker(clock, MetricsRegistry())
+
+        for took in (2.0, 2.0, 0.1, 2.0):
+            await succeed(breaker, clock, took)
+
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_failures(self):
+        """Test 4xx replies do not count against the upstream"""
+        clock = FakeClock()
+        breaker = make_breaker(clock, MetricsRegistry())
+        request = httpx.Request("GET", "http://museum/artifacts/1")
+        response = httpx.Response(400, request=request)
+
+        for _ in range(4):
+            with pytest.raises(httpx.HTTPStatusError):
+                async with breaker.call():
+                    response.raise_for_status()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_half_open_probes(self):
+        """Test probes close the circuit, and a failed probe reopens it"""
+        clock, metrics = FakeClock(), MetricsRegistry()
+        breaker = make_breaker(clock, metrics)
+        for _ in range(4):
+            await fail(breaker)
+
+        clock.now += 10.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        await fail(breaker)
+        assert breaker.state is CircuitState.OPEN
+
+        clock.now += 10.0
+        await succeed(breaker, clock)
+        await succeed(breaker, clock)
+        assert breaker.state is CircuitState.CLOSED
+
+        transitions = metrics.counter("http_client_circuit_transitions_total", "")
+        assert transitions.value(upstream="museum", state="open") == 2
+        assert transitions.value(upstream="museum", state="closed") == 1
+
+    @pytest.mark.asyncio
+    async def test_state_gauge(self):
+        """Test the state gauge reports every breaker"""
+        clock, metrics = FakeClock(), MetricsRegistry()
+        museum = make_breaker(clock, metrics)
+        catalog = CircuitBreaker(upstream="catalog", metrics=metrics)
+        instrument_circuit_breakers([museum, catalog], metrics)
+        for _ in range(4):
+            await fail(museum)
+
+        output = metrics.render()
+
+        assert 'http_client_circuit_state{upstream="museum"} 2' in output
+        assert 'http_client_circuit_state{upstream="catalog"} 0' in output
+
+
+def hanging_museum_client(breaker: CircuitBreaker) -> ExternalMuseumAPIClient:
+    async def hang(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(30)
+        return httpx.Response(200, request=request)
+
+    return ExternalMuseumAPIClient(
+        base_url="http://museum",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(hang)),
+        breaker=breaker,
+    )
+
+
+class TestMuseumClientWithBreaker:
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_remaining_retries(self):
+        """Test retries stop as soon as the circuit opens"""
+        calls = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            return httpx.Response(503, request=request)
+
+        metrics = MetricsRegistry()
+        breaker = CircuitBreaker(upstream="museum", metrics=metrics, minimum_calls=2)
+        client = ExternalMuseumAPIClient(
+            base_url="http://museum",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            breaker=breaker,
+            retry=RetryPolicy(upstream="museum", metrics=metrics),
+        )
+
+        with (
+            stamina.set_testing(True, attempts=3),
+            pytest.raises(httpx.HTTPStatusError),
+        ):
+            await client.fetch_artifact("1")
+
+        assert calls == 2
+        assert breaker.state is CircuitState.OPEN
+        with pytest.raises(UpstreamUnavailableError):
+            await client.fetch_artifact("1")
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_cut_off_by_deadline_open_the_circuit(self):
+        """Test a hanging upstream trips the breaker before httpx times out"""
+        breaker = CircuitBreaker(
+            upstream="museum",
+            metrics=MetricsRegistry(),
+            minimum_calls=4,
+            slow_call_seconds=0.02,
+        )
+        client = hanging_museum_client(breaker)
+
+        for _ in range(4):
+            with request_deadline(0.05), pytest.raises(DeadlineExceededError):
+                await client.fetch_artifact("1")
+
+        assert breaker.state is CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_short_client_deadlines_do_not_trip_the_breaker(self):
+        """Test cutoffs shorter than a slow call are not held against the upstream"""
+        breaker = CircuitBreaker(
+            upstream="museum",
+            metrics=MetricsRegistry(),
+            minimum_calls=4,
+            slow_call_seconds=1.0,
+        )
+        client = hanging_museum_client(breaker)
+
+        # e.g. X-Request-Timeout: 0.001 sent over and over
+        for _ in range(10):
+            with request_deadline(0.001), pytest.raises(DeadlineExceededError):
+                await client.fetch_artifact("1")
+
+        assert breaker.state is CircuitState.CLOSED
@@ -0,0 +1,152 @@
+import json
+from uuid import uuid4
+
+import httpx
+from pydantic import ValidationError
+import pytest
+
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    EraDTO,
+    MaterialDTO,
+    MuseumValidatorsDTO,
+)
+from src.application.exceptions import ArtifactNotFoundError
+from src.infrastructures.http.clients import (
+    ExternalMuseumAPIClient,
+    PublicCatalogAPIClient,
+)
+
+
+def museum_client(handler) -> ExternalMuseumAPIClient:
+    return ExternalMuseumAPIClient(
+        base_url="http://museum",
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+def museum_payload(**overrides) -> dict:
+    return {
+        "inventory_id": str(uuid4()),
+        "name": "Ancient Vase",
+        "era": {"value": "antiquity"},
+        "material": {"value": "ceramic"},
+        "description": "A beautiful ancient vase",
+        "acquisition_date": "2023-01-01T00:00:00Z",
+        "department": "Archaeology",
+        **overrides,
+    }
+
+
+class TestExternalMuseumAPIClient:
+    @pytest.mark.asyncio
+    async def test_fetch_artifact_ignores_unknown_fields(self):
+        """Test extra upstream fields are dropped, not rejected"""
+        payload = museum_payload(catalogue_notes="Found in 1898", images=[])
+        client = museum_client(lambda _: httpx.Response(200, json=payload))
+
+        artifact = await client.fetch_artifact(payload["inventory_id"])
+
+        assert str(artifact.inventory_id) == payload["inventory_id"]
+        assert artifact.era.value == "antiquity"
+        assert artifact.material.value == "ceramic"
+        assert artifact.acquisition_date.year == 2023
+
+    @pytest.mark.asyncio
+    async def test_fetch_artifact_rejects_invalid_payload(self):
+        """Test a payload failing DTO validation raises ValidationError"""
+        payload = museum_payload(era={"value": "space_age"})
+        client = museum_client(
+            lambda _: httpx.Response(200, content=json.dumps(payload).encode())
+        )
+
+        with pytest.raises(ValidationError):
+            await client.fetch_artifact(payload["inventory_id"])
+
+    @pytest.mark.asyncio
+    async def test_fetch_artifact_not_found(self):
+        """Test a 404 is reported as ArtifactNotFoundError"""
+        client = museum_client(lambda _: httpx.Response(404))
+
+        with pytest.raises(ArtifactNotFoundError):
+            await client.fetch_artifact(str(uuid4()))
+
+    @pytest.mark.asyncio
+    async def test_conditional_fetch_sends_validators(self):
+        """Test stored validators are sent and a 304 means unchanged"""
+        seen: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(304)
+
+        client = museum_client(handler)
+        validators = MuseumValidatorsDTO(
+            etag='W/"v1"', last_modified="Wed, 01 Jan 2025 00:00:00 GMT"
+        )
+
+        assert await client.fetch_artifact_if_changed(str(uuid4()), validators) is None
+        assert seen[0]["If-None-Match"] == 'W/"v1"'
+        assert seen[0]["If-Modified-Since"] == "Wed, 01 Jan 2025 00:00:00 GMT"
+
+    @pytest.mark.asyncio
+    async def test_conditional_fetch_returns_new_validators(self):
+        """Test a changed artifact comes back with the validators to store"""
+        payload = museum_payload()
+        seen: list[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers)
+            return httpx.Response(
+                200,
+                json=payload,
+                headers={
+                    "ETag": '"v2"',
+                    "Last-Modified": "Thu, 02 Jan 2025 00:00:00 GMT",
+                },
+            )
+
+        client = museum_client(handler)
+
+        fetched = await client.fetch_artifact_if_changed(payload["inventory_id"], None)
+
+        assert fetched is not None
+        artifact, validators = fetched
+        assert str(artifact.inventory_id) == payload["inventory_id"]
+        assert validators == MuseumValidatorsDTO(
+            etag='"v2"', last_modified="Thu, 02 Jan 2025 00:00:00 GMT"
+        )
+        assert "If-None-Match" not in seen[0]
+
+
+class TestPublicCatalogAPIClient:
+    @pytest.mark.asyncio
+    async def test_publish_artifact_sends_json_payload(self):
+        """Test the publication is serialized and the public_id returned"""
+        bodies: list[dict] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(201, json={"public_id": "pub-1"})
+
+        client = PublicCatalogAPIClient(
+            base_url="http://catalog",
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        artifact = ArtifactCatalogPublicationDTO(
+            inventory_id=uuid4(),
+            name="Ancient Vase",
+            era=EraDTO(value="antiquity"),
+            material=MaterialDTO(value="ceramic"),
+        )
+
+        assert await client.publish_artifact(artifact) == "pub-1"
+        assert bodies == [
+            {
+                "inventory_id": str(artifact.inventory_id),
+                "name": "Ancient Vase",
+                "era": {"value": "antiquity"},
+                "material": {"value": "ceramic"},
+                "description": None,
+            }
+        ]
@@ -0,0 +1,122 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.dtos.artifact import (
+    ArtifactCatalogPublicationDTO,
+    CatalogPublicationRecordDTO,
+    EraDTO,
+    MaterialDTO,
+)
+from src.infrastructures.db.exceptions import RepositoryReadError, RepositorySaveError
+from src.infrastructures.http.deduplication import (
+    DeduplicatingCatalogPublisher,
+    publication_hash,
+)
+from src.infrastructures.metrics import MetricsRegistry
+
+
+@pytest.fixture
+def artifact() -> ArtifactCatalogPublicationDTO:
+    return ArtifactCatalogPublicationDTO(
+        inventory_id=uuid4(),
+        name="Ancient Vase",
+        era=EraDTO(value="antiquity"),
+        material=MaterialDTO(value="ceramic"),
+    )
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def publisher(
+    mock_catalog_api: AsyncMock, mock_repository: AsyncMock, metrics: MetricsRegistry
+) -> DeduplicatingCatalogPublisher:
+    mock_catalog_api.publish_artifact.return_value = "pub-new"
+    mock_repository.get_catalog_publication.return_value = None
+    return DeduplicatingCatalogPublisher(
+        publisher=mock_catalog_api, repository=mock_repository, metrics=metrics
+    )
+
+
+def record(
+    artifact: ArtifactCatalogPublicationDTO, content_hash: str
+) -> CatalogPublicationRecordDTO:
+    return CatalogPublicationRecordDTO(
+        inventory_id=artifact.inventory_id,
+        content_hash=content_hash,
+        public_id="pub-old",
+    )
+
+
+class TestDeduplicatingCatalogPublisher:
+    def test_hash_follows_publication_content(self, artifact):
+        """Test equal payloads hash the same and any field change does not"""
+        assert publication_hash(artifact) == publication_hash(artifact.model_copy())
+        assert publication_hash(artifact) != publication_hash(
+            artifact.model_copy(update={"description": "Restored"})
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_content_is_not_republished(
+        self, publisher, artifact, mock_catalog_api, mock_repository, metrics
+    ):
+        """Test a matching hash returns the recorded public_id without a request"""
+        mock_repository.get_catalog_publication.return_value = record(
+            artifact, publication_hash(artifact)
+        )
+
+        assert await publisher.publish_artifact(artifact) == "pub-old"
+
+        mock_catalog_api.publish_artifact.assert_not_called()
+        mock_repository.save_catalog_publication.assert_not_called()
+        dedup = metrics.counter("catalog_publish_dedup_total", "")
+        assert dedup.value(result="skipped") == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_content_is_published_and_recorded(
+        self, publisher, artifact, mock_catalog_api, mock_repository
+    ):
+        """Test a different hash publishes and records the new hash and public_id"""
+        mock_repository.get_catalog_publication.return_value = record(
+            artifact, "0" * 64
+        )
+
+        assert await publisher.publish_artifact(artifact) == "pub-new"
+
+        mock_catalog_api.publish_artifact.assert_called_once_with(artifact)
+        mock_repository.save_catalog_publication.assert_called_once_with(
+            CatalogPublicationRecordDTO(
+                inventory_id=artifact.inventory_id,
+                content_hash=publication_hash(artifact),
+                public_id="pub-new",
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_unavailable_record_falls_back_to_publishing(
+        self, publisher, artifact, mock_catalog_api, mock_repository
+    ):
+        """Test database errors around the record never block publishing"""
+        mock_repository.get_catalog_publication.side_effect = RepositoryReadError("db")
+        mock_repository.save_catalog_publication.side_effect = RepositorySaveError("db")
+
+        assert await publisher.publish_artifact(artifact) == "pub-new"
+
+        mock_catalog_api.publish_artifact.assert_called_once_with(artifact)
+
+    @pytest.mark.asyncio
+    async def test_failed_publish_is_not_recorded(
+        self, publisher, artifact, mock_catalog_api, mock_repository
+    ):
+        """Test nothing is recorded when the catalog rejects the publication"""
+        mock_catalog_api.publish_artifact.side_effect = ValueError("rejected")
+
+        with pytest.raises(ValueError, match="rejected"):
+            await publisher.publish_artifact(artifact)
+
+        mock_repository.save_catalog_publication.assert_not_called()
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from src.infrastructures.http.hedging import HedgePolicy
+from src.infrastructures.metrics import MetricsRegistry
+
+
+def make_policy(metrics: MetricsRegistry, **overrides: float) -> HedgePolicy:
+    options = {
+        "initial_delay": 0.02,
+        "min_delay": 0.01,
+        "budget_ratio": 1.0,
+        "min_samples": 4,
+        "recompute_every": 4,
+    } | overrides
+    return HedgePolicy(upstream="museum", metrics=metrics, **options)
+
+
+def scripted(*delays: float, fail: tuple[int, ...] = ()):
+    """Call factory whose n-th call sleeps ``delays[n]`` and returns n."""
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def call() -> int:
+        number = len(started)
+        started.append(number)
+        try:
+            await asyncio.sleep(delays[number])
+        except asyncio.CancelledError:
+            cancelled.append(number)
+            raise
+        if number in fail:
+            raise ConnectionError(f"call {number} failed")
+        return number
+
+    return call, started, cancelled
+
+
+class TestHedgePolicy:
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self):
+        """Test a call answering before the delay runs alone"""
+        metrics = MetricsRegistry()
+        call, started, _ = scripted(0.0)
+
+        assert await make_policy(metrics).run(call) == 0
+        assert started == [0]
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_and_loser_is_cancelled(self):
+        """Test a slow first call is raced and cancelled once the hedge answers"""
+        metrics = MetricsRegistry()
+        call, started, cancelled = scripted(1.0, 0.0)
+
+        assert await make_policy(metrics).run(call) == 1
+
+        assert started == [0, 1]
+        assert cancelled == [0]
+        hedges = metrics.counter("http_client_hedges_total", "")
+        assert hedges.value(upstream="museum", result="won") == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_limits_hedges(self):
+        """Test no hedge is sent once the budget is spent"""
+        metrics = MetricsRegistry()
+        policy = make_policy(metrics, budget_ratio=0.5)
+        call, started, _ = scripted(0.05, 0.05)
+
+        assert await policy.run(call) == 0
+
+        assert started == [0]
+        hedges = metrics.counter("http_client_hedges_total", "")
+        assert hedges.value(upstream="museum", result="over_budget") == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_waits_for_first_call(self):
+        """Test a failing hedge does not hide a first call that succeeds"""
+        metrics = MetricsRegistry()
+        call, _, _ = scripted(0.05, 0.0, fail=(1,))
+
+        assert await make_policy(metrics).run(call) == 0
+
+        hedges = metrics.counter("http_client_hedges_total", "")
+        assert hedges.value(upstream="museum", result="lost") == 1
+
+    @pytest.mark.asyncio
+    async def test_both_failing_raises_first_error(self):
+        """Test the first call's error is raised when both attempts fail"""
+        call, _, _ = scripted(0.05, 0.0, fail=(0, 1))
+
+        with pytest.raises(ConnectionError, match="call 0"):
+            await make_policy(MetricsRegistry()).run(call)
+
+    @pytest.mark.asyncio
+    async def test_delay_follows_latency_percentile(self):
+        """Test the delay tracks the configured percentile of recent calls"""
+        metrics = MetricsRegistry()
+        policy = make_policy(metrics, percentile=75.0, initial_delay=1.0)
+        call, _, _ = scripted(0.0, 0.0, 0.05, 0.3)
+
+        for _ in range(4):
+            await policy.run(call)
+
+        assert policy.delay == pytest.approx(0.05, abs=0.02)
+        assert 'http_client_hedge_delay_seconds{upstream="museum"} 0.0' in (
+            metrics.render()
+        )
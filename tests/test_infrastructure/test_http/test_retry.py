@@ -0,0 +1,130 @@
+import httpx
+import pytest
+import stamina
+
+from src.infrastructures.http.retry import RetryPolicy
+from src.infrastructures.metrics import MetricsRegistry
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def flaky(failures: int, clock: FakeClock | None = None, took: float = 0.0):
+    """Operation failing ``failures`` times with a connect error, then OK."""
+    calls: list[int] = []
+
+    async def operation() -> str:
+        calls.append(len(calls))
+        if clock is not None:
+            clock.now += took
+        if len(calls) <= failures:
+            raise httpx.ConnectError("refused")
+        return "ok"
+
+    return operation, calls
+
+
+def retryable(exc: Exception) -> bool:
+    return isinstance(exc, httpx.HTTPError)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff_sleep():
+    with stamina.set_testing(True, attempts=10):
+        yield
+
+
+class TestRetryPolicy:
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self):
+        """Test failed attempts are retried up to max_attempts"""
+        metrics = MetricsRegistry()
+        policy = RetryPolicy(upstream="museum", metrics=metrics, max_attempts=3)
+        operation, calls = flaky(2)
+
+        assert await policy.call(operation, retryable=retryable) == "ok"
+
+        assert len(calls) == 3
+        retries = metrics.counter("http_client_retries_total", "")
+        assert retries.value(upstream="museum", result="attempted") == 2
+
+    @pytest.mark.asyncio
+    async def test_stops_at_max_attempts(self):
+        """Test the last error is raised once attempts run out"""
+        policy = RetryPolicy(
+            upstream="museum", metrics=MetricsRegistry(), max_attempts=2
+        )
+        operation, calls = flaky(5)
+
+        with pytest.raises(httpx.ConnectError):
+            await policy.call(operation, retryable=retryable)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_errors_are_raised_at_once(self):
+        """Test errors the predicate rejects are not retried"""
+        policy = RetryPolicy(upstream="museum", metrics=MetricsRegistry())
+        operation, calls = flaky(1)
+
+        with pytest.raises(httpx.ConnectError):
+            await policy.call(operation, retryable=lambda _: False)
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_budget_follows_recent_successes(self):
+        """Test retries are denied once they exceed the share of successes"""
+        clock, metrics = FakeClock(), MetricsRegistry()
+        policy = RetryPolicy(
+            upstream="museum",
+            metrics=metrics,
+            budget_ratio=0.5,
+            min_retries_per_second=0.0,
+            clock=clock,
+        )
+        for _ in range(4):
+            await policy.call(flaky(0)[0], retryable=retryable)
+
+        # Four successes buy two retries
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                await policy.call(flaky(5)[0], retryable=retryable)
+
+        retries = metrics.counter("http_client_retries_total", "")
+        assert retries.value(upstream="museum", result="attempted") == 2
+        assert retries.value(upstream="museum", result="denied_budget") == 2
+
+        # Successes older than the window no longer count
+        clock.now += policy.budget_window + 1
+        operation, calls = flaky(1)
+        with pytest.raises(httpx.ConnectError):
+            await policy.call(operation, retryable=retryable)
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_no_retry_past_deadline(self):
+        """Test a retry that could not finish before the deadline is skipped"""
+        clock, metrics = FakeClock(), MetricsRegistry()
+        policy = RetryPolicy(
+            upstream="museum",
+            metrics=metrics,
+            timeout=5.0,
+            wait_initial=0.5,
+            wait_jitter=0.0,
+            clock=clock,
+        )
+        # Each attempt takes 2s: 2 + 0.5 + 2 fits in 5s, 4.5 + 1 + 2 does not
+        operation, calls = flaky(5, clock, took=2.0)
+
+        with pytest.raises(httpx.ConnectError):
+            await policy.call(operation, retryable=retryable)
+
+        assert len(calls) == 2
+        retries = metrics.counter("http_client_retries_total", "")
+        assert retries.value(upstream="museum", result="denied_deadline") == 1
@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import redis.exceptions
+
+from src.application.exceptions import UpstreamBusyError
+from src.infrastructures.http.throttling import (
+    LocalTokenBucket,
+    OutboundLimiter,
+    RedisTokenBucket,
+)
+from src.infrastructures.metrics import MetricsRegistry
+
+
+def make_limiter(
+    metrics: MetricsRegistry,
+    *,
+    bucket: LocalTokenBucket | None = None,
+    max_in_flight: int = 10,
+    max_queue_wait: float = 0.05,
+) -> OutboundLimiter:
+    return OutboundLimiter(
+        upstream="museum",
+        bucket=bucket,
+        max_in_flight=max_in_flight,
+        max_queue_wait=max_queue_wait,
+        metrics=metrics,
+    )
+
+
+class TestLocalTokenBucket:
+    @pytest.mark.asyncio
+    async def test_burst_then_wait(self):
+        """Test the burst is free and later tokens are reserved ahead"""
+        bucket = LocalTokenBucket(rate=10.0, burst=2)
+
+        assert await bucket.reserve(1.0) == 0.0
+        assert await bucket.reserve(1.0) == 0.0
+        assert await bucket.reserve(1.0) == pytest.approx(0.1, abs=0.01)
+        assert await bucket.reserve(1.0) == pytest.approx(0.2, abs=0.01)
+
+    @pytest.mark.asyncio
+    async def test_refuses_past_max_wait(self):
+        """Test a token too far ahead is refused without being taken"""
+        bucket = LocalTokenBucket(rate=10.0, burst=1)
+        await bucket.reserve(1.0)
+
+        assert await bucket.reserve(0.05) is None
+        assert await bucket.reserve(1.0) == pytest.approx(0.1, abs=0.01)
+
+
+class TestRedisTokenBucket:
+    @pytest.mark.asyncio
+    async def test_reads_wait_from_script(self):
+        """Test the script reply becomes the wait, and -1 a refusal"""
+        script = AsyncMock(side_effect=[b"0.25", b"-1"])
+        client = MagicMock(register_script=MagicMock(return_value=script))
+        bucket = RedisTokenBucket(
+            client=client,
+            key="antiques:ratelimit:museum",
+            rate=4.0,
+            burst=1,
+            fallback=LocalTokenBucket(rate=4.0, burst=1),
+        )
+
+        assert await bucket.reserve(1.0) == 0.25
+        assert await bucket.reserve(0.1) is None
+        script.assert_awaited_with(
+            keys=["antiques:ratelimit:museum"], args=[4.0, 1, 0.1]
+        )
+
+    @pytest.mark.asyncio
+    async def test_falls_back_when_redis_fails(self):
+        """Test a Redis outage limits with the local bucket instead"""
+        script = AsyncMock(side_effect=redis.exceptions.ConnectionError("down"))
+        client = MagicMock(register_script=MagicMock(return_value=script))
+        bucket = RedisTokenBucket(
+            client=client,
+            key="k",
+            rate=1.0,
+            burst=1,
+            fallback=LocalTokenBucket(rate=1.0, burst=1),
+        )
+
+        assert await bucket.reserve(0.1) == 0.0
+        assert await bucket.reserve(0.1) is None
+
+
+class TestOutboundLimiter:
+    @pytest.mark.asyncio
+    async def test_rejects_when_in_flight_slots_stay_busy(self):
+        """Test calls queued past the deadline fail fast"""
+        metrics = MetricsRegistry()
+        limiter = make_limiter(metrics, max_in_flight=1)
+        release = asyncio.Event()
+
+        async def hold() -> None:
+            async with limiter.slot():
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+        with pytest.raises(UpstreamBusyError):
+            async with limiter.slot():
+                pass
+        release.set()
+        await holder
+
+        rejected = metrics.counter("http_client_throttled_total", "")
+        assert rejected.value(upstream="museum", reason="in_flight") == 1
+        # The slot is free again once the holder finished
+        async with limiter.slot():
+            pass
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_rate_exhausted(self):
+        """Test a token further away than the queue deadline is refused"""
+        metrics = MetricsRegistry()
+        limiter = make_limiter(metrics, bucket=LocalTokenBucket(rate=1.0, burst=1))
+
+        async with limiter.slot():
+            pass
+        with pytest.raises(UpstreamBusyError):
+            async with limiter.slot():
+                pass
+
+        rejected = metrics.counter("http_client_throttled_total", "")
+        assert rejected.value(upstream="museum", reason="rate") == 1
+        assert 'http_client_in_flight{upstream="museum"} 0' in metrics.render()
+
+    @pytest.mark.asyncio
+    async def test_waits_for_reserved_token(self):
+        """Test a token within the deadline is waited for and recorded"""
+        metrics = MetricsRegistry()
+        limiter = make_limiter(
+            metrics, bucket=LocalTokenBucket(rate=20.0, burst=1), max_queue_wait=1.0
+        )
+
+        for _ in range(2):
+            async with limiter.slot():
+                pass
+
+        wait = metrics.histogram("http_client_throttle_wait_seconds", "")
+        assert wait.count(upstream="museum") == 2
+        assert wait.total(upstream="museum") >= 0.04
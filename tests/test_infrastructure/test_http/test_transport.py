@@ -0,0 +1,89 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import httpx
+import pytest
+
+from src.infrastructures.http.transport import create_http_client
+from src.infrastructures.metrics import MetricsRegistry
+
+
+@pytest.fixture
+async def slow_server() -> AsyncGenerator[str, None]:
+    """Plain HTTP/1.1 server that holds every response for 0.2 seconds."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while await reader.readuntil(b"\r\n\r\n"):
+            await asyncio.sleep(0.2)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n"
+                b"Content-Type: application/json\r\n\r\n{}"
+            )
+            await writer.drain()
+
+    async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            await handle(reader, writer)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(serve, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    async with server:
+        yield f"http://127.0.0.1:{port}"
+
+
+def make_client(metrics: MetricsRegistry, **overrides: float) -> httpx.AsyncClient:
+    options = {
+        "max_connections": 1,
+        "max_keepalive_connections": 1,
+        "keepalive_expiry": 5.0,
+        "http2": False,
+        "connect_timeout": 1.0,
+        "read_timeout": 1.0,
+        "pool_timeout": 1.0,
+    } | overrides
+    return create_http_client(upstream="museum", metrics=metrics, **options)
+
+
+class TestInstrumentedTransport:
+    @pytest.mark.asyncio
+    async def test_pool_wait_observed(self, slow_server):
+        """Test queued requests report the time spent waiting for a connection"""
+        metrics = MetricsRegistry()
+        async with make_client(metrics) as client:
+            responses = await asyncio.gather(
+                client.get(f"{slow_server}/a"), client.get(f"{slow_server}/b")
+            )
+
+        assert [response.status_code for response in responses] == [200, 200]
+        pool_wait = metrics.histogram("http_client_pool_wait_seconds", "")
+        assert pool_wait.count(upstream="museum") == 2
+        # The second request queued behind the first one's 0.2s response
+        assert pool_wait.total(upstream="museum") >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_pool_timeout_counted(self, slow_server):
+        """Test requests that cannot get a connection in time are counted"""
+        metrics = MetricsRegistry()
+        async with make_client(metrics, pool_timeout=0.05) as client:
+            results = await asyncio.gather(
+                client.get(f"{slow_server}/a"),
+                client.get(f"{slow_server}/b"),
+                return_exceptions=True,
+            )
+
+        assert sum(isinstance(r, httpx.PoolTimeout) for r in results) == 1
+        timeouts = metrics.counter("http_client_pool_timeouts_total", "")
+        assert timeouts.value(upstream="museum") == 1
+
+    @pytest.mark.asyncio
+    async def test_client_uses_configured_timeouts(self):
+        """Test connect, read and pool timeouts come from the options"""
+        client = make_client(
+            MetricsRegistry(), connect_timeout=2.0, read_timeout=7.0, pool_timeout=3.0
+        )
+        async with client:
+            assert client.timeout == httpx.Timeout(7.0, connect=2.0, pool=3.0)
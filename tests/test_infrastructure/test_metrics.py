@@ -0,0 +1,48 @@
+import pytest
+
+from src.infrastructures.metrics import MetricsRegistry
+
+
+class TestMetricsRegistry:
+    def test_counter_render(self):
+        """Test counters render one sample per label set"""
+        registry = MetricsRegistry()
+        counter = registry.counter("requests_total", "Requests", ["route"])
+        counter.inc(route="/a")
+        counter.inc(2, route="/a")
+
+        output = registry.render()
+
+        assert "# TYPE requests_total counter" in output
+        assert 'requests_total{route="/a"} 3' in output
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram bucket, sum and count lines"""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5.0):
+            histogram.observe(value)
+
+        output = registry.render()
+
+        assert 'latency_bucket{le="0.1"} 1' in output
+        assert 'latency_bucket{le="1"} 2' in output
+        assert 'latency_bucket{le="+Inf"} 3' in output
+        assert "latency_count 3" in output
+        assert histogram.total() == pytest.approx(5.55)
+
+    def test_gauge_reads_callback(self):
+        """Test gauges are collected at render time"""
+        registry = MetricsRegistry()
+        state = {"value": 1.0}
+        registry.gauge("in_use", "In use", lambda: {(): state["value"]})
+        state["value"] = 4.0
+
+        assert "in_use 4" in registry.render()
+
+    def test_label_mismatch_rejected(self):
+        """Test that using the wrong labels fails loudly"""
+        counter = MetricsRegistry().counter("c", "C", ["role"])
+
+        with pytest.raises(ValueError, match="expects labels"):
+            counter.inc(route="/a")
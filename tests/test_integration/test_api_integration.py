@@ -61,12 +61,15 @@ class TestApiIntegration:
 
     @pytest.mark.asyncio
     async def test_artifact_endpoint_with_empty_uuid(self, client: TestClient):
-        """Test artifact endpoint with empty UUID"""
+        """Test artifact endpoint with empty UUID redirects to the collection"""
         empty_inventory_id = ""
 
-        response = client.get(f"/api/v1/artifacts/{empty_inventory_id}")
+        response = client.get(
+            f"/api/v1/artifacts/{empty_inventory_id}", follow_redirects=False
+        )
 
-        assert response.status_code == 404
+        assert response.status_code == 307
+        assert response.headers["location"].endswith("/api/v1/artifacts")
 
     @pytest.mark.asyncio
     async def test_api_cors_headers(self, client: TestClient):
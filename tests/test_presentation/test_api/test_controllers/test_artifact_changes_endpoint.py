@@ -0,0 +1,60 @@
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from dishka import Provider, Scope, make_async_container
+from dishka.integrations.fastapi import setup_dishka
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from src.application.dtos.artifact import ArtifactChangesPageDTO
+from src.application.use_cases.list_artifact_changes import (
+    ListArtifactChangesUseCase,
+)
+from src.presentation.api.rest.v1.controllers.artifact_controller import router
+
+
+@pytest.fixture
+def use_case() -> MagicMock:
+    use_case = MagicMock(spec=ListArtifactChangesUseCase)
+    use_case.execute = AsyncMock(
+        return_value=ArtifactChangesPageDTO(items=[], next_cursor=None, has_more=False)
+    )
+    return use_case
+
+
+@pytest.fixture
+def client(use_case: MagicMock) -> Iterator[TestClient]:
+    provider = Provider(scope=Scope.REQUEST)
+    provider.provide(lambda: use_case, provides=ListArtifactChangesUseCase)
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    setup_dishka(make_async_container(provider), app)
+    with TestClient(app) as client:
+        yield client
+
+
+class TestArtifactChangesEndpoint:
+    def test_since_without_utc_offset_is_rejected(
+        self, client: TestClient, use_case: MagicMock
+    ):
+        """Test a naive since is refused instead of read in the DB time zone"""
+        response = client.get(
+            "/api/v1/artifacts/changes", params={"since": "2024-01-01T00:00:00"}
+        )
+
+        assert response.status_code == 422
+        use_case.execute.assert_not_called()
+
+    def test_since_with_offset_is_passed_on(
+        self, client: TestClient, use_case: MagicMock
+    ):
+        """Test an offset-aware since reaches the use case as that instant"""
+        response = client.get(
+            "/api/v1/artifacts/changes", params={"since": "2024-01-01T03:00:00+03:00"}
+        )
+
+        assert response.status_code == 200
+        since = use_case.execute.call_args.kwargs["since"]
+        assert since == datetime(2024, 1, 1, tzinfo=UTC)
@@ -0,0 +1,91 @@
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+from src.application.exceptions import DeadlineExceededError
+from src.config.base import Settings
+from src.infrastructures.deadline import remaining, within_deadline
+from src.infrastructures.metrics import MetricsRegistry
+from src.presentation.api.rest.middlewares import (
+    deadline_exceeded_handler,
+    deadline_middleware,
+)
+
+
+class FakeContainer:
+    def __init__(self, **instances: Any) -> None:
+        self.instances = instances
+
+    async def get(self, dependency: type) -> Any:
+        return self.instances[dependency.__name__]
+
+
+@pytest.fixture
+def metrics() -> MetricsRegistry:
+    return MetricsRegistry()
+
+
+@pytest.fixture
+def client(metrics: MetricsRegistry) -> TestClient:
+    app = FastAPI()
+    app.state.dishka_container = FakeContainer(
+        Settings=SimpleNamespace(request_timeout=0.2, request_timeout_max=0.5),
+        MetricsRegistry=metrics,
+    )
+    app.middleware("http")(deadline_middleware)
+    app.add_exception_handler(DeadlineExceededError, deadline_exceeded_handler)
+
+    @app.get("/budget")
+    async def budget() -> dict[str, float | None]:
+        return {"remaining": remaining()}
+
+    @app.get("/slow")
+    async def slow() -> dict[str, str]:
+        async with within_deadline():
+            await asyncio.sleep(5)
+        return {}
+
+    @app.get("/unchecked")
+    async def unchecked() -> dict[str, str]:
+        await asyncio.sleep(5)
+        return {}
+
+    return TestClient(app)
+
+
+class TestDeadlineMiddleware:
+    def test_default_budget(self, client: TestClient):
+        """Test handlers see the configured budget"""
+        response = client.get("/budget")
+
+        assert 0 < response.json()["remaining"] <= 0.2
+
+    def test_header_overrides_budget_up_to_max(self, client: TestClient):
+        """Test X-Request-Timeout shortens or extends the budget within the cap"""
+        shorter = client.get("/budget", headers={"X-Request-Timeout": "0.1"})
+        longer = client.get("/budget", headers={"X-Request-Timeout": "60"})
+
+        assert shorter.json()["remaining"] <= 0.1
+        assert 0.2 < longer.json()["remaining"] <= 0.5
+
+    @pytest.mark.parametrize("value", ["soon", "nan", "inf", "-inf", "0", "-1"])
+    def test_invalid_header(self, client: TestClient, value: str):
+        """Test an X-Request-Timeout that is not a positive finite number is rejected"""
+        response = client.get("/budget", headers={"X-Request-Timeout": value})
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("path", ["/slow", "/unchecked"])
+    def test_exhausted_budget_returns_504(
+        self, client: TestClient, metrics: MetricsRegistry, path: str
+    ):
+        """Test running out of time answers 504, whether or not the step checks"""
+        response = client.get(path)
+
+        assert response.status_code == 504
+        exceeded = metrics.counter("http_request_deadline_exceeded_total", "")
+        assert exceeded.value(route=path) == 1
@@ -0,0 +1,89 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.dtos.artifact import (
+    ArtifactChangeDTO,
+    ArtifactChangesPageDTO,
+    ArtifactDTO,
+)
+from src.application.use_cases.list_artifact_changes import (
+    ListArtifactChangesUseCase,
+)
+from src.presentation.cli.main import build_parser
+
+
+def _container_with(use_case: MagicMock) -> MagicMock:
+    request_container = MagicMock()
+    request_container.get = AsyncMock(return_value=use_case)
+
+    @asynccontextmanager
+    async def enter_request_scope() -> AsyncIterator[MagicMock]:
+        yield request_container
+
+    container = MagicMock()
+    container.side_effect = enter_request_scope
+    return container
+
+
+class TestChangesCommand:
+    @pytest.mark.asyncio
+    async def test_changes_pages_until_caught_up_and_saves_cursor(
+        self, tmp_path: Path, sample_artifact_dto: ArtifactDTO
+    ):
+        """Test that the sync follows has_more and persists the last cursor"""
+        output = tmp_path / "changes.ndjson"
+        cursor_file = tmp_path / "cursor"
+        cursor_file.write_text("saved-cursor\n")
+        change = ArtifactChangeDTO(
+            artifact=sample_artifact_dto, updated_at=datetime(2024, 1, 2, tzinfo=UTC)
+        )
+        use_case = MagicMock(spec=ListArtifactChangesUseCase)
+        use_case.execute = AsyncMock(
+            side_effect=[
+                ArtifactChangesPageDTO(
+                    items=[change], next_cursor="cursor-1", has_more=True
+                ),
+                ArtifactChangesPageDTO(
+                    items=[change], next_cursor="cursor-2", has_more=False
+                ),
+            ]
+        )
+        args = build_parser().parse_args(
+            [
+                "changes",
+                "--cursor-file",
+                str(cursor_file),
+                "--output",
+                str(output),
+                "--batch-size",
+                "1",
+            ]
+        )
+
+        assert await args.handler(args, _container_with(use_case)) == 0
+
+        lines = output.read_bytes().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["artifact"]["name"] == sample_artifact_dto.name
+        assert [c.kwargs["cursor"] for c in use_case.execute.call_args_list] == [
+            "saved-cursor",
+            "cursor-1",
+        ]
+        assert cursor_file.read_text() == "cursor-2"
+
+    def test_since_requires_utc_offset(self, capsys: pytest.CaptureFixture[str]):
+        """Test a naive --since is refused instead of read in the DB time zone"""
+        parser = build_parser()
+
+        with pytest.raises(SystemExit):
+            parser.parse_args(["changes", "--since", "2024-01-01T00:00:00"])
+
+        assert "no UTC offset" in capsys.readouterr().err
+        args = parser.parse_args(["changes", "--since", "2024-01-01T03:00:00+03:00"])
+        assert args.since == datetime(2024, 1, 1, tzinfo=UTC)
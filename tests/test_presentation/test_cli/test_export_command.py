@@ -0,0 +1,87 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import gzip
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.use_cases.export_artifacts import ExportArtifactsUseCase
+from src.presentation.cli.main import build_parser
+
+
+def _container_with(use_case: MagicMock) -> MagicMock:
+    request_container = MagicMock()
+    request_container.get = AsyncMock(return_value=use_case)
+
+    @asynccontextmanager
+    async def enter_request_scope() -> AsyncIterator[MagicMock]:
+        yield request_container
+
+    container = MagicMock()
+    container.side_effect = enter_request_scope
+    return container
+
+
+class TestExportCommand:
+    @pytest.mark.asyncio
+    async def test_export_writes_streamed_chunks_to_file(self, tmp_path: Path):
+        """Test that the export command streams use case output into a file"""
+        output = tmp_path / "artifacts.csv.gz"
+
+        async def chunks(*_, **__) -> AsyncIterator[bytes]:
+            for chunk in (b"part one,", b"part two\n"):
+                yield gzip.compress(chunk)
+
+        use_case = MagicMock(spec=ExportArtifactsUseCase)
+        use_case.execute.side_effect = chunks
+        args = build_parser().parse_args(
+            [
+                "export",
+                "--format",
+                "csv",
+                "--gzip",
+                "--era",
+                "antiquity",
+                "--output",
+                str(output),
+            ]
+        )
+
+        assert await args.handler(args, _container_with(use_case)) == 0
+
+        assert gzip.decompress(output.read_bytes()) == b"part one,part two\n"
+        filters = use_case.execute.call_args.args[0]
+        assert filters.era.value == "antiquity"
+        assert use_case.execute.call_args.kwargs == {
+            "export_format": "csv",
+            "compress": True,
+        }
+
+    @pytest.mark.asyncio
+    async def test_export_rejects_inverted_date_range(self):
+        """Test that invalid filters fail before any export starts"""
+        use_case = MagicMock(spec=ExportArtifactsUseCase)
+        args = build_parser().parse_args(
+            [
+                "export",
+                "--acquired-from",
+                "2024-01-01",
+                "--acquired-to",
+                "2020-01-01",
+            ]
+        )
+
+        assert await args.handler(args, _container_with(use_case)) == 2
+        use_case.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_export_rejects_inverted_era_range(self):
+        """Test that an era range must run from older to newer eras"""
+        use_case = MagicMock(spec=ExportArtifactsUseCase)
+        args = build_parser().parse_args(
+            ["export", "--era-from", "middle_ages", "--era-to", "bronze_age"]
+        )
+
+        assert await args.handler(args, _container_with(use_case)) == 2
+        use_case.execute.assert_not_called()
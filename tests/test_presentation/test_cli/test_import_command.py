@@ -0,0 +1,147 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import gzip
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.interfaces.repositories import ArtifactBulkLoaderProtocol
+from src.application.use_cases.import_artifacts import ImportArtifactsUseCase
+from src.presentation.cli.import_artifacts import save_checkpoint, source_identity
+from src.presentation.cli.main import build_parser
+
+
+def _record(name: str) -> str:
+    return json.dumps(
+        {
+            "inventory_id": str(uuid4()),
+            "created_at": "2024-01-01T00:00:00Z",
+            "acquisition_date": "2023-01-01T00:00:00Z",
+            "name": name,
+            "department": "Archaeology",
+            "era": {"value": "antiquity"},
+            "material": {"value": "ceramic"},
+        }
+    )
+
+
+@pytest.fixture
+def loaded_names() -> list[str]:
+    return []
+
+
+@pytest.fixture
+def container(loaded_names: list[str]) -> MagicMock:
+    async def load(artifacts) -> int:
+        loaded_names.extend(artifact.name for artifact in artifacts)
+        return len(artifacts)
+
+    loader = AsyncMock(spec=ArtifactBulkLoaderProtocol)
+    loader.load.side_effect = load
+    request_container = MagicMock()
+    request_container.get = AsyncMock(
+        return_value=ImportArtifactsUseCase(loader=loader)
+    )
+
+    @asynccontextmanager
+    async def enter_request_scope() -> AsyncIterator[MagicMock]:
+        yield request_container
+
+    container = MagicMock()
+    container.side_effect = enter_request_scope
+    return container
+
+
+class TestImportCommand:
+    @pytest.mark.asyncio
+    async def test_import_loads_valid_records_and_writes_rejects(
+        self, tmp_path: Path, container: MagicMock, loaded_names: list[str]
+    ):
+        """Test a gzipped NDJSON import with one malformed record"""
+        source = tmp_path / "inventory.ndjson.gz"
+        lines = [_record("Amphora"), '{"name": "x"}', _record("Krater")]
+        source.write_bytes(gzip.compress("\n".join(lines).encode()))
+        args = build_parser().parse_args(
+            ["import", str(source), "--workers", "0", "--batch-size", "2"]
+        )
+
+        assert await args.handler(args, container) == 0
+
+        assert loaded_names == ["Amphora", "Krater"]
+        rejects = tmp_path / "inventory.ndjson.gz.rejects.ndjson"
+        [reject] = [json.loads(line) for line in rejects.read_text().splitlines()]
+        assert reject["record"] == 2
+        assert reject["raw"] == '{"name": "x"}'
+        assert not (tmp_path / "inventory.ndjson.gz.import-state.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_records_already_loaded(
+        self, tmp_path: Path, container: MagicMock, loaded_names: list[str]
+    ):
+        """Test that --resume continues after the last committed batch"""
+        source = tmp_path / "inventory.ndjson"
+        source.write_text(
+            "\n".join(_record(name) for name in ("A1", "B2", "C3", "D4")) + "\n"
+        )
+        checkpoint = tmp_path / "inventory.ndjson.import-state.json"
+        save_checkpoint(checkpoint, source_identity(source), records_done=3)
+        args = build_parser().parse_args(
+            ["import", str(source), "--workers", "0", "--resume"]
+        )
+
+        assert await args.handler(args, container) == 0
+
+        assert loaded_names == ["D4"]
+
+    @pytest.mark.asyncio
+    async def test_resume_does_not_duplicate_rejects(
+        self, tmp_path: Path, container: MagicMock, loaded_names: list[str]
+    ):
+        """Test rejects written after the last checkpoint are not written twice"""
+        source = tmp_path / "inventory.ndjson"
+        source.write_text(
+            "\n".join([_record("A1"), '{"name": "x"}', '{"name": "y"}', _record("D4")])
+            + "\n"
+        )
+        rejects = tmp_path / "inventory.ndjson.rejects.ndjson"
+        checkpointed = json.dumps({"record": 2, "error": "...", "raw": '{"name": "x"}'})
+        # Crashed after writing the second batch's reject, before its checkpoint
+        rejects.write_text(
+            checkpointed + "\n" + json.dumps({"record": 3, "raw": "..."}) + "\n"
+        )
+        save_checkpoint(
+            tmp_path / "inventory.ndjson.import-state.json",
+            source_identity(source),
+            records_done=2,
+            rejects_offset=len(checkpointed) + 1,
+        )
+        args = build_parser().parse_args(
+            ["import", str(source), "--workers", "0", "--resume", "--batch-size", "2"]
+        )
+
+        assert await args.handler(args, container) == 0
+
+        assert loaded_names == ["D4"]
+        lines = [json.loads(line) for line in rejects.read_text().splitlines()]
+        assert [line["record"] for line in lines] == [2, 3]
+        assert lines[1]["raw"] == '{"name": "y"}'
+
+    @pytest.mark.asyncio
+    async def test_resume_refuses_a_modified_file(
+        self, tmp_path: Path, container: MagicMock, loaded_names: list[str]
+    ):
+        """Test that a checkpoint from another version of the file is rejected"""
+        source = tmp_path / "inventory.ndjson"
+        source.write_text(_record("A1") + "\n")
+        checkpoint = tmp_path / "inventory.ndjson.import-state.json"
+        save_checkpoint(checkpoint, source_identity(source), records_done=1)
+        source.write_text(_record("A1") + "\n" + _record("B2") + "\n")
+        args = build_parser().parse_args(
+            ["import", str(source), "--workers", "0", "--resume"]
+        )
+
+        assert await args.handler(args, container) == 2
+        assert loaded_names == []
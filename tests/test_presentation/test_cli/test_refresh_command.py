@@ -0,0 +1,73 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.dtos.artifact import ArtifactRefreshPageDTO
+from src.application.exceptions import UpstreamUnavailableError
+from src.application.use_cases.refresh_artifacts import RefreshArtifactsUseCase
+from src.presentation.cli.main import build_parser
+
+
+def _container_with(use_case: MagicMock) -> MagicMock:
+    request_container = MagicMock()
+    request_container.get = AsyncMock(return_value=use_case)
+
+    @asynccontextmanager
+    async def enter_request_scope() -> AsyncIterator[MagicMock]:
+        yield request_container
+
+    container = MagicMock()
+    container.side_effect = enter_request_scope
+    return container
+
+
+def _page(next_cursor: str, *, has_more: bool) -> ArtifactRefreshPageDTO:
+    return ArtifactRefreshPageDTO(
+        checked=1, updated=1, failed=0, next_cursor=next_cursor, has_more=has_more
+    )
+
+
+class TestRefreshCommand:
+    @pytest.mark.asyncio
+    async def test_refresh_resumes_and_clears_cursor_when_done(self, tmp_path: Path):
+        """Test that a pass resumes from the cursor file and removes it at the end"""
+        cursor_file = tmp_path / "refresh-cursor"
+        cursor_file.write_text("saved-cursor\n")
+        use_case = MagicMock(spec=RefreshArtifactsUseCase)
+        use_case.execute = AsyncMock(
+            side_effect=[
+                _page("cursor-1", has_more=True),
+                _page("cursor-2", has_more=False),
+            ]
+        )
+        args = build_parser().parse_args(
+            ["refresh", "--cursor-file", str(cursor_file), "--batch-size", "1"]
+        )
+
+        assert await args.handler(args, _container_with(use_case)) == 0
+
+        assert [c.kwargs["cursor"] for c in use_case.execute.call_args_list] == [
+            "saved-cursor",
+            "cursor-1",
+        ]
+        assert not cursor_file.exists()
+
+    @pytest.mark.asyncio
+    async def test_refresh_stops_when_museum_api_is_unavailable(self, tmp_path: Path):
+        """Test that the pass stops with the cursor of the last finished batch"""
+        cursor_file = tmp_path / "refresh-cursor"
+        use_case = MagicMock(spec=RefreshArtifactsUseCase)
+        use_case.execute = AsyncMock(
+            side_effect=[
+                _page("cursor-1", has_more=True),
+                UpstreamUnavailableError("open circuit"),
+            ]
+        )
+        args = build_parser().parse_args(["refresh", "--cursor-file", str(cursor_file)])
+
+        assert await args.handler(args, _container_with(use_case)) == 1
+
+        assert cursor_file.read_text() == "cursor-1"